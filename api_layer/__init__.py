@@ -0,0 +1,3 @@
+from .handlers import ApiRequestHandler, ApiServer
+
+__all__ = ["ApiServer", "ApiRequestHandler"]
@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from psycopg2 import IntegrityError
+
+from business_logic import ContractsLogic, ProjectLogic
+from data_access.cache import get_cache_stats
+from data_access.dto import ContractsFilterDTO, ProjectsFilterDTO
+from errors import (
+    ConcurrentUpdateError,
+    ContractAlreadyExistError,
+    IncorrectIdError,
+    IncorrectStatusError,
+    PoolTimeoutError,
+    ValidationError,
+)
+from validators import validate_entered_id, validate_ids_list
+
+from .serializers import to_json
+
+if TYPE_CHECKING:
+    from data_access.instrumentation import QueryStats
+    from data_access.interfaces import DBGatewayProtocol
+
+STREAM_CHUNK_SIZE = 500
+
+CONTRACT_FILTER_PARAMS = {"project_id", "signed", "signed_from", "signed_to", "created_from", "created_to", "order_by"}
+PROJECT_FILTER_PARAMS = {"has_contract", "created_from", "created_to", "order_by"}
+
+ERROR_STATUSES: dict[type[Exception], HTTPStatus] = {
+    ValidationError: HTTPStatus.BAD_REQUEST,
+    IncorrectIdError: HTTPStatus.NOT_FOUND,
+    IncorrectStatusError: HTTPStatus.CONFLICT,
+    ContractAlreadyExistError: HTTPStatus.CONFLICT,
+    ConcurrentUpdateError: HTTPStatus.CONFLICT,
+    IntegrityError: HTTPStatus.CONFLICT,
+    PoolTimeoutError: HTTPStatus.SERVICE_UNAVAILABLE,
+}
+
+
+class ApiServer(ThreadingHTTPServer):
+    """HTTP server handling every request in its own thread; all threads share the logic objects and the pool.
+    :param server_address: (host, port) pair to listen on
+    :type server_address: tuple[str, int]
+    :param db_gateway: gateway handing out pooled connections
+    :type db_gateway: DBGatewayProtocol
+    :param query_stats: statistics the gateway records executed statements into, exposed at /metrics
+    :type query_stats: Optional[QueryStats]
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        db_gateway: DBGatewayProtocol,
+        query_stats: Optional[QueryStats] = None,
+    ) -> None:
+        super().__init__(server_address, ApiRequestHandler)
+        self.db_gateway = db_gateway
+        self.query_stats = query_stats
+        self.contracts_logic = ContractsLogic(db_gateway=db_gateway)
+        self.projects_logic = ProjectLogic(db_gateway=db_gateway)
+
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    """Routes JSON requests to ContractsLogic and ProjectLogic."""
+
+    protocol_version = "HTTP/1.1"
+    server: ApiServer
+    query: dict[str, str]
+
+    def _routes(self) -> list[tuple[str, str, Callable[..., None]]]:
+        return [
+            ("GET", r"/contracts", self.list_contracts),
+            ("POST", r"/contracts", self.create_contract),
+            ("GET", r"/contracts/summary", self.contracts_summary),
+            ("GET", r"/contracts/search", self.search_contracts),
+            ("POST", r"/contracts/confirm", self.confirm_contracts),
+            ("POST", r"/contracts/complete", self.complete_contracts),
+            ("GET", r"/contracts/(\d+)", self.get_contract),
+            ("POST", r"/contracts/(\d+)/confirm", self.confirm_contract),
+            ("POST", r"/contracts/(\d+)/complete", self.complete_contract),
+            ("GET", r"/projects", self.list_projects),
+            ("POST", r"/projects", self.create_project),
+            ("GET", r"/projects/search", self.search_projects),
+            ("GET", r"/projects/(\d+)", self.get_project),
+            ("POST", r"/projects/(\d+)/contracts", self.assign_contract),
+            ("GET", r"/stats/cache", self.cache_stats),
+            ("GET", r"/metrics", self.metrics),
+        ]
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        path = url.path.rstrip("/") or "/"
+        allowed = False
+        for route_method, pattern, handler in self._routes():
+            match = re.fullmatch(pattern, path)
+            if not match:
+                continue
+            if route_method != method:
+                allowed = True
+                continue
+            try:
+                handler(*match.groups())
+            except tuple(ERROR_STATUSES) as err:
+                status = next(code for error, code in ERROR_STATUSES.items() if isinstance(err, error))
+                message = err.pgerror if isinstance(err, IntegrityError) and err.pgerror else str(err)
+                self.send_json({"error": message}, status=status)
+            except (KeyError, TypeError) as err:
+                self.send_json({"error": f"Invalid request body: {err}"}, status=HTTPStatus.BAD_REQUEST)
+            except Exception as err:
+                # Database outages, missing migrations and bugs: the client still gets a response.
+                self.log_error("%s %s failed: %r", method, self.path, err)
+                self.close_connection = True
+                self.send_json(
+                    {"error": HTTPStatus.INTERNAL_SERVER_ERROR.phrase},
+                    status=HTTPStatus.INTERNAL_SERVER_ERROR,
+                )
+            return
+        status = HTTPStatus.METHOD_NOT_ALLOWED if allowed else HTTPStatus.NOT_FOUND
+        self.send_json({"error": status.phrase}, status=status)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._dispatch("POST")
+
+    def read_json(self) -> dict[str, Any]:
+        length = self.headers.get("Content-Length") or "0"
+        if not length.isdecimal():
+            self.close_connection = True  # the body cannot be skipped without its length
+            raise ValidationError("[ERROR]: Content-Length must be a non-negative integer!")
+        raw_body = self.rfile.read(int(length))
+        try:
+            body: dict[str, Any] = json.loads(raw_body) if raw_body else {}
+        except ValueError as err:  # JSONDecodeError and UnicodeDecodeError of a body that is not UTF-8
+            raise ValidationError(f"[ERROR]: Request body must be JSON: {err}") from None
+        if not isinstance(body, dict):
+            raise TypeError("JSON object expected")
+        return body
+
+    def send_json(self, data: Any, status: HTTPStatus = HTTPStatus.OK, etag: bool = False) -> None:
+        """Sends JSON response; with etag=True answers 304 when client already has the same representation."""
+        body = to_json(data).encode()
+        if etag:
+            tag = f'"{hashlib.sha1(body).hexdigest()}"'
+            if tag in (self.headers.get("If-None-Match") or ""):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", tag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", tag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json_stream(self, rows: Iterable[Any]) -> None:
+        """Sends JSON array with chunked transfer encoding while rows are still being fetched.
+        Errors of the first chunk are answered as usual; once the headers are sent an error can only cut the
+        response off, so the connection is closed without the final chunk and the client sees an incomplete body."""
+        iterator = iter(rows)
+        first_chunk = list(islice(iterator, STREAM_CHUNK_SIZE))
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self._write_chunk("[" + ",".join(to_json(row) for row in first_chunk))
+        try:
+            while chunk := list(islice(iterator, STREAM_CHUNK_SIZE)):
+                self._write_chunk("," + ",".join(to_json(row) for row in chunk))
+        except Exception as err:
+            self.log_error("Streaming of %s stopped: %r", self.path, err)
+            self.close_connection = True
+            return
+        self._write_chunk("]")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, text: str) -> None:
+        data = text.encode()
+        self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+
+    def _query_int(self, name: str) -> Optional[int]:
+        value = self.query.get(name)
+        if value is None:
+            return None
+        validate_entered_id(entered_id=value)
+        return int(value)
+
+    def _query_bool(self, name: str) -> Optional[bool]:
+        value = self.query.get(name)
+        if value is None:
+            return None
+        if value not in ("true", "false"):
+            raise ValidationError(f"[ERROR]: Parameter '{name}' must be 'true' or 'false'!")
+        return value == "true"
+
+    def _query_datetime(self, name: str) -> Optional[datetime]:
+        value = self.query.get(name)
+        if value is None:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            raise ValidationError(f"[ERROR]: Parameter '{name}' must be ISO 8601 date!") from None
+
+    def _send_filtered(self, logic: Any, filters: Any) -> None:
+        if self._query_bool("count"):
+            self.send_json({"count": logic.count_records(filters=filters)})
+        else:
+            self.send_json(logic.filter_records(filters=filters))
+
+    def list_contracts(self) -> None:
+        try:
+            self._list_contracts()
+        except IncorrectStatusError as err:
+            # Only the status filter is looked up here: an unknown status is a bad parameter, not a conflict.
+            raise ValidationError(str(err)) from err
+
+    def _list_contracts(self) -> None:
+        if (CONTRACT_FILTER_PARAMS | {"count", "desc"}) & self.query.keys():
+            filters = ContractsFilterDTO(
+                status=self.query.get("status"),
+                project_id=self._query_int("project_id"),
+                is_signed=self._query_bool("signed"),
+                signed_from=self._query_datetime("signed_from"),
+                signed_to=self._query_datetime("signed_to"),
+                created_from=self._query_datetime("created_from"),
+                created_to=self._query_datetime("created_to"),
+                order_by=self.query.get("order_by", "id"),
+                descending=bool(self._query_bool("desc")),
+                limit=self._query_int("limit"),
+            )
+            self._send_filtered(self.server.contracts_logic, filters)
+        elif {"after_id", "before_id", "limit", "status"} & self.query.keys():
+            page = self.server.contracts_logic.get_page(
+                after_id=self._query_int("after_id"),
+                before_id=self._query_int("before_id"),
+                limit=self._query_int("limit") or 50,
+                status=self.query.get("status"),
+            )
+            self.send_json(page)
+        else:
+            self.send_json_stream(self.server.contracts_logic.iter_all_data())
+
+    def get_contract(self, contract_id: str) -> None:
+        self.send_json(self.server.contracts_logic.get_record_by_id(contract_id=contract_id), etag=True)
+
+    def create_contract(self) -> None:
+        name = str(self.read_json()["name"])
+        self.server.contracts_logic.create_record(contract_name=name)
+        self.send_json({"name": name}, status=HTTPStatus.CREATED)
+
+    def confirm_contract(self, contract_id: str) -> None:
+        self.server.contracts_logic.update_data(contract_id=contract_id, required_status="draft", new_status="active")
+        self.send_json(self.server.contracts_logic.get_record_by_id(contract_id=contract_id))
+
+    def complete_contract(self, contract_id: str) -> None:
+        self.server.contracts_logic.update_data(
+            contract_id=contract_id,
+            required_status="active",
+            new_status="completed",
+        )
+        try:
+            self.server.projects_logic.remove_active_contract_from_project(contract_id=contract_id)
+        except IncorrectIdError:
+            pass
+        self.send_json(self.server.contracts_logic.get_record_by_id(contract_id=contract_id))
+
+    def _read_ids(self) -> list[int]:
+        contract_ids = self.read_json()["ids"]
+        validate_ids_list(entered_ids=contract_ids)
+        return list(contract_ids)
+
+    def confirm_contracts(self) -> None:
+        self.send_json(self.server.contracts_logic.confirm_many(contract_ids=self._read_ids()))
+
+    def complete_contracts(self) -> None:
+        self.send_json(self.server.contracts_logic.complete_many(contract_ids=self._read_ids()))
+
+    def contracts_summary(self) -> None:
+        self.send_json(self.server.contracts_logic.get_summary(), etag=True)
+
+    def search_contracts(self) -> None:
+        found = self.server.contracts_logic.search(text=self.query.get("q", ""), limit=self._query_int("limit") or 20)
+        self.send_json(found)
+
+    def list_projects(self) -> None:
+        if (PROJECT_FILTER_PARAMS | {"count", "desc"}) & self.query.keys():
+            filters = ProjectsFilterDTO(
+                has_active_contract=self._query_bool("has_contract"),
+                created_from=self._query_datetime("created_from"),
+                created_to=self._query_datetime("created_to"),
+                order_by=self.query.get("order_by", "id"),
+                descending=bool(self._query_bool("desc")),
+                limit=self._query_int("limit"),
+            )
+            self._send_filtered(self.server.projects_logic, filters)
+        elif {"after_id", "before_id", "limit"} & self.query.keys():
+            page = self.server.projects_logic.get_page(
+                after_id=self._query_int("after_id"),
+                before_id=self._query_int("before_id"),
+                limit=self._query_int("limit") or 50,
+            )
+            self.send_json(page)
+        else:
+            self.send_json_stream(self.server.projects_logic.iter_all_data())
+
+    def get_project(self, project_id: str) -> None:
+        self.send_json(self.server.projects_logic.get_record_by_id(project_id=project_id), etag=True)
+
+    def search_projects(self) -> None:
+        found = self.server.projects_logic.search(text=self.query.get("q", ""), limit=self._query_int("limit") or 20)
+        self.send_json(found)
+
+    def create_project(self) -> None:
+        name = str(self.read_json()["name"])
+        self.server.projects_logic.create_record(entered_name=name)
+        self.send_json({"name": name}, status=HTTPStatus.CREATED)
+
+    def assign_contract(self, project_id: str) -> None:
+        contract_id = str(self.read_json()["contract_id"])
+        self.server.projects_logic.add_contract_to_project(project_id=project_id, contract_id=contract_id)
+        self.send_json(self.server.projects_logic.get_record_by_id(project_id=project_id))
+
+    def cache_stats(self) -> None:
+        self.send_json(get_cache_stats(self.server.db_gateway))
+
+    def metrics(self) -> None:
+        """Exports query statistics in Prometheus text format."""
+        if self.server.query_stats is None:
+            self.send_json({"error": "Query statistics are disabled."}, status=HTTPStatus.NOT_FOUND)
+            return
+        body = self.server.query_stats.to_prometheus().encode()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from datetime import date
+from typing import Any
+
+
+def _default(value: Any) -> str:
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def to_json(data: Any) -> str:
+    """Serializes DTO (or list of DTOs, or plain data) to JSON string."""
+
+    if isinstance(data, list):
+        return "[" + ",".join(to_json(item) for item in data) + "]"
+    if hasattr(data, "__dataclass_fields__"):
+        data = asdict(data)
+    return json.dumps(data, default=_default, ensure_ascii=False)
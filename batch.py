@@ -0,0 +1,350 @@
+"""Non-interactive batch commands for scripts and scheduled jobs.
+
+Usage:
+    python batch.py contracts list [--status STATUS] [--format {jsonl,csv}]
+    python batch.py contracts create --names-from FILE
+    python batch.py contracts confirm --ids-from FILE
+    python batch.py contracts complete --ids-from FILE
+    python batch.py projects list [--format {jsonl,csv}]
+    python batch.py projects create --names-from FILE
+    python batch.py projects assign --pairs-from FILE
+
+FILE has one value per line ("-" reads standard input); --pairs-from reads CSV rows "project_id,contract_id",
+a header row is skipped. Records are processed in batches of --batch-size by --workers threads sharing the
+connection pool. Each record is reported on standard output as a JSON line with "ok": true, or "ok": false and
+"error"; a summary goes to standard error and the exit code is 1 if any record failed.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import astuple, fields
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    TextIO,
+    TypeVar,
+    Union,
+)
+
+from psycopg2 import IntegrityError
+
+import settings
+from api_layer.serializers import to_json
+from business_logic import ContractsLogic, ProjectLogic
+from data_access.backends import create_db_gateway
+from data_access.dto import (
+    BatchResultDTO,
+    ContractsDTO,
+    ProjectsDTO,
+    TransitionResultDTO,
+)
+from errors import (
+    ConcurrentUpdateError,
+    ContractAlreadyExistError,
+    IncorrectIdError,
+    IncorrectStatusError,
+    PoolTimeoutError,
+    ValidationError,
+)
+from ui_layer.renderers import create_renderer
+from ui_layer.services import iter_pages
+from validators import validate_entered_id
+
+if TYPE_CHECKING:
+    from data_access.interfaces import DBGatewayProtocol
+
+T = TypeVar("T")
+Outcome = dict[str, Any]
+
+LIST_PAGE_SIZE = 2000
+
+RECORD_ERRORS = (
+    ValidationError,
+    IncorrectIdError,
+    IncorrectStatusError,
+    ContractAlreadyExistError,
+    ConcurrentUpdateError,
+    IntegrityError,
+    PoolTimeoutError,
+)
+
+
+def read_lines(path: str) -> Iterator[str]:
+    """Yields stripped non-empty lines of the file, or of standard input if path is '-'."""
+
+    file: TextIO = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        for line in file:
+            if line.strip():
+                yield line.strip()
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+
+def read_pairs(path: str) -> Iterator[tuple[str, str]]:
+    """Yields (project_id, contract_id) pairs of CSV file, skipping a header row."""
+
+    for line_number, row in enumerate(csv.reader(read_lines(path)), start=1):
+        if line_number == 1 and not row[0].strip().isdigit():
+            continue
+        yield row[0].strip(), row[1].strip() if len(row) > 1 else ""
+
+
+def _as_id(value: str) -> Union[int, str]:
+    return int(value) if value.isdecimal() else value
+
+
+def error_message(err: Exception) -> str:
+    message: str = err.pgerror if isinstance(err, IntegrityError) and err.pgerror else str(err)
+    return message.strip()
+
+
+def apply(outcome: Outcome, operation: Callable[[], Any]) -> Outcome:
+    """Runs operation for one record and completes its outcome with the result or the error."""
+
+    try:
+        operation()
+    except RECORD_ERRORS as err:
+        return {**outcome, "ok": False, "error": error_message(err)}
+    return {**outcome, "ok": True}
+
+
+def created_outcomes(names: list[str], result: BatchResultDTO) -> list[Outcome]:
+    """Reports every name of a created batch, with the error of names that could not be created."""
+
+    errors = dict(result.failed)
+    return [
+        {"name": name, "ok": False, "error": errors[index].strip()} if index in errors else {"name": name, "ok": True}
+        for index, name in enumerate(names)
+    ]
+
+
+def run_batches(
+    items: Iterable[T],
+    process_batch: Callable[[list[T]], list[Outcome]],
+    batch_size: int,
+    workers: int,
+) -> Iterator[Outcome]:
+    """Processes items in batches on `workers` threads and yields outcomes in input order.
+    No more than 2 * workers batches are read ahead, so input of any size is processed in bounded memory."""
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[list[Outcome]]] = deque()
+        for batch in iter_pages(items, page_size=batch_size):
+            pending.append(executor.submit(process_batch, batch))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def write_outcomes(outcomes: Iterable[Outcome]) -> int:
+    """Writes outcomes as JSON lines and the summary to standard error. Returns exit code."""
+
+    processed = failed = 0
+    for outcome in outcomes:
+        processed += 1
+        failed += not outcome["ok"]
+        sys.stdout.write(to_json(outcome) + "\n")
+    print(f"Processed records: {processed}. Failed records: {failed}.", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def write_records(records: Iterable[Union[ContractsDTO, ProjectsDTO]], dto_type: type, file_format: str) -> int:
+    """Writes records as JSON lines or CSV with a header row as they are fetched."""
+
+    renderer = create_renderer(file_format, columns=[field.name for field in fields(dto_type)])
+    renderer.render(astuple(record) for record in records)
+    return 0
+
+
+def iter_contracts(logic: ContractsLogic, status: Optional[str]) -> Iterator[ContractsDTO]:
+    """Yields all contracts, or contracts with entered status, reading them page by page."""
+
+    if status is None:
+        yield from logic.iter_all_data(itersize=LIST_PAGE_SIZE)
+        return
+    after_id = None
+    while page := logic.get_page(after_id=after_id, limit=LIST_PAGE_SIZE, status=status):
+        yield from page
+        after_id = page[-1].id
+
+
+def list_contracts(db_gateway: DBGatewayProtocol, args: argparse.Namespace) -> int:
+    logic = ContractsLogic(db_gateway=db_gateway)
+    return write_records(iter_contracts(logic, status=args.status), dto_type=ContractsDTO, file_format=args.format)
+
+
+def create_contracts(db_gateway: DBGatewayProtocol, args: argparse.Namespace) -> int:
+    logic = ContractsLogic(db_gateway=db_gateway)
+
+    def process_batch(names: list[str]) -> list[Outcome]:
+        return created_outcomes(names, logic.create_records(contract_names=names, page_size=args.batch_size))
+
+    return write_outcomes(run_batches(read_lines(args.names_from), process_batch, args.batch_size, args.workers))
+
+
+def transition_outcomes(
+    contract_ids: list[str],
+    transition: Callable[[list[int]], list[TransitionResultDTO]],
+    required_status: str,
+) -> list[Outcome]:
+    """Runs bulk transition for the valid ids of a batch and reports every entered id."""
+
+    invalid_ids: dict[str, str] = {}
+    for contract_id in contract_ids:
+        try:
+            validate_entered_id(entered_id=contract_id)
+        except ValidationError as err:
+            invalid_ids[contract_id] = str(err)
+    try:
+        results = {
+            result.contract_id: result for result in transition([int(i) for i in contract_ids if i not in invalid_ids])
+        }
+    except RECORD_ERRORS as err:
+        return [{"id": _as_id(contract_id), "ok": False, "error": error_message(err)} for contract_id in contract_ids]
+    errors = {
+        "not_found": "[ERROR]: There isn't a contract with entered ID in the database.",
+        "wrong_status": f"[ERROR]: You must specify a contract with a status '{required_status}'.",
+    }
+    outcomes: list[Outcome] = []
+    for contract_id in contract_ids:
+        if contract_id in invalid_ids:
+            outcomes.append({"id": _as_id(contract_id), "ok": False, "error": invalid_ids[contract_id]})
+            continue
+        result = results[int(contract_id)]
+        if result.outcome != "updated":
+            outcomes.append({"id": result.contract_id, "ok": False, "error": errors[result.outcome]})
+        elif result.detached_project_id is not None:
+            outcomes.append({"id": result.contract_id, "ok": True, "detached_project_id": result.detached_project_id})
+        else:
+            outcomes.append({"id": result.contract_id, "ok": True})
+    return outcomes
+
+
+def confirm_contracts(db_gateway: DBGatewayProtocol, args: argparse.Namespace) -> int:
+    logic = ContractsLogic(db_gateway=db_gateway)
+
+    def process_batch(contract_ids: list[str]) -> list[Outcome]:
+        return transition_outcomes(contract_ids, logic.confirm_many, required_status="draft")
+
+    return write_outcomes(run_batches(read_lines(args.ids_from), process_batch, args.batch_size, args.workers))
+
+
+def complete_contracts(db_gateway: DBGatewayProtocol, args: argparse.Namespace) -> int:
+    logic = ContractsLogic(db_gateway=db_gateway)
+
+    def process_batch(contract_ids: list[str]) -> list[Outcome]:
+        return transition_outcomes(contract_ids, logic.complete_many, required_status="active")
+
+    return write_outcomes(run_batches(read_lines(args.ids_from), process_batch, args.batch_size, args.workers))
+
+
+def list_projects(db_gateway: DBGatewayProtocol, args: argparse.Namespace) -> int:
+    logic = ProjectLogic(db_gateway=db_gateway)
+    return write_records(logic.iter_all_data(itersize=LIST_PAGE_SIZE), dto_type=ProjectsDTO, file_format=args.format)
+
+
+def create_projects(db_gateway: DBGatewayProtocol, args: argparse.Namespace) -> int:
+    logic = ProjectLogic(db_gateway=db_gateway)
+
+    def process_batch(names: list[str]) -> list[Outcome]:
+        return created_outcomes(names, logic.create_records(project_names=names, page_size=args.batch_size))
+
+    return write_outcomes(run_batches(read_lines(args.names_from), process_batch, args.batch_size, args.workers))
+
+
+def assign_contracts(db_gateway: DBGatewayProtocol, args: argparse.Namespace) -> int:
+    logic = ProjectLogic(db_gateway=db_gateway)
+
+    def process_batch(pairs: list[tuple[str, str]]) -> list[Outcome]:
+        return [
+            apply(
+                {"project_id": _as_id(project_id), "contract_id": _as_id(contract_id)},
+                partial(logic.add_contract_to_project, project_id=project_id, contract_id=contract_id),
+            )
+            for project_id, contract_id in pairs
+        ]
+
+    return write_outcomes(run_batches(read_pairs(args.pairs_from), process_batch, args.batch_size, args.workers))
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Batch operations on contracts and projects.")
+    parser.add_argument("--batch-size", type=_positive_int, default=100, help="records per batch (100 by default)")
+    parser.add_argument("--workers", type=_positive_int, default=4, help="parallel workers (4 by default)")
+    entities = parser.add_subparsers(dest="entity", required=True)
+
+    contracts = entities.add_parser("contracts", help="contract operations").add_subparsers(
+        dest="command", required=True
+    )
+    contracts_list = contracts.add_parser("list", help="write all contracts")
+    contracts_list.add_argument("--status", choices=["draft", "active", "completed"], help="only with this status")
+    contracts_list.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    contracts_list.set_defaults(handler=list_contracts)
+    contracts_create = contracts.add_parser("create", help="create draft contracts")
+    contracts_create.add_argument("--names-from", required=True, metavar="FILE", help="file with one name per line")
+    contracts_create.set_defaults(handler=create_contracts)
+    for command, handler, help_text in (
+        ("confirm", confirm_contracts, "confirm draft contracts"),
+        ("complete", complete_contracts, "complete active contracts, detaching them from projects"),
+    ):
+        command_parser = contracts.add_parser(command, help=help_text)
+        command_parser.add_argument("--ids-from", required=True, metavar="FILE", help="file with one id per line")
+        command_parser.set_defaults(handler=handler)
+
+    projects = entities.add_parser("projects", help="project operations").add_subparsers(dest="command", required=True)
+    projects_list = projects.add_parser("list", help="write all projects")
+    projects_list.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    projects_list.set_defaults(handler=list_projects)
+    projects_create = projects.add_parser("create", help="create projects")
+    projects_create.add_argument("--names-from", required=True, metavar="FILE", help="file with one name per line")
+    projects_create.set_defaults(handler=create_projects)
+    projects_assign = projects.add_parser("assign", help="add active contracts to projects")
+    projects_assign.add_argument(
+        "--pairs-from", required=True, metavar="FILE", help="CSV file with project_id,contract_id rows"
+    )
+    projects_assign.set_defaults(handler=assign_contracts)
+    return parser
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    db_gateway = create_db_gateway(
+        backend=settings.DB_BACKEND,
+        db_name=settings.POSTGRES_DB,
+        db_user=settings.POSTGRES_USER,
+        db_password=settings.POSTGRES_PASSWORD,
+        db_host=settings.POSTGRES_HOST,
+        db_port=settings.POSTGRES_PORT,
+        min_size=min(settings.POSTGRES_POOL_MIN_SIZE, args.workers),
+        max_size=args.workers,
+        prepare_statements=settings.POSTGRES_PREPARE_STATEMENTS,
+        lazy_connect=True,
+    )
+    try:
+        exit_code: int = args.handler(db_gateway, args)
+    finally:
+        db_gateway.close()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
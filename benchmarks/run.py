@@ -0,0 +1,217 @@
+"""Benchmarks of DAO and business-logic hot paths.
+
+Usage: python -m benchmarks.run [--contracts 10000] [--operations 1000] [--output results.json]
+                                [--compare previous.json] [--no-cache] [--no-prepare]
+                                [--backend {postgresql,memory}]
+
+Seeds the database configured in .env (or the in-memory backend) with uniquely named contracts and projects,
+measures throughput and p50/p99 latency of every scenario, removes the seeded rows and writes machine-readable
+JSON results.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Union
+
+import settings
+from business_logic import ContractsLogic, ProjectLogic
+from data_access.backends import BACKENDS, create_db_gateway
+from data_access.cache import LRUCache, configure_cache
+from data_access.dao import create_contracts_dao, create_projects_dao
+from data_access.dto import ContractsDTO, ProjectsDTO
+
+if TYPE_CHECKING:
+    from data_access.interfaces import DBGatewayProtocol
+
+SEED_PAGE_SIZE = 1000
+
+
+def measure(name: str, operation: Callable[..., Any], arguments: Iterable[tuple], items_per_call: int = 1) -> dict:
+    """Calls operation with every tuple of arguments and returns latency percentiles and throughput."""
+
+    latencies: list[float] = []
+    started = time.perf_counter()
+    for args in arguments:
+        call_started = time.perf_counter()
+        operation(*args)
+        latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    calls = len(latencies)
+    result = {
+        "calls": calls,
+        "total_seconds": round(elapsed, 6),
+        "throughput_per_second": round(calls * items_per_call / elapsed, 2) if elapsed else None,
+        "p50_ms": round(latencies[int(calls * 0.50)] * 1000, 3) if calls else None,
+        "p99_ms": round(latencies[min(int(calls * 0.99), calls - 1)] * 1000, 3) if calls else None,
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3) if calls else None,
+    }
+    print(
+        f"{name:40} {result['throughput_per_second']:>12} items/s  "
+        f"p50 {result['p50_ms']} ms  p99 {result['p99_ms']} ms"
+    )
+    return result
+
+
+def get_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Benchmark:
+    """Seeds benchmark data through the given gateway and runs the scenarios.
+    :param db_gateway: gateway to the database under test
+    :type db_gateway: DBGatewayProtocol
+    :param contracts: number of contracts to seed
+    :type contracts: int
+    :param operations: number of calls of every single-record scenario
+    :type operations: int
+    """
+
+    def __init__(self, db_gateway: DBGatewayProtocol, contracts: int, operations: int) -> None:
+        self._db_gateway = db_gateway
+        self._contracts = contracts
+        self._operations = min(operations, contracts)
+        self._prefix = f"bench-{uuid.uuid4().hex[:8]}"
+        self._contracts_dao = create_contracts_dao(db_gateway=db_gateway)
+        self._projects_dao = create_projects_dao(db_gateway=db_gateway)
+        self._contracts_logic = ContractsLogic(db_gateway=db_gateway)
+        self._projects_logic = ProjectLogic(db_gateway=db_gateway)
+
+    def seed(self) -> None:
+        self._contracts_dao.create_records(
+            [ContractsDTO(name=f"{self._prefix}-contract-{number}") for number in range(self._contracts)],
+            page_size=SEED_PAGE_SIZE,
+        )
+        self._projects_dao.create_records(
+            [ProjectsDTO(name=f"{self._prefix}-project-{number}") for number in range(self._operations)],
+            page_size=SEED_PAGE_SIZE,
+        )
+
+    def _seeded_ids(self, records: Iterable[Union[ContractsDTO, ProjectsDTO]], kind: str) -> list[int]:
+        prefix = f"{self._prefix}-{kind}-"
+        return [record.id for record in records if record.id is not None and record.name.startswith(prefix)]
+
+    def cleanup(self) -> None:
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute("DELETE FROM projects WHERE name LIKE %s;", (f"{self._prefix}-%",))
+            cursor.execute("DELETE FROM contracts WHERE name LIKE %s;", (f"{self._prefix}-%",))
+
+    def run(self) -> dict[str, dict]:
+        contract_ids = self._seeded_ids(self._contracts_dao.iter_all_contracts_info(), "contract")[: self._operations]
+        project_ids = self._seeded_ids(self._projects_dao.iter_all_projects_info(), "project")
+        results = {
+            "get_all_contracts_info": measure(
+                "get_all_contracts_info",
+                self._contracts_dao.get_all_contracts_info,
+                [()] * 3,
+                items_per_call=self._contracts,
+            ),
+            "create_record": measure(
+                "create_record",
+                self._contracts_dao.create_record,
+                [(ContractsDTO(name=f"{self._prefix}-new-{number}"),) for number in range(self._operations)],
+            ),
+            "update_data": measure(
+                "update_data (confirm)",
+                self._contracts_logic.update_data,
+                [(str(contract_id), "draft", "active") for contract_id in contract_ids],
+            ),
+            "add_contract_to_project": measure(
+                "add_contract_to_project",
+                self._projects_logic.add_contract_to_project,
+                [(str(project_id), str(contract_id)) for project_id, contract_id in zip(project_ids, contract_ids)],
+            ),
+            "remove_active_contract_from_project": measure(
+                "remove_active_contract_from_project",
+                self._projects_logic.remove_active_contract_from_project,
+                [(str(contract_id),) for contract_id in contract_ids[: len(project_ids)]],
+            ),
+        }
+        return results
+
+
+def compare(results: dict[str, dict], previous_path: str) -> None:
+    """Prints throughput and p99 changes against previously saved results."""
+
+    with open(previous_path, encoding="utf-8") as file:
+        previous = json.load(file)["results"]
+    for name, result in results.items():
+        before = previous.get(name)
+        if not before or not before.get("throughput_per_second") or not result["throughput_per_second"]:
+            continue
+        throughput_change = (result["throughput_per_second"] / before["throughput_per_second"] - 1) * 100
+        print(f"{name:40} throughput {throughput_change:+.1f}%  p99 {before['p99_ms']} -> {result['p99_ms']} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks of DAO and business-logic hot paths.")
+    parser.add_argument("--contracts", type=int, default=10000, help="number of seeded contracts")
+    parser.add_argument("--operations", type=int, default=1000, help="calls of every single-record scenario")
+    parser.add_argument("--output", help="path of JSON file with results")
+    parser.add_argument("--compare", help="path of JSON file with previous results")
+    parser.add_argument("--no-cache", action="store_true", help="disable read-through entity cache")
+    parser.add_argument("--no-prepare", action="store_true", help="send full statement text instead of prepared ones")
+    parser.add_argument("--backend", choices=BACKENDS, help="database backend under test (DB_BACKEND by default)")
+    args = parser.parse_args()
+    args.backend = args.backend or settings.DB_BACKEND
+
+    if args.no_cache:
+        configure_cache(lambda: LRUCache(max_size=0))
+    # Connection settings are read only for PostgreSQL, the memory backend runs without .env.
+    db_options: dict[str, Any] = {}
+    if args.backend == "postgresql":
+        db_options = {
+            "db_name": settings.POSTGRES_DB,
+            "db_user": settings.POSTGRES_USER,
+            "db_password": settings.POSTGRES_PASSWORD,
+            "db_host": settings.POSTGRES_HOST,
+            "db_port": settings.POSTGRES_PORT,
+            "max_size": 1,
+            "prepare_statements": not args.no_prepare,
+        }
+    db_gateway = create_db_gateway(backend=args.backend, **db_options)
+    benchmark = Benchmark(db_gateway=db_gateway, contracts=args.contracts, operations=args.operations)
+    try:
+        benchmark.seed()
+        results = benchmark.run()
+    finally:
+        if args.backend == "postgresql":
+            benchmark.cleanup()
+        db_gateway.close()
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(tz=timezone.utc).isoformat(),
+            "revision": get_revision(),
+            "python": platform.python_version(),
+            "backend": args.backend,
+            "contracts": args.contracts,
+            "operations": args.operations,
+            "cache": not args.no_cache,
+            "prepared_statements": not args.no_prepare,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
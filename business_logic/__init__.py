@@ -1,4 +1,6 @@
+from .async_contracts import AsyncContractsLogic
+from .async_projects import AsyncProjectLogic
 from .contracts import ContractsLogic
 from .projects import ProjectLogic
 
-__all__ = ["ProjectLogic", "ContractsLogic"]
+__all__ = ["ProjectLogic", "ContractsLogic", "AsyncProjectLogic", "AsyncContractsLogic"]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional
+
+from data_access.dao import AsyncContractsDAO
+from data_access.dto import ContractsDTO
+from errors import IncorrectIdError, IncorrectStatusError
+from validators import validate_entered_id
+
+if TYPE_CHECKING:
+    from data_access.interfaces import AsyncDBGatewayProtocol
+
+
+class AsyncContractsLogic:
+    """Asynchronous counterpart of ContractsLogic."""
+
+    def __init__(self, db_gateway: AsyncDBGatewayProtocol) -> None:
+        self._db_gateway = db_gateway
+        self._dao = AsyncContractsDAO(db_gateway=self._db_gateway)
+
+    async def get_all_data(self) -> list[ContractsDTO]:
+        """Gets all contract information from the database."""
+
+        return await self._dao.get_all_contracts_info()
+
+    async def get_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        status: Optional[str] = None,
+        before_id: Optional[int] = None,
+    ) -> list[ContractsDTO]:
+        """Gets page of contracts following after_id (or preceding before_id), optionally filtered by status."""
+
+        return await self._dao.get_contracts_page(after_id=after_id, limit=limit, status=status, before_id=before_id)
+
+    async def create_record(self, contract_name: str) -> None:
+        """Creates new record in database with entered data."""
+
+        await self._dao.create_record(data=ContractsDTO(name=contract_name))
+
+    async def update_data(self, contract_id: str, required_status: str, new_status: str) -> None:
+        """Updates contract data."""
+
+        validate_entered_id(entered_id=contract_id)
+        contract_info = await self._dao.get_contract_info_by_id(int(contract_id))
+        if not contract_info:
+            raise IncorrectIdError("[ERROR]: There isn't a contract with entered ID in the database.")
+        if contract_info.status != required_status:
+            raise IncorrectStatusError(f"[ERROR]: You must specify a contract with a status '{required_status}'.")
+        contract_info.status = new_status
+        if not contract_info.signing_date:
+            contract_info.signing_date = datetime.now(tz=timezone.utc)
+        await self._dao.update_record(data=contract_info)
+
+    async def is_active(self, contract_id: int) -> bool:
+        """Checks whether contract with entered id has 'active' status."""
+
+        return await self._dao.is_active(contract_id=contract_id)
+
+    async def get_record_by_id(self, contract_id: str) -> ContractsDTO:
+        """Gets contract by entered id from database."""
+
+        validate_entered_id(entered_id=contract_id)
+        contract_info = await self._dao.get_contract_info_by_id(int(contract_id))
+        if not contract_info:
+            raise IncorrectIdError("[ERROR]: There isn't a contract with entered ID in the database.")
+        return contract_info
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from data_access.dao import AsyncContractsDAO, AsyncProjectsDAO
+from data_access.dto import ProjectsDTO
+from errors import ContractAlreadyExistError, IncorrectIdError, ValidationError
+from validators import validate_entered_id
+
+if TYPE_CHECKING:
+    from data_access.interfaces import AsyncDBGatewayProtocol
+
+
+class AsyncProjectLogic:
+    """Asynchronous counterpart of ProjectLogic."""
+
+    def __init__(self, db_gateway: AsyncDBGatewayProtocol) -> None:
+        self._db_gateway = db_gateway
+        self._dao = AsyncProjectsDAO(db_gateway=self._db_gateway)
+        self._contracts_dao = AsyncContractsDAO(db_gateway=self._db_gateway)
+
+    async def get_all_data(self) -> list[ProjectsDTO]:
+        """Gets all projects information from the database."""
+
+        return await self._dao.get_all_projects_info()
+
+    async def get_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        before_id: Optional[int] = None,
+    ) -> list[ProjectsDTO]:
+        """Gets page of projects following after_id (or preceding before_id)."""
+
+        return await self._dao.get_projects_page(after_id=after_id, limit=limit, before_id=before_id)
+
+    async def get_active_contracts_ids(self) -> list[tuple[int]]:
+        """Gets list ids of active contracts"""
+
+        return await self._contracts_dao.get_active_contracts_ids()
+
+    async def create_record(self, entered_name: str) -> None:
+        """Creates new record in database with entered data."""
+
+        await self._dao.create_record(data=ProjectsDTO(name=entered_name))
+
+    async def get_record_by_id(self, project_id: str) -> ProjectsDTO:
+        """Gets project by entered id from database."""
+
+        validate_entered_id(entered_id=project_id)
+        project_info = await self._dao.get_info_by_id(int(project_id))
+        if not project_info:
+            raise IncorrectIdError("[ERROR]: There isn't a contract with entered ID in the database.")
+        return project_info
+
+    async def add_contract_to_project(self, project_id: str, contract_id: str) -> None:
+        """Adds contract to project. The contract status is checked by primary key before any row is locked,
+        then both records are checked again and linked in one atomic statement."""
+
+        validate_entered_id(entered_id=contract_id)
+        if not await self._contracts_dao.is_active(int(contract_id)):
+            raise ValidationError("[ERROR]: Selected contract must be active.")
+        validate_entered_id(entered_id=project_id)
+        contract_is_active, project_exists, project_is_free, _ = await self._dao.add_active_contract(
+            project_id=int(project_id),
+            contract_id=int(contract_id),
+        )
+        if not contract_is_active:
+            raise ValidationError("[ERROR]: Selected contract must be active.")
+        if not project_exists:
+            raise IncorrectIdError("[ERROR]: There isn't a contract with entered ID in the database.")
+        if not project_is_free:
+            raise ContractAlreadyExistError(
+                f"Project {project_id} already has an active contract! Please select another contract to add."
+            )
+
+    async def remove_active_contract_from_project(self, contract_id: str) -> None:
+        """Removes active contract_id."""
+
+        validate_entered_id(entered_id=contract_id)
+        data = await self._dao.get_project_info_by_active_contract(contract_id=int(contract_id))
+        if not data:
+            raise IncorrectIdError(f"Project with entered active_contract_id {contract_id} does not exist.")
+        data.contract_id = None
+        await self._dao.update_record(data=data)
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
 from psycopg2 import IntegrityError
 
-from data_access.dao import ContractsDAO
-from data_access.dto import ContractsDTO
+from data_access.dao import create_contracts_dao
+from data_access.dto import (
+    BatchResultDTO,
+    ContractsDTO,
+    ContractsFilterDTO,
+    ContractSummaryDTO,
+    ImportResultDTO,
+    TransitionResultDTO,
+)
 from errors import IncorrectIdError, IncorrectStatusError, ValidationError
-from validators import validate_entered_id
+from validators import validate_entered_id, validate_search_text
 
 if TYPE_CHECKING:
     from data_access.interfaces import DBGatewayProtocol
@@ -19,7 +26,7 @@ class ContractsLogic:
 
     def __init__(self, db_gateway: DBGatewayProtocol) -> None:
         self._db_gateway = db_gateway
-        self._dao = ContractsDAO(db_gateway=self._db_gateway)
+        self._dao = create_contracts_dao(db_gateway=self._db_gateway)
 
     def get_all_data(self) -> list[ContractsDTO]:
         """Gets all contract information from the database."""
@@ -27,6 +34,43 @@ class ContractsLogic:
         data: list[ContractsDTO] = self._dao.get_all_contracts_info()
         return data
 
+    def iter_all_data(self, itersize: int = 2000) -> Iterator[ContractsDTO]:
+        """Yields all contract information from the database, fetching `itersize` rows at a time."""
+
+        return self._dao.iter_all_contracts_info(itersize=itersize)
+
+    def get_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        status: Optional[str] = None,
+        before_id: Optional[int] = None,
+    ) -> list[ContractsDTO]:
+        """Gets page of contracts following after_id (or preceding before_id), optionally filtered by status."""
+
+        return self._dao.get_contracts_page(after_id=after_id, limit=limit, status=status, before_id=before_id)
+
+    def filter_records(self, filters: ContractsFilterDTO) -> list[ContractsDTO]:
+        """Gets contracts matching entered criteria; filtering, sorting and limiting are done by the database."""
+
+        return self._dao.filter_records(filters=filters)
+
+    def count_records(self, filters: ContractsFilterDTO) -> int:
+        """Counts contracts matching entered criteria without fetching them."""
+
+        return self._dao.count_records(filters=filters)
+
+    def any_records(self, filters: ContractsFilterDTO) -> bool:
+        """Checks whether any contract matches entered criteria without fetching them."""
+
+        return self._dao.any_records(filters=filters)
+
+    def search(self, text: str, limit: int = 20) -> list[ContractsDTO]:
+        """Gets contracts whose name matches entered text, best matches first."""
+
+        validate_search_text(entered_text=text)
+        return self._dao.search_by_name(text=text.strip(), limit=limit)
+
     def create_record(self, contract_name: str) -> None:
         """Creates new record in database with entered data."""
 
@@ -36,8 +80,20 @@ class ContractsLogic:
         except IntegrityError as err:
             raise err
 
+    def create_records(self, contract_names: list[str], page_size: int = 100) -> BatchResultDTO:
+        """Creates new draft contracts in one transaction, reporting names that could not be created."""
+
+        records = [ContractsDTO(name=name) for name in contract_names]
+        return self._dao.create_records(records=records, page_size=page_size)
+
+    def import_records(self, records: Iterable[ContractsDTO]) -> ImportResultDTO:
+        """Imports contracts in bulk, reporting rejected rows instead of aborting the whole batch."""
+
+        return self._dao.import_records(records=records)
+
     def update_data(self, contract_id: str, required_status: str, new_status: str) -> None:
-        """Updates contract data."""
+        """Updates contract data. The update is applied only if the contract has not been changed since its status
+        was checked, otherwise ConcurrentUpdateError is raised."""
 
         try:
             validate_entered_id(entered_id=contract_id)
@@ -59,6 +115,39 @@ class ContractsLogic:
             except IntegrityError:
                 raise
 
+    def confirm_many(self, contract_ids: Iterable[int]) -> list[TransitionResultDTO]:
+        """Confirms draft contracts in bulk with set-based statements in one transaction.
+        Returns the outcome of every distinct entered id: 'updated', 'not_found' or 'wrong_status'."""
+
+        return self._dao.transition_records(
+            contract_ids=contract_ids,
+            required_status="draft",
+            new_status="active",
+            signing_date=datetime.now(tz=timezone.utc),
+        )
+
+    def complete_many(self, contract_ids: Iterable[int]) -> list[TransitionResultDTO]:
+        """Completes active contracts in bulk and removes them from their projects in the same transaction.
+        Returns the outcome of every distinct entered id, with the id of the project a contract was removed from."""
+
+        return self._dao.transition_records(
+            contract_ids=contract_ids,
+            required_status="active",
+            new_status="completed",
+            signing_date=datetime.now(tz=timezone.utc),
+            detach_projects=True,
+        )
+
+    def exists(self, contract_id: int) -> bool:
+        """Checks whether contract with entered id exists."""
+
+        return self._dao.exists(contract_id=contract_id)
+
+    def is_active(self, contract_id: int) -> bool:
+        """Checks whether contract with entered id has 'active' status."""
+
+        return self._dao.is_active(contract_id=contract_id)
+
     def get_record_by_id(self, contract_id: str) -> ContractsDTO:
         """Gets contract by entered id from database."""
 
@@ -73,3 +162,13 @@ class ContractsLogic:
             raise IncorrectIdError("[ERROR]: There isn't a contract with entered ID in the database.")
         else:
             return contract_info
+
+    def get_summary(self) -> list[ContractSummaryDTO]:
+        """Gets precalculated contract counts and latest signing dates per status and project."""
+
+        return self._dao.get_summary()
+
+    def refresh_summary(self) -> None:
+        """Recalculates contract summary."""
+
+        self._dao.refresh_summary()
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
 from psycopg2.errors import IntegrityError
 
-from data_access.dao import ContractsDAO, ProjectsDAO
-from data_access.dto import ProjectsDTO
+from data_access.dao import create_contracts_dao, create_projects_dao
+from data_access.dto import (
+    BatchResultDTO,
+    ContractsFilterDTO,
+    ImportResultDTO,
+    ProjectsDTO,
+    ProjectsFilterDTO,
+)
 from errors import ContractAlreadyExistError, IncorrectIdError, ValidationError
-from validators import validate_active_contract_id, validate_entered_id
+from validators import (
+    validate_active_contract_id,
+    validate_entered_id,
+    validate_search_text,
+)
 
 if TYPE_CHECKING:
     from data_access.interfaces import DBGatewayProtocol
@@ -18,8 +28,8 @@ class ProjectLogic:
 
     def __init__(self, db_gateway: DBGatewayProtocol) -> None:
         self._db_gateway = db_gateway
-        self._dao = ProjectsDAO(db_gateway=self._db_gateway)
-        self._contracts_dao = ContractsDAO(db_gateway=self._db_gateway)
+        self._dao = create_projects_dao(db_gateway=self._db_gateway)
+        self._contracts_dao = create_contracts_dao(db_gateway=self._db_gateway)
 
     def get_all_data(self) -> list[ProjectsDTO]:
         """Gets all projects information from the database."""
@@ -27,12 +37,47 @@ class ProjectLogic:
         data: list[ProjectsDTO] = self._dao.get_all_projects_info()
         return data
 
+    def iter_all_data(self, itersize: int = 2000) -> Iterator[ProjectsDTO]:
+        """Yields all projects information from the database, fetching `itersize` rows at a time."""
+
+        return self._dao.iter_all_projects_info(itersize=itersize)
+
+    def get_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        before_id: Optional[int] = None,
+    ) -> list[ProjectsDTO]:
+        """Gets page of projects following after_id (or preceding before_id)."""
+
+        return self._dao.get_projects_page(after_id=after_id, limit=limit, before_id=before_id)
+
+    def search(self, text: str, limit: int = 20) -> list[ProjectsDTO]:
+        """Gets projects whose name matches entered text, best matches first."""
+
+        validate_search_text(entered_text=text)
+        return self._dao.search_by_name(text=text.strip(), limit=limit)
+
     def get_active_contracts_ids(self) -> list[tuple[int]]:
         """Gets list ids of active contracts"""
-        contract_dao = ContractsDAO(db_gateway=self._db_gateway)
-        active_contracts_list = contract_dao.get_active_contracts_ids()
+        active_contracts_list = self._contracts_dao.get_active_contracts_ids()
         return active_contracts_list
 
+    def has_active_contracts(self) -> bool:
+        """Checks whether there is at least one active contract to add to a project."""
+
+        return self._contracts_dao.any_records(filters=ContractsFilterDTO(status="active"))
+
+    def filter_records(self, filters: ProjectsFilterDTO) -> list[ProjectsDTO]:
+        """Gets projects matching entered criteria; filtering, sorting and limiting are done by the database."""
+
+        return self._dao.filter_records(filters=filters)
+
+    def count_records(self, filters: ProjectsFilterDTO) -> int:
+        """Counts projects matching entered criteria without fetching them."""
+
+        return self._dao.count_records(filters=filters)
+
     def create_record(self, entered_name: str) -> None:
         """Creates new record in database with entered data."""
 
@@ -42,6 +87,17 @@ class ProjectLogic:
         except IntegrityError:
             raise
 
+    def create_records(self, project_names: list[str], page_size: int = 100) -> BatchResultDTO:
+        """Creates new projects in one transaction, reporting names that could not be created."""
+
+        records = [ProjectsDTO(name=name) for name in project_names]
+        return self._dao.create_records(records=records, page_size=page_size)
+
+    def import_records(self, records: Iterable[ProjectsDTO]) -> ImportResultDTO:
+        """Imports projects in bulk, reporting rejected rows instead of aborting the whole batch."""
+
+        return self._dao.import_records(records=records)
+
     def get_record_by_id(self, project_id: str) -> ProjectsDTO:
         """Gets project by entered id from database."""
 
@@ -58,38 +114,26 @@ class ProjectLogic:
             return project_info
 
     def add_contract_to_project(self, project_id: str, contract_id: str) -> None:
-        """Adds contract to project."""
+        """Adds contract to project. The contract status is checked by primary key before any row is locked,
+        then both records are checked again and linked in one atomic statement."""
 
         try:
-            validate_active_contract_id(
-                entered_id=contract_id,
-                contracts_ids_list=self.get_active_contracts_ids(),
-            )
-            project_info = self.get_record_by_id(project_id=project_id)
+            validate_active_contract_id(entered_id=contract_id, is_active=self._contracts_dao.is_active)
+            validate_entered_id(entered_id=project_id)
         except ValidationError:
             raise
-        except IncorrectIdError:
-            raise
-        else:
-            try:
-                if project_info.contract_id:
-                    raise ContractAlreadyExistError(
-                        f"Project {project_id} already has an active contract! "
-                        f"Please select another contract to add."
-                    )
-                else:
-                    int_contract_id = int(contract_id)
-                    int_project_id = int(project_id)
-                    project_info.contract_id = int_contract_id
-                    self._dao.update_record(project_info)
-                    contract_info = self._contracts_dao.get_contract_info_by_id(contract_id=int_contract_id)
-                    if contract_info:
-                        contract_info.project_id = int_project_id
-                        self._contracts_dao.update_record(data=contract_info)
-                    else:
-                        raise IncorrectIdError("[ERROR]: There isn't a contract with entered ID in the database.")
-            except IntegrityError:
-                raise
+        contract_is_active, project_exists, project_is_free, _ = self._dao.add_active_contract(
+            project_id=int(project_id),
+            contract_id=int(contract_id),
+        )
+        if not contract_is_active:
+            raise ValidationError("[ERROR]: Selected contract must be active.")
+        if not project_exists:
+            raise IncorrectIdError("[ERROR]: There isn't a contract with entered ID in the database.")
+        if not project_is_free:
+            raise ContractAlreadyExistError(
+                f"Project {project_id} already has an active contract! Please select another contract to add."
+            )
 
     def remove_active_contract_from_project(self, contract_id: str) -> None:
         """Removes active contract_id."""
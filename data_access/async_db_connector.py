@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
+
+import psycopg2
+from psycopg2 import InterfaceError, OperationalError
+from psycopg2.extensions import POLL_OK, POLL_READ, POLL_WRITE
+
+from errors import PoolTimeoutError
+
+if TYPE_CHECKING:
+    from psycopg2 import connection
+
+
+def _wake_up(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+async def _wait(conn: connection) -> None:
+    """Waits without blocking the event loop until asynchronous connection finishes its current operation."""
+    loop = asyncio.get_running_loop()
+    while True:
+        state = conn.poll()
+        if state == POLL_OK:
+            return
+        future: asyncio.Future = loop.create_future()
+        fd = conn.fileno()
+        if state == POLL_READ:
+            loop.add_reader(fd, _wake_up, future)
+            try:
+                await future
+            finally:
+                loop.remove_reader(fd)
+        elif state == POLL_WRITE:
+            loop.add_writer(fd, _wake_up, future)
+            try:
+                await future
+            finally:
+                loop.remove_writer(fd)
+        else:
+            raise OperationalError(f"Unexpected connection poll state: {state}.")
+
+
+class AsyncCursor:
+    """Cursor of asynchronous psycopg2 connection. Queries are awaited, fetched rows are already client-side."""
+
+    def __init__(self, conn: connection) -> None:
+        self._connection = conn
+        self._cursor = conn.cursor()
+
+    async def execute(self, query: str, params: Optional[Any] = None) -> None:
+        self._cursor.execute(query, params)
+        await _wait(self._connection)
+
+    def fetchone(self) -> Optional[tuple]:
+        row: Optional[tuple] = self._cursor.fetchone()
+        return row
+
+    def fetchall(self) -> list[tuple]:
+        rows: list[tuple] = self._cursor.fetchall()
+        return rows
+
+    @property
+    def rowcount(self) -> int:
+        count: int = self._cursor.rowcount
+        return count
+
+    def close(self) -> None:
+        self._cursor.close()
+
+
+class AsyncPostgreSQLPoolGateway:
+    """Hands out asynchronous PostgreSQL connections from a bounded pool, one connection per operation,
+    so many coroutines can run queries concurrently in one thread.
+    :param db_name: name of PostgreSQL database
+    :type db_name: str
+    :param db_user: name of the user who can work with the transferred PostgreSQL database
+    :type db_user: str
+    :param db_password: password of the user who can work with the transferred PostgreSQL database
+    :type db_password: str
+    :param db_host: host address hosting the PostgreSQL database
+    :type db_host: str
+    :param db_port: port of the PostgreSQL database
+    :type db_host: str
+    :param max_size: maximum number of simultaneously opened connections
+    :type max_size: int
+    :param acquire_timeout: seconds to wait for a free connection before PoolTimeoutError is raised
+    :type acquire_timeout: float
+    """
+
+    def __init__(
+        self,
+        db_name: str,
+        db_password: str,
+        db_user: str,
+        db_host: str,
+        db_port: str,
+        max_size: int = 10,
+        acquire_timeout: float = 30.0,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("Pool max_size must be at least 1.")
+        self._connect_kwargs = {
+            "database": db_name,
+            "user": db_user,
+            "password": db_password,
+            "host": db_host,
+            "port": db_port,
+        }
+        self._acquire_timeout = acquire_timeout
+        self._slots = asyncio.Semaphore(max_size)
+        self._idle: list[connection] = []
+
+    async def _create_connection(self) -> connection:
+        """Creates asynchronous PostgreSQL connection object."""
+        conn = psycopg2.connect(async_=True, **self._connect_kwargs)
+        await _wait(conn)
+        return conn
+
+    async def _acquire_connection(self) -> connection:
+        """Takes idle connection from the pool or opens a new one, skipping closed connections."""
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self._acquire_timeout)
+        except asyncio.TimeoutError:
+            raise PoolTimeoutError(f"[ERROR]: No free database connection within {self._acquire_timeout} seconds.")
+        try:
+            while self._idle:
+                conn = self._idle.pop()
+                if not conn.closed:
+                    return conn
+            return await self._create_connection()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _release_connection(self, conn: connection, broken: bool) -> None:
+        """Returns connection to the pool, closing it if it is broken."""
+        if broken or conn.closed:
+            conn.close()
+        else:
+            self._idle.append(conn)
+        self._slots.release()
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[AsyncCursor]:
+        """Yields a cursor of a pooled connection inside BEGIN/COMMIT, rolls back on error."""
+        conn = await self._acquire_connection()
+        cursor = AsyncCursor(conn)
+        broken = False
+        try:
+            await cursor.execute("BEGIN;")
+            yield cursor
+            await cursor.execute("COMMIT;")
+        except (OperationalError, InterfaceError, asyncio.CancelledError):
+            broken = True
+            raise
+        except BaseException:
+            try:
+                await cursor.execute("ROLLBACK;")
+            except (OperationalError, InterfaceError):
+                broken = True
+            raise
+        finally:
+            cursor.close()
+            self._release_connection(conn, broken=broken)
+
+    async def close(self) -> None:
+        """Closes all idle connections of the pool."""
+        while self._idle:
+            self._idle.pop().close()
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Union
+
+if TYPE_CHECKING:
+    from data_access.db_connector import PostgreSQLPoolGateway
+    from data_access.memory_gateway import InMemoryGateway
+
+BACKENDS = ("postgresql", "memory")
+
+
+def create_db_gateway(backend: str, **options: Any) -> Union[PostgreSQLPoolGateway, InMemoryGateway]:
+    """Creates gateway of the selected backend: 'postgresql' passes `options` to PostgreSQLPoolGateway,
+    'memory' keeps data in process memory and needs no options. Only the selected backend module is imported."""
+
+    if backend == "postgresql":
+        from data_access.db_connector import PostgreSQLPoolGateway
+
+        return PostgreSQLPoolGateway(**options)
+    if backend == "memory":
+        from data_access.memory_gateway import InMemoryGateway
+
+        return InMemoryGateway()
+    raise ValueError(f"Unknown database backend '{backend}', expected one of: {', '.join(BACKENDS)}.")
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from data_access.interfaces import CacheProtocol
+
+
+class LRUCache:
+    """Thread-safe read-through cache with least-recently-used eviction and optional time-to-live.
+    Missing values (None) are not cached.
+    :param max_size: maximum number of cached entries, 0 disables caching
+    :type max_size: int
+    :param ttl: seconds an entry stays valid, None means forever
+    :type ttl: Optional[float]
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: Optional[float] = 60.0) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Gets value from cache or loads it with `loader` and caches it."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            generation = self._generation
+        value = loader()
+        if value is None or self._max_size <= 0:
+            return value
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (now + self._ttl if self._ttl is not None else float("inf"), value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Removes entry, values being loaded at the same moment are not cached."""
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+_cache_factory: Callable[[], CacheProtocol] = LRUCache
+_caches: WeakKeyDictionary[Any, dict[str, CacheProtocol]] = WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def configure_cache(factory: Callable[[], CacheProtocol]) -> None:
+    """Sets factory of caches created from now on, e.g. lambda: LRUCache(max_size=50000, ttl=30)."""
+    global _cache_factory
+    with _caches_lock:
+        _cache_factory = factory
+        _caches.clear()
+
+
+def get_cache(db_gateway: Any, name: str) -> CacheProtocol:
+    """Gets cache `name` of the database behind db_gateway, so all DAOs of one gateway share it."""
+    with _caches_lock:
+        gateway_caches = _caches.setdefault(db_gateway, {})
+        if name not in gateway_caches:
+            gateway_caches[name] = _cache_factory()
+        return gateway_caches[name]
+
+
+def get_cache_stats(db_gateway: Any) -> dict[str, dict[str, int]]:
+    """Gets hit/miss/eviction counters of all caches of db_gateway."""
+    with _caches_lock:
+        gateway_caches = dict(_caches.get(db_gateway, {}))
+    return {name: cache.stats() for name, cache in gateway_caches.items()}
@@ -1,6 +1,24 @@
+from .async_contracts import AsyncContractsDAO
+from .async_projects import AsyncProjectsDAO
+from .async_statuses import AsyncStatusesDAO
 from .base import BaseDAO
 from .contracts import ContractsDAO
+from .factory import create_contracts_dao, create_projects_dao
+from .memory_contracts import InMemoryContractsDAO
+from .memory_projects import InMemoryProjectsDAO
 from .projects import ProjectsDAO
 from .statuses import StatusesDAO
 
-__all__ = ["BaseDAO", "ProjectsDAO", "StatusesDAO", "ContractsDAO"]
+__all__ = [
+    "BaseDAO",
+    "ProjectsDAO",
+    "StatusesDAO",
+    "ContractsDAO",
+    "AsyncContractsDAO",
+    "AsyncProjectsDAO",
+    "AsyncStatusesDAO",
+    "InMemoryContractsDAO",
+    "InMemoryProjectsDAO",
+    "create_contracts_dao",
+    "create_projects_dao",
+]
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from data_access.interfaces import AsyncDBGatewayProtocol
+
+
+class AsyncBaseDAO:
+    """Base asynchronous Data access object."""
+
+    def __init__(self, db_gateway: AsyncDBGatewayProtocol) -> None:
+        self._db_gateway = db_gateway
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from itertools import starmap
+from typing import TYPE_CHECKING, Optional
+
+from data_access.dto import ContractsDTO
+from errors import ConcurrentUpdateError
+
+from .async_base import AsyncBaseDAO
+from .async_statuses import AsyncStatusesDAO
+from .base import build_keyset_page_query
+from .contracts import SELECT_CONTRACTS_SQL, UPDATE_CONTRACT_SQL
+
+if TYPE_CHECKING:
+    from data_access.interfaces import AsyncDBGatewayProtocol
+
+
+class AsyncContractsDAO(AsyncBaseDAO):
+    """Asynchronous counterpart of ContractsDAO."""
+
+    def __init__(self, db_gateway: AsyncDBGatewayProtocol) -> None:
+        super().__init__(db_gateway=db_gateway)
+        self._statuses = AsyncStatusesDAO(db_gateway=db_gateway)
+
+    async def exists(self, contract_id: int) -> bool:
+        """Checks by primary key whether contract with entered id exists."""
+
+        async with self._db_gateway.transaction() as cursor:
+            await cursor.execute("SELECT EXISTS (SELECT 1 FROM contracts WHERE id = %s);", (contract_id,))
+            row = cursor.fetchone()
+        return bool(row and row[0])
+
+    async def is_active(self, contract_id: int) -> bool:
+        """Checks by primary key whether contract with entered id has 'active' status."""
+
+        active_status_id = await self._statuses.get_status_id("active")
+        async with self._db_gateway.transaction() as cursor:
+            await cursor.execute(
+                "SELECT EXISTS (SELECT 1 FROM contracts WHERE id = %s AND status_id = %s);",
+                (contract_id, active_status_id),
+            )
+            row = cursor.fetchone()
+        return bool(row and row[0])
+
+    async def get_active_contracts_ids(self) -> list[tuple[int,]]:
+        """Gets contract ids with 'active' status."""
+
+        active_status_id = await self._statuses.get_status_id("active")
+        async with self._db_gateway.transaction() as cursor:
+            await cursor.execute("SELECT id FROM contracts WHERE status_id = %s;", (active_status_id,))
+            final_result = [(contract_id,) for (contract_id,) in cursor.fetchall()]
+        return final_result
+
+    async def get_all_contracts_info(self) -> list[ContractsDTO]:
+        """Gets all data from contracts table."""
+
+        async with self._db_gateway.transaction() as cursor:
+            await cursor.execute(f"{SELECT_CONTRACTS_SQL};")
+            fetched_list = cursor.fetchall()
+        return list(starmap(ContractsDTO, fetched_list))
+
+    async def get_contracts_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        status: Optional[str] = None,
+        before_id: Optional[int] = None,
+    ) -> list[ContractsDTO]:
+        """Gets up to `limit` contracts ordered by id using keyset pagination."""
+
+        conditions = []
+        if status is not None:
+            conditions.append(("contracts.status_id = %s", await self._statuses.get_status_id(status)))
+        query, params, is_reversed = build_keyset_page_query(
+            select_sql=SELECT_CONTRACTS_SQL,
+            id_column="contracts.id",
+            limit=limit,
+            after_id=after_id,
+            before_id=before_id,
+            conditions=conditions,
+        )
+        async with self._db_gateway.transaction() as cursor:
+            await cursor.execute(query, params)
+            fetched_list = cursor.fetchall()
+        page = list(starmap(ContractsDTO, fetched_list))
+        if is_reversed:
+            page.reverse()
+        return page
+
+    async def create_record(self, data: ContractsDTO) -> None:
+        """Creates record in table 'contracts'."""
+
+        status_id = await self._statuses.get_status_id(data.status)
+        async with self._db_gateway.transaction() as cursor:
+            await cursor.execute("INSERT INTO contracts (name, status_id) VALUES (%s, %s);", (data.name, status_id))
+
+    async def get_contract_info_by_id(self, contract_id: int) -> Optional[ContractsDTO]:
+        """Gets contract info by entered contract_id."""
+
+        async with self._db_gateway.transaction() as cursor:
+            await cursor.execute(f"{SELECT_CONTRACTS_SQL} WHERE contracts.id = %s;", (contract_id,))
+            fetched_tuple = cursor.fetchone()
+        if fetched_tuple:
+            return ContractsDTO(*fetched_tuple)
+        return None
+
+    async def update_record(self, data: ContractsDTO) -> None:
+        """Updates record in the database if its version has not changed, otherwise raises ConcurrentUpdateError."""
+
+        status_id = await self._statuses.get_status_id(data.status)
+        async with self._db_gateway.transaction() as cursor:
+            await cursor.execute(
+                UPDATE_CONTRACT_SQL,
+                (data.name, data.signing_date, status_id, data.project_id, data.id, data.version),
+            )
+            updated_row = cursor.fetchone()
+        if not updated_row:
+            raise ConcurrentUpdateError(
+                f"[ERROR]: Contract with ID {data.id} has been changed or removed by another user, please try again."
+            )
+        data.version = updated_row[0]
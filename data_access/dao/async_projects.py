@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from itertools import starmap
+from typing import TYPE_CHECKING, Optional
+
+from data_access.dto import ProjectsDTO
+from errors import ConcurrentUpdateError
+
+from .async_base import AsyncBaseDAO
+from .async_statuses import AsyncStatusesDAO
+from .base import build_keyset_page_query
+from .projects import ADD_ACTIVE_CONTRACT_SQL, SELECT_PROJECTS_SQL, UPDATE_PROJECT_SQL
+
+if TYPE_CHECKING:
+    from data_access.interfaces import AsyncDBGatewayProtocol
+
+
+class AsyncProjectsDAO(AsyncBaseDAO):
+    """Asynchronous counterpart of ProjectsDAO."""
+
+    def __init__(self, db_gateway: AsyncDBGatewayProtocol) -> None:
+        super().__init__(db_gateway=db_gateway)
+        self._statuses = AsyncStatusesDAO(db_gateway=db_gateway)
+
+    async def get_all_projects_info(self) -> list[ProjectsDTO]:
+        """Gets all data from projects table."""
+
+        async with self._db_gateway.transaction() as cursor:
+            await cursor.execute(f"{SELECT_PROJECTS_SQL};")
+            fetched_list = cursor.fetchall()
+        return list(starmap(ProjectsDTO, fetched_list))
+
+    async def get_projects_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        before_id: Optional[int] = None,
+    ) -> list[ProjectsDTO]:
+        """Gets up to `limit` projects ordered by id using keyset pagination."""
+
+        query, params, is_reversed = build_keyset_page_query(
+            select_sql=SELECT_PROJECTS_SQL,
+            id_column="id",
+            limit=limit,
+            after_id=after_id,
+            before_id=before_id,
+        )
+        async with self._db_gateway.transaction() as cursor:
+            await cursor.execute(query, params)
+            fetched_list = cursor.fetchall()
+        page = list(starmap(ProjectsDTO, fetched_list))
+        if is_reversed:
+            page.reverse()
+        return page
+
+    async def create_record(self, data: ProjectsDTO) -> None:
+        """Creates record in table 'projects'."""
+
+        async with self._db_gateway.transaction() as cursor:
+            await cursor.execute(
+                "INSERT INTO projects (name, active_contract_id) VALUES (%s, %s);",
+                (data.name, data.contract_id),
+            )
+
+    async def get_info_by_id(self, entered_id: int) -> Optional[ProjectsDTO]:
+        """Gets info about project with entered id."""
+
+        async with self._db_gateway.transaction() as cursor:
+            await cursor.execute(f"{SELECT_PROJECTS_SQL} WHERE id = %s;", (entered_id,))
+            fetched_tuple = cursor.fetchone()
+        if fetched_tuple:
+            return ProjectsDTO(*fetched_tuple)
+        return None
+
+    async def update_record(self, data: ProjectsDTO) -> None:
+        """Updates record in the database if its version has not changed, otherwise raises ConcurrentUpdateError."""
+
+        async with self._db_gateway.transaction() as cursor:
+            await cursor.execute(UPDATE_PROJECT_SQL, (data.name, data.contract_id, data.id, data.version))
+            updated_row = cursor.fetchone()
+        if not updated_row:
+            raise ConcurrentUpdateError(
+                f"[ERROR]: Project with ID {data.id} has been changed or removed by another user, please try again."
+            )
+        data.version = updated_row[0]
+
+    async def add_active_contract(self, project_id: int, contract_id: int) -> tuple[bool, bool, bool, bool]:
+        """Links active contract and project with one statement in one transaction, locking both rows.
+        Returns flags (contract is active, project exists, project has no active contract, contract was linked)."""
+
+        active_status_id = await self._statuses.get_status_id("active")
+        async with self._db_gateway.transaction() as cursor:
+            await cursor.execute(
+                ADD_ACTIVE_CONTRACT_SQL,
+                {"project_id": project_id, "contract_id": contract_id, "active_status_id": active_status_id},
+            )
+            contract_is_active, project_exists, project_is_free, is_linked = cursor.fetchone() or (False,) * 4
+        return contract_is_active, project_exists, project_is_free, is_linked
+
+    async def get_project_info_by_active_contract(self, contract_id: int) -> Optional[ProjectsDTO]:
+        """Gets info about project by active contract id."""
+
+        async with self._db_gateway.transaction() as cursor:
+            await cursor.execute(f"{SELECT_PROJECTS_SQL} WHERE active_contract_id = %s;", (contract_id,))
+            fetched_tuple = cursor.fetchone()
+        if fetched_tuple:
+            return ProjectsDTO(*fetched_tuple)
+        return None
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from errors import IncorrectStatusError
+
+from .async_base import AsyncBaseDAO
+from .statuses import StatusesDAO
+
+
+class AsyncStatusesDAO(AsyncBaseDAO):
+    """Asynchronous counterpart of StatusesDAO sharing its process-wide status cache."""
+
+    async def _get_statuses(self) -> dict[str, int]:
+        """Gets cached name-id mapping of statuses, loading it from the database on first use."""
+
+        statuses = StatusesDAO._cache
+        if statuses is None:
+            async with self._db_gateway.transaction() as cursor:
+                await cursor.execute("SELECT name, id FROM statuses;")
+                statuses = {name: int(status_id) for name, status_id in cursor.fetchall()}
+            StatusesDAO._cache = statuses
+        return statuses
+
+    async def get_status_id(self, status_name: str) -> int:
+        """Gets the status ID with entered status_name."""
+
+        status_id = (await self._get_statuses()).get(status_name)
+        if status_id is None:
+            StatusesDAO.invalidate_cache()
+            status_id = (await self._get_statuses()).get(status_name)
+        if status_id is None:
+            raise IncorrectStatusError(f"[ERROR]: Status '{status_name}' does not exist.")
+        return status_id
@@ -1,13 +1,170 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import csv
+import io
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence
+
+from psycopg2 import IntegrityError
+from psycopg2.extras import execute_values
 
 if TYPE_CHECKING:
+    from psycopg2 import cursor
+
     from data_access.interfaces import DBGatewayProtocol
 
 
+def build_where_clause(conditions: Sequence[tuple[str, Any]]) -> tuple[str, list]:
+    """Joins (condition, parameter) pairs with AND. Returns WHERE clause (empty without conditions) and parameters."""
+
+    if not conditions:
+        return "", []
+    return f" WHERE {' AND '.join(condition for condition, _ in conditions)}", [param for _, param in conditions]
+
+
+def build_filtered_query(
+    select_sql: str,
+    conditions: Sequence[tuple[str, Any]],
+    order_column: str,
+    id_column: str,
+    descending: bool = False,
+    limit: Optional[int] = None,
+) -> tuple[str, list]:
+    """Builds query selecting rows matching all conditions, sorted by `order_column` (ties broken by id)
+    and optionally limited."""
+
+    where_clause, params = build_where_clause(conditions)
+    order = "DESC" if descending else "ASC"
+    order_clause = f" ORDER BY {order_column} {order}"
+    if order_column != id_column:
+        order_clause += f", {id_column} {order}"
+    limit_clause = ""
+    if limit is not None:
+        limit_clause = " LIMIT %s"
+        params.append(limit)
+    return f"{select_sql}{where_clause}{order_clause}{limit_clause};", params
+
+
+def build_keyset_page_query(
+    select_sql: str,
+    id_column: str,
+    limit: int,
+    after_id: Optional[int] = None,
+    before_id: Optional[int] = None,
+    conditions: Sequence[tuple[str, Any]] = (),
+) -> tuple[str, list, bool]:
+    """Builds keyset pagination query selecting up to `limit` rows with id greater than after_id (next page)
+    or less than before_id (previous page), ordered by id.
+    Returns the query, its parameters and whether fetched rows must be reversed to get ascending order."""
+
+    conditions = list(conditions)
+    if after_id is not None:
+        conditions.append((f"{id_column} > %s", after_id))
+    if before_id is not None:
+        conditions.append((f"{id_column} < %s", before_id))
+    where_clause, params = build_where_clause(conditions)
+    is_reversed = before_id is not None and after_id is None
+    order = "DESC" if is_reversed else "ASC"
+    params.append(limit)
+    return f"{select_sql}{where_clause} ORDER BY {id_column} {order} LIMIT %s;", params, is_reversed
+
+
+def escape_like(text: str) -> str:
+    """Escapes LIKE wildcards, so text is matched literally."""
+
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def build_name_search_query(
+    select_sql: str,
+    name_column: str,
+    id_column: str,
+    text: str,
+    limit: int,
+) -> tuple[str, list]:
+    """Builds query selecting up to `limit` rows whose name contains `text` or is similar to it (pg_trgm),
+    ranked by prefix match first, then by word similarity. Both conditions are served by trigram GIN index."""
+
+    pattern = escape_like(text)
+    return (
+        f"{select_sql} WHERE {name_column} ILIKE %s OR %s <%% {name_column} "
+        f"ORDER BY {name_column} ILIKE %s DESC, word_similarity(%s, {name_column}) DESC, {id_column} LIMIT %s;",
+        [f"%{pattern}%", text, f"{pattern}%", text, limit],
+    )
+
+
 class BaseDAO:
     """Base Data access object."""
 
     def __init__(self, db_gateway: DBGatewayProtocol) -> None:
         self._db_gateway = db_gateway
+
+    @staticmethod
+    def _execute_values_in_pages(
+        cursor: cursor,
+        sql: str,
+        rows: Sequence[tuple],
+        page_size: int,
+        template: Optional[str] = None,
+    ) -> tuple[list[tuple], list[tuple[int, str]]]:
+        """Executes `sql` with execute_values for every page of rows inside a savepoint.
+        If a page violates a constraint, its rows are retried one by one, so only the failing rows are skipped.
+        Returns rows produced by RETURNING and (row index, error) pairs of the failed rows."""
+
+        returned: list[tuple] = []
+        failed: list[tuple[int, str]] = []
+        for start in range(0, len(rows), page_size):
+            page = rows[start : start + page_size]
+            cursor.execute("SAVEPOINT batch_page;")
+            try:
+                returned.extend(execute_values(cursor, sql, page, template=template, page_size=page_size, fetch=True))
+            except IntegrityError:
+                cursor.execute("ROLLBACK TO SAVEPOINT batch_page;")
+                for offset, row in enumerate(page):
+                    cursor.execute("SAVEPOINT batch_row;")
+                    try:
+                        returned.extend(execute_values(cursor, sql, [row], template=template, fetch=True))
+                    except IntegrityError as err:
+                        cursor.execute("ROLLBACK TO SAVEPOINT batch_row;")
+                        failed.append((start + offset, err.pgerror or str(err)))
+                    else:
+                        cursor.execute("RELEASE SAVEPOINT batch_row;")
+            else:
+                cursor.execute("RELEASE SAVEPOINT batch_page;")
+        return returned, failed
+
+
+class CopyStream:
+    """File-like object that renders rows as CSV lines for COPY ... FROM STDIN on demand,
+    so rows are never held in memory all at once.
+    :param rows: rows to render, None values are rendered as NULL
+    :type rows: Iterable[Sequence]
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]]) -> None:
+        self._rows = iter(rows)
+        self._line = io.StringIO()
+        self._writer = csv.writer(self._line, lineterminator="\n")
+        self._buffer = ""
+
+    def _render_row(self, row: Sequence[Any]) -> str:
+        self._line.seek(0)
+        self._line.truncate()
+        self._writer.writerow(row)
+        return self._line.getvalue()
+
+    def read(self, size: int = -1) -> str:
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            line = self._render_row(row)
+            chunks.append(line)
+            length += len(line)
+        data = "".join(chunks)
+        if size < 0:
+            self._buffer = ""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
@@ -1,119 +1,435 @@
 from __future__ import annotations
 
-from typing import Optional
+from dataclasses import replace
+from datetime import datetime
+from itertools import starmap
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
 
-from psycopg2.errors import IntegrityError
+from data_access.cache import get_cache
+from data_access.dto import (
+    BatchResultDTO,
+    ContractsDTO,
+    ContractsFilterDTO,
+    ContractSummaryDTO,
+    ImportResultDTO,
+    TransitionResultDTO,
+)
+from errors import ConcurrentUpdateError, ValidationError
 
-from data_access.dto import ContractsDTO
-
-from .base import BaseDAO
+from .base import (
+    BaseDAO,
+    CopyStream,
+    build_filtered_query,
+    build_keyset_page_query,
+    build_name_search_query,
+    build_where_clause,
+)
 from .statuses import StatusesDAO
 
+if TYPE_CHECKING:
+    from data_access.interfaces import DBGatewayProtocol
+
+SELECT_CONTRACTS_SQL = (
+    "SELECT contracts.name, statuses.name, contracts.id, contracts.signing_date, contracts.creation_date, "
+    "contracts.project_id, contracts.version "
+    "FROM contracts "
+    "JOIN statuses ON contracts.status_id = statuses.id"
+)
+
+UPDATE_CONTRACT_SQL = (
+    "UPDATE contracts SET name = %s, signing_date = %s, status_id = %s, project_id = %s, version = version + 1 "
+    "WHERE id = %s AND version = %s RETURNING version;"
+)
+
+TRANSITION_CONTRACTS_SQL = (
+    "WITH requested AS ("
+    "SELECT id, request_order FROM unnest(%(contract_ids)s::int[]) WITH ORDINALITY AS requested (id, request_order)"
+    "), locked AS ("
+    "SELECT contracts.id FROM contracts JOIN requested ON requested.id = contracts.id "
+    "WHERE contracts.status_id = %(required_status_id)s ORDER BY contracts.id FOR UPDATE OF contracts"
+    "), transitioned AS ("
+    "UPDATE contracts SET status_id = %(new_status_id)s, "
+    "signing_date = COALESCE(contracts.signing_date, %(signing_date)s::date), version = contracts.version + 1 "
+    "FROM locked WHERE contracts.id = locked.id RETURNING contracts.id"
+    "), detached AS ("
+    "UPDATE projects SET active_contract_id = NULL, version = projects.version + 1 FROM transitioned "
+    "WHERE %(detach_projects)s AND projects.active_contract_id = transitioned.id "
+    "RETURNING projects.id AS project_id, transitioned.id AS contract_id"
+    ") "
+    "SELECT requested.id, CASE WHEN transitioned.id IS NOT NULL THEN 'updated' "
+    "WHEN contracts.id IS NULL THEN 'not_found' ELSE 'wrong_status' END, detached.project_id "
+    "FROM requested "
+    "LEFT JOIN transitioned ON transitioned.id = requested.id "
+    "LEFT JOIN contracts ON contracts.id = requested.id "
+    "LEFT JOIN detached ON detached.contract_id = requested.id "
+    "ORDER BY requested.request_order;"
+)
+
+CONTRACTS_ORDER_COLUMNS = {
+    "id": "contracts.id",
+    "name": "contracts.name",
+    "signing_date": "contracts.signing_date",
+    "creation_date": "contracts.creation_date",
+}
+
 
 class ContractsDAO(BaseDAO):
     """Contains methods for working with the "contracts" table from the database."""
 
+    def __init__(self, db_gateway: DBGatewayProtocol) -> None:
+        super().__init__(db_gateway=db_gateway)
+        self._statuses = StatusesDAO(db_gateway=db_gateway)
+        self._cache = get_cache(db_gateway, "contracts")
+        self._projects_cache = get_cache(db_gateway, "projects")
+
     def get_ids_list(self) -> list[tuple[int,]]:
         """Gets ids from projects table."""
 
-        self._db_gateway.cursor.execute("SELECT id FROM contracts;")
-        final_result: list[tuple[int,]] = self._db_gateway.cursor.fetchall()
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute("SELECT id FROM contracts;")
+            final_result: list[tuple[int,]] = cursor.fetchall()
         return final_result
 
     def get_active_contracts_ids(self) -> list[tuple[int,]]:
         """Gets contract ids with 'active' status."""
 
-        self._db_gateway.cursor.execute(
-            "SELECT contracts.id FROM contracts "
-            "JOIN statuses on status_id = statuses.id "
-            "WHERE statuses.name = 'active';"
-        )
-        final_result: list[tuple[int,]] = self._db_gateway.cursor.fetchall()
+        active_status_id = self._statuses.get_status_id("active")
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute("SELECT id FROM contracts WHERE status_id = %s;", (active_status_id,))
+            final_result: list[tuple[int,]] = cursor.fetchall()
         return final_result
 
+    def exists(self, contract_id: int) -> bool:
+        """Checks by primary key whether contract with entered id exists."""
+
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute("SELECT EXISTS (SELECT 1 FROM contracts WHERE id = %s);", (contract_id,))
+            is_existing: bool = cursor.fetchone()[0]
+        return is_existing
+
+    def is_active(self, contract_id: int) -> bool:
+        """Checks by primary key whether contract with entered id has 'active' status."""
+
+        active_status_id = self._statuses.get_status_id("active")
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(
+                "SELECT EXISTS (SELECT 1 FROM contracts WHERE id = %s AND status_id = %s);",
+                (contract_id, active_status_id),
+            )
+            is_active_contract: bool = cursor.fetchone()[0]
+        return is_active_contract
+
     def get_all_contracts_info(self) -> list[ContractsDTO]:
         """Gets all data from contracts table."""
 
-        self._db_gateway.cursor.execute(
-            "SELECT contracts.id AS id, contracts.name AS name, contracts.creation_date AS creation_date, "
-            "contracts.signing_date AS signing_date, statuses.name AS status, contracts.project_id AS project_id "
-            "FROM contracts "
-            "JOIN statuses ON contracts.status_id = statuses.id;"
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(f"{SELECT_CONTRACTS_SQL};")
+            fetched_list: list[tuple] = cursor.fetchall()
+        return list(starmap(ContractsDTO, fetched_list))
+
+    def iter_all_contracts_info(self, itersize: int = 2000) -> Iterator[ContractsDTO]:
+        """Yields all data from contracts table, fetching `itersize` rows per round-trip from a server-side cursor."""
+
+        with self._db_gateway.server_side_cursor(itersize=itersize) as cursor:
+            cursor.execute(f"{SELECT_CONTRACTS_SQL} ORDER BY contracts.id;")
+            yield from starmap(ContractsDTO, cursor)
+
+    def get_contracts_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        status: Optional[str] = None,
+        before_id: Optional[int] = None,
+    ) -> list[ContractsDTO]:
+        """Gets up to `limit` contracts ordered by id using keyset pagination.
+        Contracts with id greater than after_id (next page) or less than before_id (previous page) are selected."""
+
+        query, params, is_reversed = build_keyset_page_query(
+            select_sql=SELECT_CONTRACTS_SQL,
+            id_column="contracts.id",
+            limit=limit,
+            after_id=after_id,
+            before_id=before_id,
+            conditions=self._filter_conditions(ContractsFilterDTO(status=status)),
         )
-        fetched_list: list[tuple] = self._db_gateway.cursor.fetchall()
-        final_dto_list: list[ContractsDTO] = []
-        for row in fetched_list:
-            contract_id, name, creation_date, signing_date, status, project_id = row
-            row_dto = ContractsDTO(
-                id=contract_id,
-                name=name,
-                creation_date=creation_date,
-                signing_date=signing_date,
-                status=status,
-                project_id=project_id,
-            )
-            final_dto_list.append(row_dto)
-        return final_dto_list
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(query, params)
+            fetched_list: list[tuple] = cursor.fetchall()
+        page = list(starmap(ContractsDTO, fetched_list))
+        if is_reversed:
+            page.reverse()
+        return page
+
+    def _filter_conditions(self, filters: ContractsFilterDTO) -> list[tuple[str, Any]]:
+        conditions: list[tuple[str, Any]] = []
+        if filters.status is not None:
+            conditions.append(("contracts.status_id = %s", self._statuses.get_status_id(filters.status)))
+        if filters.project_id is not None:
+            conditions.append(("contracts.project_id = %s", filters.project_id))
+        if filters.is_signed is not None:
+            conditions.append(("(contracts.signing_date IS NOT NULL) = %s", filters.is_signed))
+        if filters.signed_from is not None:
+            conditions.append(("contracts.signing_date >= %s", filters.signed_from))
+        if filters.signed_to is not None:
+            conditions.append(("contracts.signing_date <= %s", filters.signed_to))
+        if filters.created_from is not None:
+            conditions.append(("contracts.creation_date >= %s", filters.created_from))
+        if filters.created_to is not None:
+            conditions.append(("contracts.creation_date <= %s", filters.created_to))
+        return conditions
+
+    def filter_records(self, filters: ContractsFilterDTO) -> list[ContractsDTO]:
+        """Gets contracts matching all criteria of `filters`, sorted and limited in the database."""
+
+        order_column = CONTRACTS_ORDER_COLUMNS.get(filters.order_by)
+        if order_column is None:
+            raise ValidationError(f"[ERROR]: Contracts can be sorted only by {', '.join(CONTRACTS_ORDER_COLUMNS)}.")
+        query, params = build_filtered_query(
+            select_sql=SELECT_CONTRACTS_SQL,
+            conditions=self._filter_conditions(filters),
+            order_column=order_column,
+            id_column="contracts.id",
+            descending=filters.descending,
+            limit=filters.limit,
+        )
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(query, params)
+            fetched_list: list[tuple] = cursor.fetchall()
+        return list(starmap(ContractsDTO, fetched_list))
+
+    def count_records(self, filters: ContractsFilterDTO) -> int:
+        """Counts contracts matching all criteria of `filters` (sorting and limit are ignored)."""
+
+        where_clause, params = build_where_clause(self._filter_conditions(filters))
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(f"SELECT count(*) FROM contracts{where_clause};", params)
+            count: int = cursor.fetchone()[0]
+        return count
+
+    def any_records(self, filters: ContractsFilterDTO) -> bool:
+        """Checks whether at least one contract matches all criteria of `filters`, stopping at the first match."""
+
+        where_clause, params = build_where_clause(self._filter_conditions(filters))
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(f"SELECT EXISTS (SELECT 1 FROM contracts{where_clause});", params)
+            is_existing: bool = cursor.fetchone()[0]
+        return is_existing
+
+    def search_by_name(self, text: str, limit: int = 20) -> list[ContractsDTO]:
+        """Gets up to `limit` contracts whose name contains entered text or is similar to it, best matches first."""
+
+        query, params = build_name_search_query(
+            select_sql=SELECT_CONTRACTS_SQL,
+            name_column="contracts.name",
+            id_column="contracts.id",
+            text=text,
+            limit=limit,
+        )
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(query, params)
+            fetched_list: list[tuple] = cursor.fetchall()
+        return list(starmap(ContractsDTO, fetched_list))
 
     def create_record(self, data: ContractsDTO) -> None:
-        """Creates record in table 'contracts'."""
+        """Creates record in table 'contracts'. Cache needs no invalidation: missing ids are never cached."""
 
-        status_id = StatusesDAO(db_gateway=self._db_gateway).get_status_id(data.status)
-        try:
-            self._db_gateway.cursor.execute(
+        status_id = self._statuses.get_status_id(data.status)
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(
                 "INSERT INTO contracts (name, status_id) VALUES " "(%s, %s);",
                 (data.name, status_id),
             )
-        except IntegrityError as err:
-            self._db_gateway.connection.rollback()
-            raise err
-        else:
-            self._db_gateway.connection.commit()
+
+    def create_records(self, records: list[ContractsDTO], page_size: int = 100) -> BatchResultDTO:
+        """Creates records in table 'contracts' in one transaction, sending `page_size` rows per statement.
+        Rows violating constraints are reported by their index in `records`, the rest are created."""
+
+        rows = [(record.name, self._statuses.get_status_id(record.status)) for record in records]
+        with self._db_gateway.transaction() as cursor:
+            returned, failed = self._execute_values_in_pages(
+                cursor=cursor,
+                sql="INSERT INTO contracts (name, status_id) VALUES %s RETURNING id;",
+                rows=rows,
+                page_size=page_size,
+            )
+        return BatchResultDTO(written=len(returned), failed=failed)
+
+    def _load_contract_info(self, contract_id: int) -> Optional[ContractsDTO]:
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(f"{SELECT_CONTRACTS_SQL} WHERE contracts.id = %s;", (contract_id,))
+            fetched_tuple: tuple = cursor.fetchone()
+
+        if fetched_tuple:
+            return ContractsDTO(*fetched_tuple)
+        return None
 
     def get_contract_info_by_id(self, contract_id: int) -> Optional[ContractsDTO]:
-        """Gets contract info by entered contract_id."""
-
-        self._db_gateway.cursor.execute(
-            "SELECT contracts.id AS id, contracts.name AS name, contracts.creation_date AS creation_date, "
-            "contracts.signing_date AS signing_date, statuses.name AS status, contracts.project_id AS project_id "
-            "FROM contracts "
-            "JOIN statuses ON contracts.status_id = statuses.id "
-            "WHERE contracts.id = %s;",
-            (contract_id,),
+        """Gets contract info by entered contract_id through the read-through cache.
+        Returns a copy, so callers may change it freely."""
+
+        contract_info = self._cache.get_or_load(contract_id, lambda: self._load_contract_info(contract_id))
+        return replace(contract_info) if contract_info else None
+
+    def update_record(self, data: ContractsDTO) -> None:
+        """Updates record in the database if it has not been changed since `data` was read (versions match),
+        otherwise raises ConcurrentUpdateError. On success `data.version` is set to the new version."""
+
+        status_id = self._statuses.get_status_id(data.status)
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(
+                UPDATE_CONTRACT_SQL,
+                (data.name, data.signing_date, status_id, data.project_id, data.id, data.version),
+            )
+            updated_row: Optional[tuple[int]] = cursor.fetchone()
+        self._cache.invalidate(data.id)
+        if not updated_row:
+            raise ConcurrentUpdateError(
+                f"[ERROR]: Contract with ID {data.id} has been changed or removed by another user, please try again."
+            )
+        data.version = updated_row[0]
+
+    def transition_records(
+        self,
+        contract_ids: Iterable[int],
+        required_status: str,
+        new_status: str,
+        signing_date: datetime,
+        detach_projects: bool = False,
+        page_size: int = 1000,
+    ) -> list[TransitionResultDTO]:
+        """Moves contracts having `required_status` to `new_status` in one transaction, `page_size` ids per
+        statement: each statement locks the contracts in id order, checks their status, sets the status and missing
+        signing dates, bumps versions and, with `detach_projects`, removes them as active contracts of projects.
+        Returns the outcome of every distinct entered id in entered order."""
+
+        unique_ids = list(dict.fromkeys(contract_ids))
+        if not unique_ids:
+            return []
+        params = {
+            "required_status_id": self._statuses.get_status_id(required_status),
+            "new_status_id": self._statuses.get_status_id(new_status),
+            "signing_date": signing_date,
+            "detach_projects": detach_projects,
+        }
+        results: list[TransitionResultDTO] = []
+        with self._db_gateway.transaction() as cursor:
+            for start in range(0, len(unique_ids), page_size):
+                cursor.execute(
+                    TRANSITION_CONTRACTS_SQL,
+                    {**params, "contract_ids": unique_ids[start : start + page_size]},
+                )
+                results.extend(starmap(TransitionResultDTO, cursor.fetchall()))
+        for result in results:
+            if result.outcome == "updated":
+                self._cache.invalidate(result.contract_id)
+            if result.detached_project_id is not None:
+                self._projects_cache.invalidate(result.detached_project_id)
+        return results
+
+    def import_records(self, records: Iterable[ContractsDTO]) -> ImportResultDTO:
+        """Imports contracts in one transaction: streams them with COPY into a staging table, then moves valid ones
+        into 'contracts'. Rows with an empty or already existing name or unknown status are reported, not inserted."""
+
+        rows = (
+            (
+                line_number,
+                record.name or None,
+                record.status,
+                record.signing_date.strftime("%Y-%m-%d") if record.signing_date else None,
+            )
+            for line_number, record in enumerate(records, start=1)
         )
-        fetched_tuple: tuple = self._db_gateway.cursor.fetchone()
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(
+                "CREATE TEMP TABLE contracts_import "
+                "(line_number BIGINT, name TEXT, status TEXT, signing_date DATE) ON COMMIT DROP;"
+            )
+            cursor.copy_expert(
+                "COPY contracts_import (line_number, name, status, signing_date) FROM STDIN WITH (FORMAT csv);",
+                CopyStream(rows),
+            )
+            cursor.execute(
+                "WITH candidates AS ("
+                "SELECT DISTINCT ON (contracts_import.name) contracts_import.line_number, contracts_import.name, "
+                "contracts_import.signing_date, statuses.id AS status_id "
+                "FROM contracts_import JOIN statuses ON statuses.name = COALESCE(contracts_import.status, 'draft') "
+                "WHERE contracts_import.name IS NOT NULL "
+                "ORDER BY contracts_import.name, contracts_import.line_number"
+                "), inserted AS ("
+                "INSERT INTO contracts (name, signing_date, status_id) "
+                "SELECT name, signing_date, status_id FROM candidates "
+                "ON CONFLICT (name) DO NOTHING RETURNING name"
+                ") "
+                "SELECT contracts_import.line_number, COALESCE(contracts_import.name, ''), "
+                "CASE WHEN contracts_import.name IS NULL THEN 'empty name' "
+                "WHEN statuses.id IS NULL THEN 'unknown status' ELSE 'name already exists' END "
+                "FROM contracts_import "
+                "LEFT JOIN statuses ON statuses.name = COALESCE(contracts_import.status, 'draft') "
+                "WHERE NOT EXISTS ("
+                "SELECT 1 FROM candidates JOIN inserted ON inserted.name = candidates.name "
+                "WHERE candidates.line_number = contracts_import.line_number"
+                ") ORDER BY contracts_import.line_number;"
+            )
+            rejected: list[tuple[int, str, str]] = cursor.fetchall()
+            cursor.execute("SELECT count(*) FROM contracts_import;")
+            staged_count: int = cursor.fetchone()[0]
+        return ImportResultDTO(imported=staged_count - len(rejected), rejected=rejected)
 
-        if fetched_tuple:
+    def update_records(self, records: list[ContractsDTO], page_size: int = 100) -> BatchResultDTO:
+        """Updates records in the database in one transaction, sending `page_size` rows per statement.
+        Rows violating constraints, missing in the database or changed since they were read (versions differ)
+        are reported by their index in `records`."""
+
+        rows = [
             (
-                contract_id_from_db,
-                name,
-                creation_date,
-                signing_date,
-                status,
-                project_id,
-            ) = fetched_tuple
-            return ContractsDTO(
-                id=contract_id_from_db,
-                name=name,
-                creation_date=creation_date,
-                signing_date=signing_date,
-                status=status,
-                project_id=project_id,
+                record.id,
+                record.name,
+                record.signing_date,
+                self._statuses.get_status_id(record.status),
+                record.project_id,
+                record.version,
             )
-        return None
+            for record in records
+        ]
+        with self._db_gateway.transaction() as cursor:
+            returned, failed = self._execute_values_in_pages(
+                cursor=cursor,
+                sql="UPDATE contracts SET name = data.name, signing_date = data.signing_date, "
+                "status_id = data.status_id, project_id = data.project_id, version = contracts.version + 1 "
+                "FROM (VALUES %s) AS data (id, name, signing_date, status_id, project_id, version) "
+                "WHERE contracts.id = data.id AND contracts.version = data.version "
+                "RETURNING contracts.id, contracts.version;",
+                rows=rows,
+                page_size=page_size,
+                template="(%s::int, %s, %s::date, %s::int, %s::int, %s::int)",
+            )
+        new_versions: dict[int, int] = {row[0]: row[1] for row in returned}
+        updated_ids = set(new_versions)
+        for contract_id in updated_ids:
+            self._cache.invalidate(contract_id)
+        failed_indexes = {index for index, _ in failed}
+        for index, record in enumerate(records):
+            if record.id in updated_ids:
+                record.version = new_versions[record.id]
+            elif index not in failed_indexes:
+                message = f"Contract with ID {record.id} does not exist or has been changed by another user."
+                failed.append((index, message))
+        failed.sort()
+        return BatchResultDTO(written=len(updated_ids), failed=failed)
 
-    def update_record(self, data: ContractsDTO) -> None:
-        """Updates record in the database."""
-
-        try:
-            self._db_gateway.cursor.execute(
-                "UPDATE contracts SET name = %s, signing_date = %s, status_id = "
-                "(SELECT id FROM statuses WHERE statuses.name = %s), project_id = %s "
-                "WHERE id = %s;",
-                (data.name, data.signing_date, data.status, data.project_id, data.id),
+    def get_summary(self) -> list[ContractSummaryDTO]:
+        """Gets contract counts and latest signing dates per status and project from 'contract_summary' view."""
+
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(
+                "SELECT status, project_id, contracts_count, last_signing_date FROM contract_summary "
+                "ORDER BY status, project_id NULLS FIRST;"
             )
-        except IntegrityError as err:
-            self._db_gateway.connection.rollback()
-            raise err
-        else:
-            self._db_gateway.connection.commit()
+            fetched_list: list[tuple] = cursor.fetchall()
+        return list(starmap(ContractSummaryDTO, fetched_list))
+
+    def refresh_summary(self) -> None:
+        """Recalculates 'contract_summary' view without blocking its readers."""
+
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY contract_summary;")
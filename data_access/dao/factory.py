@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from data_access.memory_gateway import InMemoryGateway
+
+from .contracts import ContractsDAO
+from .memory_contracts import InMemoryContractsDAO
+from .memory_projects import InMemoryProjectsDAO
+from .projects import ProjectsDAO
+
+if TYPE_CHECKING:
+    from data_access.interfaces import DBGatewayProtocol
+
+
+def create_contracts_dao(db_gateway: DBGatewayProtocol) -> ContractsDAO:
+    """Creates ContractsDAO working with the backend of the passed gateway."""
+
+    if isinstance(db_gateway, InMemoryGateway):
+        return InMemoryContractsDAO(db_gateway=db_gateway)
+    return ContractsDAO(db_gateway=db_gateway)
+
+
+def create_projects_dao(db_gateway: DBGatewayProtocol) -> ProjectsDAO:
+    """Creates ProjectsDAO working with the backend of the passed gateway."""
+
+    if isinstance(db_gateway, InMemoryGateway):
+        return InMemoryProjectsDAO(db_gateway=db_gateway)
+    return ProjectsDAO(db_gateway=db_gateway)
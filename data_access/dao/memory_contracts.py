@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import replace
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from psycopg2 import IntegrityError
+
+from data_access.dto import (
+    BatchResultDTO,
+    ContractsDTO,
+    ContractsFilterDTO,
+    ContractSummaryDTO,
+    ImportResultDTO,
+    TransitionResultDTO,
+)
+from data_access.memory_gateway import (
+    STATUSES,
+    check_status,
+    in_date_range,
+    select_page,
+    to_date,
+)
+from errors import ConcurrentUpdateError, ValidationError
+
+from .contracts import CONTRACTS_ORDER_COLUMNS, ContractsDAO
+
+if TYPE_CHECKING:
+    from data_access.memory_gateway import InMemoryGateway
+
+
+class InMemoryContractsDAO(ContractsDAO):
+    """ContractsDAO of the in-memory backend: the same methods working with InMemoryGateway store."""
+
+    def __init__(self, db_gateway: InMemoryGateway) -> None:
+        super().__init__(db_gateway=db_gateway)
+        self._store = db_gateway.store
+
+    @staticmethod
+    def _matches(contract: ContractsDTO, filters: ContractsFilterDTO) -> bool:
+        if filters.status is not None and contract.status != filters.status:
+            return False
+        if filters.project_id is not None and contract.project_id != filters.project_id:
+            return False
+        if filters.is_signed is not None and (contract.signing_date is not None) != filters.is_signed:
+            return False
+        return in_date_range(contract.signing_date, filters.signed_from, filters.signed_to) and in_date_range(
+            contract.creation_date, filters.created_from, filters.created_to
+        )
+
+    def _filtered(self, filters: ContractsFilterDTO) -> Iterator[ContractsDTO]:
+        """Yields matching stored contracts, looking them up in status index when status is filtered."""
+        if filters.status is not None:
+            check_status(filters.status)
+            ids: Iterable[int] = sorted(self._store.contract_ids_by_status[filters.status])
+        else:
+            ids = self._store.contract_ids
+        for contract_id in ids:
+            contract = self._store.contracts[contract_id]
+            if self._matches(contract, filters):
+                yield contract
+
+    def get_ids_list(self) -> list[tuple[int,]]:
+        """Gets ids of all contracts."""
+
+        with self._db_gateway.transaction():
+            return [(contract_id,) for contract_id in self._store.contract_ids]
+
+    def get_active_contracts_ids(self) -> list[tuple[int,]]:
+        """Gets contract ids with 'active' status."""
+
+        with self._db_gateway.transaction():
+            return [(contract_id,) for contract_id in sorted(self._store.contract_ids_by_status["active"])]
+
+    def exists(self, contract_id: int) -> bool:
+        """Checks whether contract with entered id exists."""
+
+        with self._db_gateway.transaction():
+            return contract_id in self._store.contracts
+
+    def is_active(self, contract_id: int) -> bool:
+        """Checks whether contract with entered id has 'active' status."""
+
+        with self._db_gateway.transaction():
+            return contract_id in self._store.contract_ids_by_status["active"]
+
+    def get_all_contracts_info(self) -> list[ContractsDTO]:
+        """Gets all contracts."""
+
+        with self._db_gateway.transaction():
+            return [replace(self._store.contracts[contract_id]) for contract_id in self._store.contract_ids]
+
+    def iter_all_contracts_info(self, itersize: int = 2000) -> Iterator[ContractsDTO]:
+        """Yields all contracts, copying `itersize` of them per transaction."""
+
+        position = 0
+        while True:
+            with self._db_gateway.transaction():
+                chunk_ids = self._store.contract_ids[position : position + itersize]
+                chunk = [replace(self._store.contracts[contract_id]) for contract_id in chunk_ids]
+            if not chunk:
+                return
+            position += len(chunk)
+            yield from chunk
+
+    def get_contracts_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        status: Optional[str] = None,
+        before_id: Optional[int] = None,
+    ) -> list[ContractsDTO]:
+        """Gets up to `limit` contracts ordered by id, following after_id or preceding before_id."""
+
+        filters = ContractsFilterDTO(status=status)
+        if status is not None:
+            check_status(status)
+        with self._db_gateway.transaction():
+            page = select_page(
+                ids=self._store.contract_ids,
+                load=self._store.contracts.__getitem__,
+                matches=lambda contract: self._matches(contract, filters),
+                limit=limit,
+                after_id=after_id,
+                before_id=before_id,
+            )
+            return [replace(contract) for contract in page]
+
+    def filter_records(self, filters: ContractsFilterDTO) -> list[ContractsDTO]:
+        """Gets contracts matching all criteria of `filters`, sorted and limited."""
+
+        if filters.order_by not in CONTRACTS_ORDER_COLUMNS:
+            raise ValidationError(f"[ERROR]: Contracts can be sorted only by {', '.join(CONTRACTS_ORDER_COLUMNS)}.")
+        with self._db_gateway.transaction():
+            found = [replace(contract) for contract in self._filtered(filters)]
+        if filters.order_by != "id":
+            # None goes last in ascending and first in descending order, as NULL does in PostgreSQL.
+            found.sort(
+                key=lambda contract: (
+                    getattr(contract, filters.order_by) is None,
+                    getattr(contract, filters.order_by),
+                    contract.id,
+                ),
+                reverse=filters.descending,
+            )
+        elif filters.descending:
+            found.reverse()
+        return found[: filters.limit] if filters.limit is not None else found
+
+    def count_records(self, filters: ContractsFilterDTO) -> int:
+        """Counts contracts matching all criteria of `filters`."""
+
+        with self._db_gateway.transaction():
+            return sum(1 for _ in self._filtered(filters))
+
+    def any_records(self, filters: ContractsFilterDTO) -> bool:
+        """Checks whether at least one contract matches all criteria of `filters`."""
+
+        with self._db_gateway.transaction():
+            return next(self._filtered(filters), None) is not None
+
+    def search_by_name(self, text: str, limit: int = 20) -> list[ContractsDTO]:
+        """Gets up to `limit` contracts whose name contains entered text (case-insensitive),
+        names starting with it and shorter names first."""
+
+        needle = text.lower()
+        with self._db_gateway.transaction():
+            found = [
+                replace(contract) for contract in self._store.contracts.values() if needle in contract.name.lower()
+            ]
+        found.sort(key=lambda contract: (not contract.name.lower().startswith(needle), len(contract.name), contract.id))
+        return found[:limit]
+
+    def create_record(self, data: ContractsDTO) -> None:
+        """Creates contract."""
+
+        with self._db_gateway.transaction():
+            self._store.insert_contract(data)
+
+    def create_records(self, records: list[ContractsDTO], page_size: int = 100) -> BatchResultDTO:
+        """Creates contracts, reporting rows violating constraints by their index in `records`."""
+
+        for record in records:
+            check_status(record.status)
+        failed: list[tuple[int, str]] = []
+        with self._db_gateway.transaction():
+            for index, record in enumerate(records):
+                try:
+                    self._store.insert_contract(record)
+                except IntegrityError as err:
+                    failed.append((index, str(err)))
+        return BatchResultDTO(written=len(records) - len(failed), failed=failed)
+
+    def get_contract_info_by_id(self, contract_id: int) -> Optional[ContractsDTO]:
+        """Gets copy of contract with entered id."""
+
+        with self._db_gateway.transaction():
+            contract = self._store.contracts.get(contract_id)
+            return replace(contract) if contract else None
+
+    def update_record(self, data: ContractsDTO) -> None:
+        """Updates contract if its version has not changed, otherwise raises ConcurrentUpdateError."""
+
+        with self._db_gateway.transaction():
+            new_version = self._store.update_contract(data)
+        if new_version is None:
+            raise ConcurrentUpdateError(
+                f"[ERROR]: Contract with ID {data.id} has been changed or removed by another user, please try again."
+            )
+        data.version = new_version
+
+    def transition_records(
+        self,
+        contract_ids: Iterable[int],
+        required_status: str,
+        new_status: str,
+        signing_date: datetime,
+        detach_projects: bool = False,
+        page_size: int = 1000,
+    ) -> list[TransitionResultDTO]:
+        """Moves contracts having `required_status` to `new_status` in one transaction, setting missing signing dates
+        and, with `detach_projects`, removing them as active contracts of projects.
+        Returns the outcome of every distinct entered id in entered order."""
+
+        check_status(required_status)
+        check_status(new_status)
+        results: list[TransitionResultDTO] = []
+        with self._db_gateway.transaction():
+            for contract_id in dict.fromkeys(contract_ids):
+                contract = self._store.contracts.get(contract_id)
+                if contract is None:
+                    results.append(TransitionResultDTO(contract_id=contract_id, outcome="not_found"))
+                    continue
+                if contract.status != required_status:
+                    results.append(TransitionResultDTO(contract_id=contract_id, outcome="wrong_status"))
+                    continue
+                self._store.update_contract(
+                    replace(contract, status=new_status, signing_date=contract.signing_date or signing_date)
+                )
+                project_id = self._store.project_ids_by_active_contract.get(contract_id) if detach_projects else None
+                if project_id is not None:
+                    self._store.update_project(replace(self._store.projects[project_id], contract_id=None))
+                results.append(
+                    TransitionResultDTO(contract_id=contract_id, outcome="updated", detached_project_id=project_id)
+                )
+        return results
+
+    def import_records(self, records: Iterable[ContractsDTO]) -> ImportResultDTO:
+        """Imports contracts in one transaction. Rows with an empty or already existing name or unknown status
+        are reported, not inserted."""
+
+        imported = 0
+        rejected: list[tuple[int, str, str]] = []
+        with self._db_gateway.transaction():
+            for line_number, record in enumerate(records, start=1):
+                status = record.status or "draft"
+                if not record.name:
+                    rejected.append((line_number, "", "empty name"))
+                elif status not in STATUSES:
+                    rejected.append((line_number, record.name, "unknown status"))
+                elif record.name in self._store.contract_ids_by_name:
+                    rejected.append((line_number, record.name, "name already exists"))
+                else:
+                    self._store.insert_contract(replace(record, status=status, project_id=None))
+                    imported += 1
+        return ImportResultDTO(imported=imported, rejected=rejected)
+
+    def update_records(self, records: list[ContractsDTO], page_size: int = 100) -> BatchResultDTO:
+        """Updates contracts, reporting rows violating constraints, missing or changed since they were read
+        by their index in `records`."""
+
+        for record in records:
+            check_status(record.status)
+        failed: list[tuple[int, str]] = []
+        with self._db_gateway.transaction():
+            for index, record in enumerate(records):
+                try:
+                    new_version = self._store.update_contract(record)
+                except IntegrityError as err:
+                    failed.append((index, str(err)))
+                    continue
+                if new_version is None:
+                    message = f"Contract with ID {record.id} does not exist or has been changed by another user."
+                    failed.append((index, message))
+                else:
+                    record.version = new_version
+        return BatchResultDTO(written=len(records) - len(failed), failed=failed)
+
+    def get_summary(self) -> list[ContractSummaryDTO]:
+        """Gets contract counts and latest signing dates per status and project, calculated on every call."""
+
+        groups: dict[tuple[str, Optional[int]], list[Optional[date]]] = defaultdict(list)
+        with self._db_gateway.transaction():
+            for contract in self._store.contracts.values():
+                groups[(contract.status, contract.project_id)].append(to_date(contract.signing_date))
+        summary = [
+            ContractSummaryDTO(
+                status=status,
+                project_id=project_id,
+                contracts_count=len(signing_dates),
+                last_signing_date=max((value for value in signing_dates if value is not None), default=None),
+            )
+            for (status, project_id), signing_dates in groups.items()
+        ]
+        summary.sort(key=lambda row: (row.status, row.project_id is not None, row.project_id or 0))
+        return summary
+
+    def refresh_summary(self) -> None:
+        """Does nothing: summary of the in-memory backend is always up to date."""
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from psycopg2 import IntegrityError
+
+from data_access.dto import (
+    BatchResultDTO,
+    ImportResultDTO,
+    ProjectsDTO,
+    ProjectsFilterDTO,
+)
+from data_access.memory_gateway import in_date_range, select_page
+from errors import ConcurrentUpdateError, ValidationError
+
+from .projects import PROJECTS_ORDER_COLUMNS, ProjectsDAO
+
+if TYPE_CHECKING:
+    from data_access.memory_gateway import InMemoryGateway
+
+
+class InMemoryProjectsDAO(ProjectsDAO):
+    """ProjectsDAO of the in-memory backend: the same methods working with InMemoryGateway store."""
+
+    def __init__(self, db_gateway: InMemoryGateway) -> None:
+        super().__init__(db_gateway=db_gateway)
+        self._store = db_gateway.store
+
+    @staticmethod
+    def _matches(project: ProjectsDTO, filters: ProjectsFilterDTO) -> bool:
+        if filters.has_active_contract is not None and (project.contract_id is not None) != filters.has_active_contract:
+            return False
+        return in_date_range(project.creation_date, filters.created_from, filters.created_to)
+
+    def _filtered(self, filters: ProjectsFilterDTO) -> Iterator[ProjectsDTO]:
+        for project_id in self._store.project_ids:
+            project = self._store.projects[project_id]
+            if self._matches(project, filters):
+                yield project
+
+    def get_ids_list(self) -> list[tuple[int,]]:
+        """Gets ids of all projects."""
+
+        with self._db_gateway.transaction():
+            return [(project_id,) for project_id in self._store.project_ids]
+
+    def get_all_projects_info(self) -> list[ProjectsDTO]:
+        """Gets all projects."""
+
+        with self._db_gateway.transaction():
+            return [replace(self._store.projects[project_id]) for project_id in self._store.project_ids]
+
+    def iter_all_projects_info(self, itersize: int = 2000) -> Iterator[ProjectsDTO]:
+        """Yields all projects, copying `itersize` of them per transaction."""
+
+        position = 0
+        while True:
+            with self._db_gateway.transaction():
+                chunk_ids = self._store.project_ids[position : position + itersize]
+                chunk = [replace(self._store.projects[project_id]) for project_id in chunk_ids]
+            if not chunk:
+                return
+            position += len(chunk)
+            yield from chunk
+
+    def get_projects_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        before_id: Optional[int] = None,
+    ) -> list[ProjectsDTO]:
+        """Gets up to `limit` projects ordered by id, following after_id or preceding before_id."""
+
+        with self._db_gateway.transaction():
+            page = select_page(
+                ids=self._store.project_ids,
+                load=self._store.projects.__getitem__,
+                matches=lambda project: True,
+                limit=limit,
+                after_id=after_id,
+                before_id=before_id,
+            )
+            return [replace(project) for project in page]
+
+    def filter_records(self, filters: ProjectsFilterDTO) -> list[ProjectsDTO]:
+        """Gets projects matching all criteria of `filters`, sorted and limited."""
+
+        if filters.order_by not in PROJECTS_ORDER_COLUMNS:
+            raise ValidationError(f"[ERROR]: Projects can be sorted only by {', '.join(PROJECTS_ORDER_COLUMNS)}.")
+        with self._db_gateway.transaction():
+            found = [replace(project) for project in self._filtered(filters)]
+        if filters.order_by != "id":
+            found.sort(
+                key=lambda project: (
+                    getattr(project, filters.order_by) is None,
+                    getattr(project, filters.order_by),
+                    project.id,
+                ),
+                reverse=filters.descending,
+            )
+        elif filters.descending:
+            found.reverse()
+        return found[: filters.limit] if filters.limit is not None else found
+
+    def count_records(self, filters: ProjectsFilterDTO) -> int:
+        """Counts projects matching all criteria of `filters`."""
+
+        with self._db_gateway.transaction():
+            return sum(1 for _ in self._filtered(filters))
+
+    def any_records(self, filters: ProjectsFilterDTO) -> bool:
+        """Checks whether at least one project matches all criteria of `filters`."""
+
+        with self._db_gateway.transaction():
+            return next(self._filtered(filters), None) is not None
+
+    def search_by_name(self, text: str, limit: int = 20) -> list[ProjectsDTO]:
+        """Gets up to `limit` projects whose name contains entered text (case-insensitive),
+        names starting with it and shorter names first."""
+
+        needle = text.lower()
+        with self._db_gateway.transaction():
+            found = [replace(project) for project in self._store.projects.values() if needle in project.name.lower()]
+        found.sort(key=lambda project: (not project.name.lower().startswith(needle), len(project.name), project.id))
+        return found[:limit]
+
+    def create_record(self, data: ProjectsDTO) -> None:
+        """Creates project."""
+
+        with self._db_gateway.transaction():
+            self._store.insert_project(data)
+        print("Record successfully added!")
+
+    def create_records(self, records: list[ProjectsDTO], page_size: int = 100) -> BatchResultDTO:
+        """Creates projects, reporting rows violating constraints by their index in `records`."""
+
+        failed: list[tuple[int, str]] = []
+        with self._db_gateway.transaction():
+            for index, record in enumerate(records):
+                try:
+                    self._store.insert_project(record)
+                except IntegrityError as err:
+                    failed.append((index, str(err)))
+        return BatchResultDTO(written=len(records) - len(failed), failed=failed)
+
+    def get_info_by_id(self, entered_id: int) -> Optional[ProjectsDTO]:
+        """Gets copy of project with entered id."""
+
+        with self._db_gateway.transaction():
+            project = self._store.projects.get(entered_id)
+            return replace(project) if project else None
+
+    def update_record(self, data: ProjectsDTO) -> None:
+        """Updates project if its version has not changed, otherwise raises ConcurrentUpdateError."""
+
+        with self._db_gateway.transaction():
+            new_version = self._store.update_project(data)
+        if new_version is None:
+            raise ConcurrentUpdateError(
+                f"[ERROR]: Project with ID {data.id} has been changed or removed by another user, please try again."
+            )
+        data.version = new_version
+
+    def update_records(self, records: list[ProjectsDTO], page_size: int = 100) -> BatchResultDTO:
+        """Updates projects, reporting rows violating constraints, missing or changed since they were read
+        by their index in `records`."""
+
+        failed: list[tuple[int, str]] = []
+        with self._db_gateway.transaction():
+            for index, record in enumerate(records):
+                try:
+                    new_version = self._store.update_project(record)
+                except IntegrityError as err:
+                    failed.append((index, str(err)))
+                    continue
+                if new_version is None:
+                    message = f"Project with ID {record.id} does not exist or has been changed by another user."
+                    failed.append((index, message))
+                else:
+                    record.version = new_version
+        return BatchResultDTO(written=len(records) - len(failed), failed=failed)
+
+    def add_active_contract(self, project_id: int, contract_id: int) -> tuple[bool, bool, bool, bool]:
+        """Links active contract and project in one transaction.
+        Returns flags (contract is active, project exists, project has no active contract, contract was linked)."""
+
+        with self._db_gateway.transaction():
+            contract_is_active = contract_id in self._store.contract_ids_by_status["active"]
+            project = self._store.projects.get(project_id)
+            project_exists = project is not None
+            project_is_free = project is not None and project.contract_id is None
+            if not (contract_is_active and project is not None and project_is_free):
+                return contract_is_active, project_exists, project_is_free, False
+            contract = self._store.contracts[contract_id]
+            self._store.update_project(replace(project, contract_id=contract_id))
+            self._store.update_contract(replace(contract, project_id=project_id))
+        return True, True, True, True
+
+    def get_project_info_by_active_contract(self, contract_id: int) -> Optional[ProjectsDTO]:
+        """Gets info about project by active contract id."""
+
+        with self._db_gateway.transaction():
+            project_id = self._store.project_ids_by_active_contract.get(contract_id)
+            return replace(self._store.projects[project_id]) if project_id is not None else None
+
+    def import_records(self, records: Iterable[ProjectsDTO]) -> ImportResultDTO:
+        """Imports projects in one transaction. Rows with an empty or already existing name are reported,
+        not inserted."""
+
+        imported = 0
+        rejected: list[tuple[int, str, str]] = []
+        with self._db_gateway.transaction():
+            for line_number, record in enumerate(records, start=1):
+                if not record.name:
+                    rejected.append((line_number, "", "empty name"))
+                elif record.name in self._store.project_ids_by_name:
+                    rejected.append((line_number, record.name, "name already exists"))
+                else:
+                    self._store.insert_project(replace(record, contract_id=None))
+                    imported += 1
+        return ImportResultDTO(imported=imported, rejected=rejected)
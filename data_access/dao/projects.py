@@ -1,96 +1,315 @@
 from __future__ import annotations
 
-from typing import Optional
+from dataclasses import replace
+from itertools import starmap
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
 
-from psycopg2.errors import IntegrityError
+from data_access.cache import get_cache
+from data_access.dto import (
+    BatchResultDTO,
+    ImportResultDTO,
+    ProjectsDTO,
+    ProjectsFilterDTO,
+)
+from errors import ConcurrentUpdateError, ValidationError
 
-from data_access.dto import ProjectsDTO
+from .base import (
+    BaseDAO,
+    CopyStream,
+    build_filtered_query,
+    build_keyset_page_query,
+    build_name_search_query,
+    build_where_clause,
+)
+from .statuses import StatusesDAO
 
-from .base import BaseDAO
+if TYPE_CHECKING:
+    from data_access.interfaces import DBGatewayProtocol
+
+SELECT_PROJECTS_SQL = "SELECT name, active_contract_id, id, creation_date, version FROM projects"
+
+UPDATE_PROJECT_SQL = (
+    "UPDATE projects SET name = %s, active_contract_id = %s, version = version + 1 "
+    "WHERE id = %s AND version = %s RETURNING version;"
+)
+
+PROJECTS_ORDER_COLUMNS = {"id": "id", "name": "name", "creation_date": "creation_date"}
+
+ADD_ACTIVE_CONTRACT_SQL = (
+    "WITH project AS ("
+    "SELECT id, active_contract_id FROM projects WHERE id = %(project_id)s FOR UPDATE"
+    "), contract AS ("
+    "SELECT id FROM contracts WHERE id = %(contract_id)s AND status_id = %(active_status_id)s FOR UPDATE"
+    "), linked_project AS ("
+    "UPDATE projects SET active_contract_id = contract.id, version = projects.version + 1 FROM project, contract "
+    "WHERE projects.id = project.id AND project.active_contract_id IS NULL RETURNING projects.id"
+    "), linked_contract AS ("
+    "UPDATE contracts SET project_id = linked_project.id, version = contracts.version + 1 FROM linked_project "
+    "WHERE contracts.id = %(contract_id)s RETURNING contracts.id"
+    ") "
+    "SELECT EXISTS (SELECT 1 FROM contract), EXISTS (SELECT 1 FROM project), "
+    "EXISTS (SELECT 1 FROM project WHERE active_contract_id IS NULL), "
+    "EXISTS (SELECT 1 FROM linked_contract);"
+)
 
 
 class ProjectsDAO(BaseDAO):
     """Contains methods for working with the "projects" table from the database."""
 
+    def __init__(self, db_gateway: DBGatewayProtocol) -> None:
+        super().__init__(db_gateway=db_gateway)
+        self._statuses = StatusesDAO(db_gateway=db_gateway)
+        self._cache = get_cache(db_gateway, "projects")
+        self._contracts_cache = get_cache(db_gateway, "contracts")
+
     def get_ids_list(self) -> list[tuple[int,]]:
         """Gets ids from projects table."""
 
-        self._db_gateway.cursor.execute("SELECT id FROM projects;")
-        final_result: list[tuple[int,]] = self._db_gateway.cursor.fetchall()
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute("SELECT id FROM projects;")
+            final_result: list[tuple[int,]] = cursor.fetchall()
         return final_result
 
     def get_all_projects_info(self) -> list[ProjectsDTO]:
         """Gets all data from projects table."""
 
-        self._db_gateway.cursor.execute("SELECT * FROM projects;")
-        fetched_list: list[tuple] = self._db_gateway.cursor.fetchall()
-        final_dto_list: list[ProjectsDTO] = []
-        for row in fetched_list:
-            project_id, name, creation_date, contract_id = row
-            row_dto = ProjectsDTO(
-                id=project_id,
-                name=name,
-                creation_date=creation_date,
-                contract_id=contract_id,
-            )
-            final_dto_list.append(row_dto)
-        return final_dto_list
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(f"{SELECT_PROJECTS_SQL};")
+            fetched_list: list[tuple] = cursor.fetchall()
+        return list(starmap(ProjectsDTO, fetched_list))
+
+    def iter_all_projects_info(self, itersize: int = 2000) -> Iterator[ProjectsDTO]:
+        """Yields all data from projects table, fetching `itersize` rows per round-trip from a server-side cursor."""
+
+        with self._db_gateway.server_side_cursor(itersize=itersize) as cursor:
+            cursor.execute(f"{SELECT_PROJECTS_SQL} ORDER BY id;")
+            yield from starmap(ProjectsDTO, cursor)
+
+    def get_projects_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        before_id: Optional[int] = None,
+    ) -> list[ProjectsDTO]:
+        """Gets up to `limit` projects ordered by id using keyset pagination.
+        Projects with id greater than after_id (next page) or less than before_id (previous page) are selected."""
+
+        query, params, is_reversed = build_keyset_page_query(
+            select_sql=SELECT_PROJECTS_SQL,
+            id_column="id",
+            limit=limit,
+            after_id=after_id,
+            before_id=before_id,
+        )
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(query, params)
+            fetched_list: list[tuple] = cursor.fetchall()
+        page = list(starmap(ProjectsDTO, fetched_list))
+        if is_reversed:
+            page.reverse()
+        return page
+
+    @staticmethod
+    def _filter_conditions(filters: ProjectsFilterDTO) -> list[tuple[str, Any]]:
+        conditions: list[tuple[str, Any]] = []
+        if filters.has_active_contract is not None:
+            conditions.append(("(active_contract_id IS NOT NULL) = %s", filters.has_active_contract))
+        if filters.created_from is not None:
+            conditions.append(("creation_date >= %s", filters.created_from))
+        if filters.created_to is not None:
+            conditions.append(("creation_date <= %s", filters.created_to))
+        return conditions
+
+    def filter_records(self, filters: ProjectsFilterDTO) -> list[ProjectsDTO]:
+        """Gets projects matching all criteria of `filters`, sorted and limited in the database."""
+
+        order_column = PROJECTS_ORDER_COLUMNS.get(filters.order_by)
+        if order_column is None:
+            raise ValidationError(f"[ERROR]: Projects can be sorted only by {', '.join(PROJECTS_ORDER_COLUMNS)}.")
+        query, params = build_filtered_query(
+            select_sql=SELECT_PROJECTS_SQL,
+            conditions=self._filter_conditions(filters),
+            order_column=order_column,
+            id_column="id",
+            descending=filters.descending,
+            limit=filters.limit,
+        )
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(query, params)
+            fetched_list: list[tuple] = cursor.fetchall()
+        return list(starmap(ProjectsDTO, fetched_list))
+
+    def count_records(self, filters: ProjectsFilterDTO) -> int:
+        """Counts projects matching all criteria of `filters` (sorting and limit are ignored)."""
+
+        where_clause, params = build_where_clause(self._filter_conditions(filters))
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(f"SELECT count(*) FROM projects{where_clause};", params)
+            count: int = cursor.fetchone()[0]
+        return count
+
+    def any_records(self, filters: ProjectsFilterDTO) -> bool:
+        """Checks whether at least one project matches all criteria of `filters`, stopping at the first match."""
+
+        where_clause, params = build_where_clause(self._filter_conditions(filters))
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(f"SELECT EXISTS (SELECT 1 FROM projects{where_clause});", params)
+            is_existing: bool = cursor.fetchone()[0]
+        return is_existing
+
+    def search_by_name(self, text: str, limit: int = 20) -> list[ProjectsDTO]:
+        """Gets up to `limit` projects whose name contains entered text or is similar to it, best matches first."""
+
+        query, params = build_name_search_query(
+            select_sql=SELECT_PROJECTS_SQL,
+            name_column="name",
+            id_column="id",
+            text=text,
+            limit=limit,
+        )
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(query, params)
+            fetched_list: list[tuple] = cursor.fetchall()
+        return list(starmap(ProjectsDTO, fetched_list))
 
     def create_record(self, data: ProjectsDTO) -> None:
-        """Creates record in table 'projects'."""
+        """Creates record in table 'projects'. Cache needs no invalidation: missing ids are never cached."""
 
-        try:
-            self._db_gateway.cursor.execute(
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(
                 "INSERT INTO projects (name, active_contract_id) VALUES " "(%s, %s);",
                 (data.name, data.contract_id),
             )
-        except IntegrityError:
-            self._db_gateway.connection.rollback()
-            raise
-        else:
-            print("Record successfully added!")
-            self._db_gateway.connection.commit()
+        print("Record successfully added!")
 
-    def get_info_by_id(self, entered_id: int) -> Optional[ProjectsDTO]:
-        """Gets info about project with entered id."""
+    def create_records(self, records: list[ProjectsDTO], page_size: int = 100) -> BatchResultDTO:
+        """Creates records in table 'projects' in one transaction, sending `page_size` rows per statement.
+        Rows violating constraints are reported by their index in `records`, the rest are created."""
 
-        self._db_gateway.cursor.execute("SELECT * FROM projects " "WHERE id = %s;", (entered_id,))
-        fetched_tuple: tuple = self._db_gateway.cursor.fetchone()
-        if fetched_tuple:
-            project_id_from_db, name, creation_date, active_contract_id = fetched_tuple
-            return ProjectsDTO(
-                id=project_id_from_db,
-                name=name,
-                creation_date=creation_date,
-                contract_id=active_contract_id,
+        with self._db_gateway.transaction() as cursor:
+            returned, failed = self._execute_values_in_pages(
+                cursor=cursor,
+                sql="INSERT INTO projects (name, active_contract_id) VALUES %s RETURNING id;",
+                rows=[(record.name, record.contract_id) for record in records],
+                page_size=page_size,
             )
+        return BatchResultDTO(written=len(returned), failed=failed)
+
+    def _load_info(self, entered_id: int) -> Optional[ProjectsDTO]:
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(f"{SELECT_PROJECTS_SQL} WHERE id = %s;", (entered_id,))
+            fetched_tuple: tuple = cursor.fetchone()
+        if fetched_tuple:
+            return ProjectsDTO(*fetched_tuple)
         else:
             return None
 
+    def get_info_by_id(self, entered_id: int) -> Optional[ProjectsDTO]:
+        """Gets info about project with entered id through the read-through cache.
+        Returns a copy, so callers may change it freely."""
+
+        project_info = self._cache.get_or_load(entered_id, lambda: self._load_info(entered_id))
+        return replace(project_info) if project_info else None
+
     def update_record(self, data: ProjectsDTO) -> None:
-        """Updates record in the database."""
-        try:
-            self._db_gateway.cursor.execute(
-                "UPDATE projects SET name = %s, active_contract_id = %s " "WHERE id = %s;",
-                (data.name, data.contract_id, data.id),
+        """Updates record in the database if it has not been changed since `data` was read (versions match),
+        otherwise raises ConcurrentUpdateError. On success `data.version` is set to the new version."""
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(UPDATE_PROJECT_SQL, (data.name, data.contract_id, data.id, data.version))
+            updated_row: Optional[tuple[int]] = cursor.fetchone()
+        self._cache.invalidate(data.id)
+        if not updated_row:
+            raise ConcurrentUpdateError(
+                f"[ERROR]: Project with ID {data.id} has been changed or removed by another user, please try again."
             )
-        except IntegrityError:
-            self._db_gateway.connection.rollback()
-            raise
-        else:
-            self._db_gateway.connection.commit()
+        data.version = updated_row[0]
+
+    def update_records(self, records: list[ProjectsDTO], page_size: int = 100) -> BatchResultDTO:
+        """Updates records in the database in one transaction, sending `page_size` rows per statement.
+        Rows violating constraints, missing in the database or changed since they were read (versions differ)
+        are reported by their index in `records`."""
+
+        with self._db_gateway.transaction() as cursor:
+            returned, failed = self._execute_values_in_pages(
+                cursor=cursor,
+                sql="UPDATE projects SET name = data.name, active_contract_id = data.active_contract_id, "
+                "version = projects.version + 1 "
+                "FROM (VALUES %s) AS data (id, name, active_contract_id, version) "
+                "WHERE projects.id = data.id AND projects.version = data.version "
+                "RETURNING projects.id, projects.version;",
+                rows=[(record.id, record.name, record.contract_id, record.version) for record in records],
+                page_size=page_size,
+                template="(%s::int, %s, %s::int, %s::int)",
+            )
+        new_versions: dict[int, int] = {row[0]: row[1] for row in returned}
+        updated_ids = set(new_versions)
+        for project_id in updated_ids:
+            self._cache.invalidate(project_id)
+        failed_indexes = {index for index, _ in failed}
+        for index, record in enumerate(records):
+            if record.id in updated_ids:
+                record.version = new_versions[record.id]
+            elif index not in failed_indexes:
+                message = f"Project with ID {record.id} does not exist or has been changed by another user."
+                failed.append((index, message))
+        failed.sort()
+        return BatchResultDTO(written=len(updated_ids), failed=failed)
+
+    def add_active_contract(self, project_id: int, contract_id: int) -> tuple[bool, bool, bool, bool]:
+        """Links active contract and project with one statement in one transaction, locking both rows.
+        Returns flags (contract is active, project exists, project has no active contract, contract was linked)."""
+
+        # Looked up before the transaction: on a cold cache it takes a pooled connection of its own.
+        active_status_id = self._statuses.get_status_id("active")
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(
+                ADD_ACTIVE_CONTRACT_SQL,
+                {"project_id": project_id, "contract_id": contract_id, "active_status_id": active_status_id},
+            )
+            contract_is_active, project_exists, project_is_free, is_linked = cursor.fetchone()
+        if is_linked:
+            self._cache.invalidate(project_id)
+            self._contracts_cache.invalidate(contract_id)
+        return contract_is_active, project_exists, project_is_free, is_linked
 
     def get_project_info_by_active_contract(self, contract_id: int) -> Optional[ProjectsDTO]:
         """Gets info about project by active contract id."""
 
-        self._db_gateway.cursor.execute("SELECT * FROM projects " "WHERE active_contract_id = %s;", (contract_id,))
-        fetched_tuple: tuple = self._db_gateway.cursor.fetchone()
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(f"{SELECT_PROJECTS_SQL} WHERE active_contract_id = %s;", (contract_id,))
+            fetched_tuple: tuple = cursor.fetchone()
         if fetched_tuple:
-            project_id_from_db, name, creation_date, active_contract_id = fetched_tuple
-            return ProjectsDTO(
-                id=project_id_from_db,
-                name=name,
-                creation_date=creation_date,
-                contract_id=active_contract_id,
-            )
+            return ProjectsDTO(*fetched_tuple)
         return None
+
+    def import_records(self, records: Iterable[ProjectsDTO]) -> ImportResultDTO:
+        """Imports projects in one transaction: streams them with COPY into a staging table, then moves valid ones
+        into 'projects'. Rows with an empty or already existing name are reported, not inserted."""
+
+        rows = ((line_number, record.name or None) for line_number, record in enumerate(records, start=1))
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute("CREATE TEMP TABLE projects_import (line_number BIGINT, name TEXT) ON COMMIT DROP;")
+            cursor.copy_expert(
+                "COPY projects_import (line_number, name) FROM STDIN WITH (FORMAT csv);",
+                CopyStream(rows),
+            )
+            cursor.execute(
+                "WITH candidates AS ("
+                "SELECT DISTINCT ON (name) line_number, name FROM projects_import "
+                "WHERE name IS NOT NULL ORDER BY name, line_number"
+                "), inserted AS ("
+                "INSERT INTO projects (name) SELECT name FROM candidates "
+                "ON CONFLICT (name) DO NOTHING RETURNING name"
+                ") "
+                "SELECT line_number, COALESCE(name, ''), "
+                "CASE WHEN name IS NULL THEN 'empty name' ELSE 'name already exists' END "
+                "FROM projects_import "
+                "WHERE NOT EXISTS ("
+                "SELECT 1 FROM candidates JOIN inserted ON inserted.name = candidates.name "
+                "WHERE candidates.line_number = projects_import.line_number"
+                ") ORDER BY line_number;"
+            )
+            rejected: list[tuple[int, str, str]] = cursor.fetchall()
+            cursor.execute("SELECT count(*) FROM projects_import;")
+            staged_count: int = cursor.fetchone()[0]
+        return ImportResultDTO(imported=staged_count - len(rejected), rejected=rejected)
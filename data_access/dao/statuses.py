@@ -1,15 +1,57 @@
 from __future__ import annotations
 
+import threading
+from typing import ClassVar, Optional
+
+from errors import IncorrectStatusError
+
 from .base import BaseDAO
 
 
 class StatusesDAO(BaseDAO):
-    """Contains methods for working with the "Statuses" table from the database."""
+    """Contains methods for working with the "Statuses" table from the database.
+    The table is effectively static, so the name-id mapping is loaded once and shared by the whole process.
+    Call invalidate_cache() after changing the table."""
+
+    _cache: ClassVar[Optional[dict[str, int]]] = None
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def _get_statuses(self) -> dict[str, int]:
+        """Gets cached name-id mapping of statuses, loading it from the database on first use."""
+
+        statuses = StatusesDAO._cache
+        if statuses is None:
+            with StatusesDAO._cache_lock:
+                statuses = StatusesDAO._cache
+                if statuses is None:
+                    with self._db_gateway.transaction() as cursor:
+                        cursor.execute("SELECT name, id FROM statuses;")
+                        statuses = {name: int(status_id) for name, status_id in cursor.fetchall()}
+                    StatusesDAO._cache = statuses
+        return statuses
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drops cached statuses, so they are reloaded from the database on next use."""
+
+        with cls._cache_lock:
+            StatusesDAO._cache = None
 
     def get_status_id(self, status_name: str) -> int:
         """Gets the status ID with entered status_name."""
 
-        self._db_gateway.cursor.execute("SELECT id FROM statuses WHERE name = (%s);", (status_name,))
-        tuple_res = self._db_gateway.cursor.fetchone()
-        status_id = int(tuple_res[0])
+        status_id = self._get_statuses().get(status_name)
+        if status_id is None:
+            self.invalidate_cache()
+            status_id = self._get_statuses().get(status_name)
+        if status_id is None:
+            raise IncorrectStatusError(f"[ERROR]: Status '{status_name}' does not exist.")
         return status_id
+
+    def get_status_name(self, status_id: int) -> str:
+        """Gets the status name with entered status_id."""
+
+        for name, cached_id in self._get_statuses().items():
+            if cached_id == status_id:
+                return name
+        raise IncorrectStatusError(f"[ERROR]: Status with ID {status_id} does not exist.")
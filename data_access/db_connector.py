@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 
-import psycopg2
+from psycopg2 import InterfaceError, OperationalError
+from psycopg2.pool import ThreadedConnectionPool
+
+from data_access.instrumentation import InstrumentedCursor, QueryStats
+from data_access.prepared_statements import PreparingConnection
+from errors import PoolTimeoutError
 
 if TYPE_CHECKING:
     from psycopg2 import connection, cursor
 
 
-class PostgreSQLGateway:
-    """Creates PostgreSQL connection and cursor objects to the database using passed parameters.
+class PostgreSQLPoolGateway:
+    """Hands out PostgreSQL connections from a bounded pool, one connection per operation.
     :param db_name: name of PostgreSQL database
     :type db_name: str
     :param db_user: name of the user who can work with the transferred PostgreSQL database
@@ -20,29 +29,142 @@ class PostgreSQLGateway:
     :type db_host: str
     :param db_port: port of the PostgreSQL database
     :type db_host: str
+    :param min_size: number of connections opened in advance
+    :type min_size: int
+    :param max_size: maximum number of simultaneously opened connections
+    :type max_size: int
+    :param acquire_timeout: seconds to wait for a free connection before PoolTimeoutError is raised
+    :type acquire_timeout: float
+    :param health_check_interval: connections idle longer than this number of seconds are pinged before use
+    :type health_check_interval: float
+    :param query_stats: collector of executed statements statistics, None disables instrumentation
+    :type query_stats: Optional[QueryStats]
+    :param prepare_statements: execute DAO statements as server-side prepared statements, prepared once per connection
+    :type prepare_statements: bool
+    :param lazy_connect: create the pool and open its first connections on the first transaction, not in the constructor
+    :type lazy_connect: bool
     """
 
-    def __init__(self, db_name: str, db_password: str, db_user: str, db_host: str, db_port: str) -> None:
-        self._db_name = db_name
-        self._db_password = db_password
-        self._db_user = db_user
-        self._db_host = db_host
-        self._db_port = db_port
-        self.connection = self._create_connection()
-        self.cursor = self._create_cursor()
-
-    def _create_connection(self) -> connection:
-        """Creates PostgreSQL connection object."""
-        conn = psycopg2.connect(
-            database=self._db_name,
-            user=self._db_user,
-            password=self._db_password,
-            host=self._db_host,
-            port=self._db_port,
-        )
-        with conn as connection:
-            return connection
-
-    def _create_cursor(self) -> cursor:
-        """Creates PostgreSQL cursor object."""
-        return self.connection.cursor()
+    def __init__(
+        self,
+        db_name: str,
+        db_password: str,
+        db_user: str,
+        db_host: str,
+        db_port: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        acquire_timeout: float = 30.0,
+        health_check_interval: float = 30.0,
+        query_stats: Optional[QueryStats] = None,
+        prepare_statements: bool = False,
+        lazy_connect: bool = False,
+    ) -> None:
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1.")
+        self._query_stats = query_stats
+        self._acquire_timeout = acquire_timeout
+        self._health_check_interval = health_check_interval
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._last_used: dict[int, float] = {}
+        self._pool_options: dict[str, Any] = {
+            "minconn": min_size,
+            "maxconn": max_size,
+            "database": db_name,
+            "user": db_user,
+            "password": db_password,
+            "host": db_host,
+            "port": db_port,
+            "connection_factory": PreparingConnection if prepare_statements else None,
+        }
+        self._pool_lock = threading.Lock()
+        self._pool: Optional[ThreadedConnectionPool] = None
+        if not lazy_connect:
+            self._pool = ThreadedConnectionPool(**self._pool_options)
+
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """Returns the pool, creating it on first use in lazy mode."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadedConnectionPool(**self._pool_options)
+        return self._pool
+
+    @staticmethod
+    def _is_alive(conn: connection) -> bool:
+        """Checks that connection is still usable by sending a trivial query."""
+        if conn.closed:
+            return False
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1;")
+            conn.rollback()
+        except (OperationalError, InterfaceError):
+            return False
+        return True
+
+    def _acquire_connection(self) -> connection:
+        """Takes connection from the pool. Broken idle connections are closed and the next one is taken, up to the
+        pool size, so after a database restart all stale connections are replaced with new ones."""
+        if not self._slots.acquire(timeout=self._acquire_timeout):
+            raise PoolTimeoutError(f"[ERROR]: No free database connection within {self._acquire_timeout} seconds.")
+        try:
+            pool = self._get_pool()
+            # Every idle connection may be stale, the attempt after them gets a new connection from the pool.
+            for _ in range(self._pool_options["maxconn"] + 1):
+                conn = pool.getconn()
+                idle_time = time.monotonic() - self._last_used.get(id(conn), 0.0)
+                if not conn.closed and (idle_time <= self._health_check_interval or self._is_alive(conn)):
+                    return conn
+                self._release_connection(conn, broken=True, release_slot=False)
+            raise OperationalError("[ERROR]: No working database connection in the pool.")
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _release_connection(self, conn: connection, broken: bool, release_slot: bool = True) -> None:
+        """Returns connection to the pool, closing it if it is broken."""
+        try:
+            if broken:
+                self._last_used.pop(id(conn), None)
+            else:
+                self._last_used[id(conn)] = time.monotonic()
+            self._get_pool().putconn(conn, close=broken)
+        finally:
+            if release_slot:
+                self._slots.release()
+
+    @contextmanager
+    def transaction(self) -> Iterator[cursor]:
+        """Yields a cursor of a pooled connection, commits on exit and rolls back on error."""
+        conn = self._acquire_connection()
+        broken = False
+        try:
+            with conn.cursor() as cur:
+                yield cur if self._query_stats is None else InstrumentedCursor(cur, self._query_stats)
+            conn.commit()
+        except (OperationalError, InterfaceError):
+            broken = True
+            raise
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._release_connection(conn, broken=broken or bool(conn.closed))
+
+    @contextmanager
+    def server_side_cursor(self, itersize: int) -> Iterator[cursor]:
+        """Yields a named (server-side) cursor that fetches `itersize` rows per network round-trip.
+        The pooled connection stays checked out until the cursor is exhausted or closed."""
+        with self.transaction() as cur:
+            with cur.connection.cursor(name=f"stream_{uuid.uuid4().hex}") as named_cursor:
+                named_cursor.itersize = itersize
+                if self._query_stats is None:
+                    yield named_cursor
+                else:
+                    yield InstrumentedCursor(named_cursor, self._query_stats)
+
+    def close(self) -> None:
+        """Closes all connections of the pool, if it has been created."""
+        if self._pool is not None:
+            self._pool.closeall()
@@ -1,4 +1,18 @@
 from .contracts import ContractsDTO
+from .filters import ContractsFilterDTO, ProjectsFilterDTO
+from .imports import BatchResultDTO, ImportResultDTO
 from .projects import ProjectsDTO
+from .summary import ContractSummaryDTO
+from .transitions import TRANSITION_OUTCOMES, TransitionResultDTO
 
-__all__ = ["ProjectsDTO", "ContractsDTO"]
+__all__ = [
+    "ProjectsDTO",
+    "ContractsDTO",
+    "ImportResultDTO",
+    "BatchResultDTO",
+    "ContractSummaryDTO",
+    "ContractsFilterDTO",
+    "ProjectsFilterDTO",
+    "TransitionResultDTO",
+    "TRANSITION_OUTCOMES",
+]
@@ -1,13 +1,20 @@
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
 from typing import Optional
 
 
-@dataclass
+def _utc_now() -> datetime:
+    return datetime.now(tz=timezone.utc)
+
+
+@dataclass(slots=True)
 class ContractsDTO:
+    """Field order matches the column order of contract SELECT queries, so rows can be unpacked positionally."""
+
     name: str
     status: str = "draft"
     id: Optional[int] = None
-    signing_date: Optional[datetime] = None
-    creation_date: datetime = datetime.now(tz=timezone.utc)
+    signing_date: Optional[date] = None
+    creation_date: date = field(default_factory=_utc_now)
     project_id: Optional[int] = None
+    version: int = 1
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(slots=True)
+class ContractsFilterDTO:
+    """Criteria of contract queries; None means the criterion is not applied. Date ranges include both bounds."""
+
+    status: Optional[str] = None
+    project_id: Optional[int] = None
+    is_signed: Optional[bool] = None
+    signed_from: Optional[datetime] = None
+    signed_to: Optional[datetime] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    order_by: str = "id"
+    descending: bool = False
+    limit: Optional[int] = None
+
+
+@dataclass(slots=True)
+class ProjectsFilterDTO:
+    """Criteria of project queries; None means the criterion is not applied. Date ranges include both bounds."""
+
+    has_active_contract: Optional[bool] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    order_by: str = "id"
+    descending: bool = False
+    limit: Optional[int] = None
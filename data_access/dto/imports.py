@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class ImportResultDTO:
+    imported: int = 0
+    rejected: list[tuple[int, str, str]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class BatchResultDTO:
+    written: int = 0
+    failed: list[tuple[int, str]] = field(default_factory=list)
@@ -1,11 +1,18 @@
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
 from typing import Optional
 
 
-@dataclass
+def _utc_now() -> datetime:
+    return datetime.now(tz=timezone.utc)
+
+
+@dataclass(slots=True)
 class ProjectsDTO:
+    """Field order matches the column order of project SELECT queries, so rows can be unpacked positionally."""
+
     name: str
     contract_id: Optional[int] = None
     id: Optional[int] = None
-    creation_date: datetime = datetime.now(tz=timezone.utc)
+    creation_date: date = field(default_factory=_utc_now)
+    version: int = 1
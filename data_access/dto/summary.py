@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+
+@dataclass(slots=True)
+class ContractSummaryDTO:
+    status: str
+    project_id: Optional[int]
+    contracts_count: int
+    last_signing_date: Optional[date]
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Optional
+
+TRANSITION_OUTCOMES = ("updated", "not_found", "wrong_status")
+
+
+@dataclass(slots=True)
+class TransitionResultDTO:
+    """Outcome of a bulk status transition for one contract: 'updated', 'not_found' or 'wrong_status'
+    (the contract did not have the required status). Field order matches the columns returned by the statement."""
+
+    contract_id: int
+    outcome: str
+    detached_project_id: Optional[int] = None
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import logging
+import re
+import sys
+import threading
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from types import FrameType
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Union
+
+if TYPE_CHECKING:
+    from psycopg2 import cursor
+
+logger = logging.getLogger("data_access.queries")
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])\d+(?:\.\d+)?\b")
+_VALUES_LIST = re.compile(r"\((?:\?|NULL)(?:, ?(?:\?|NULL))*\)(?:, ?\((?:\?|NULL)(?:, ?(?:\?|NULL))*\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Replaces literals with '?' and collapses whitespace, so statements differing only in values are grouped."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _VALUES_LIST.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+_normalize_template = lru_cache(maxsize=1024)(normalize_statement)
+
+
+def _find_caller() -> str:
+    """Finds the nearest DAO (or migration runner) method on the call stack."""
+    frame: Optional[FrameType] = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(("data_access.dao", "data_access.migrations")):
+            owner = frame.f_locals.get("self")
+            return f"{type(owner).__name__}.{frame.f_code.co_name}" if owner else frame.f_code.co_name
+        frame = frame.f_back
+    return "unknown"
+
+
+class _QueryHistogram:
+    __slots__ = ("caller", "bucket_counts", "count", "total_seconds", "max_seconds", "rows", "params_count")
+
+    def __init__(self, caller: str, params_count: int) -> None:
+        self.caller = caller
+        self.params_count = params_count
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.rows = 0
+
+
+class QueryStats:
+    """Aggregates executed statements into per-statement latency histograms and logs slow queries.
+    :param slow_query_threshold: statements running at least this number of seconds are logged, None disables log
+    :type slow_query_threshold: Optional[float]
+    """
+
+    def __init__(self, slow_query_threshold: Optional[float] = None) -> None:
+        self.slow_query_threshold = slow_query_threshold
+        self._histograms: dict[str, _QueryHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: Union[str, bytes], params_count: int, duration: float, rows: int) -> None:
+        caller = _find_caller()
+        if isinstance(statement, bytes):
+            statement = statement.decode(errors="replace")
+        normalized = _normalize_template(statement) if len(statement) <= 4096 else normalize_statement(statement)
+        with self._lock:
+            histogram = self._histograms.get(normalized)
+            if histogram is None:
+                histogram = self._histograms[normalized] = _QueryHistogram(caller=caller, params_count=params_count)
+            histogram.bucket_counts[bisect_left(LATENCY_BUCKETS, duration)] += 1
+            histogram.count += 1
+            histogram.total_seconds += duration
+            histogram.max_seconds = max(histogram.max_seconds, duration)
+            histogram.rows += max(rows, 0)
+        if self.slow_query_threshold is not None and duration >= self.slow_query_threshold:
+            logger.warning("Slow query (%.1f ms, %s rows) in %s: %s", duration * 1000, rows, caller, normalized)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Gets aggregated statistics of every statement ordered by total execution time."""
+        with self._lock:
+            items = [
+                {
+                    "statement": statement,
+                    "caller": histogram.caller,
+                    "params_count": histogram.params_count,
+                    "calls": histogram.count,
+                    "rows": histogram.rows,
+                    "total_ms": round(histogram.total_seconds * 1000, 3),
+                    "mean_ms": round(histogram.total_seconds * 1000 / histogram.count, 3),
+                    "max_ms": round(histogram.max_seconds * 1000, 3),
+                    "buckets": list(histogram.bucket_counts),
+                }
+                for statement, histogram in self._histograms.items()
+            ]
+        return sorted(items, key=lambda item: item["total_ms"], reverse=True)
+
+    def format_table(self) -> str:
+        """Formats statistics as plain text table for CLI output."""
+        lines = [f"{'calls':>8} {'total ms':>12} {'mean ms':>10} {'max ms':>10} {'rows':>10}  caller / statement"]
+        for item in self.snapshot():
+            lines.append(
+                f"{item['calls']:>8} {item['total_ms']:>12} {item['mean_ms']:>10} {item['max_ms']:>10} "
+                f"{item['rows']:>10}  {item['caller']}: {item['statement'][:200]}"
+            )
+        return "\n".join(lines)
+
+    def to_prometheus(self) -> str:
+        """Exports statistics as Prometheus text exposition format histograms."""
+        name = "db_query_duration_seconds"
+        lines = [f"# HELP {name} Duration of database statements.", f"# TYPE {name} histogram"]
+        rows_lines = [
+            "# HELP db_query_rows_total Rows returned or affected by statements.",
+            "# TYPE db_query_rows_total counter",
+        ]
+        for item in self.snapshot():
+            statement = item["statement"][:200].replace("\\", "\\\\").replace('"', '\\"')
+            labels = f'caller="{item["caller"]}",statement="{statement}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, item["buckets"]):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {item["calls"]}')
+            lines.append(f"{name}_sum{{{labels}}} {item['total_ms'] / 1000}")
+            lines.append(f"{name}_count{{{labels}}} {item['calls']}")
+            rows_lines.append(f"db_query_rows_total{{{labels}}} {item['rows']}")
+        return "\n".join(lines + rows_lines) + "\n"
+
+
+class InstrumentedCursor:
+    """Proxy of psycopg2 cursor recording every executed statement in QueryStats."""
+
+    def __init__(self, wrapped_cursor: cursor, stats: QueryStats) -> None:
+        self._cursor = wrapped_cursor
+        self._stats = stats
+
+    def execute(self, query: Union[str, bytes], params: Optional[Any] = None) -> None:
+        started = time.perf_counter()
+        try:
+            self._cursor.execute(query, params)
+        finally:
+            self._stats.record(
+                statement=query,
+                params_count=len(params) if params else 0,
+                duration=time.perf_counter() - started,
+                rows=self._cursor.rowcount,
+            )
+
+    def copy_expert(self, sql: str, file: Any, size: int = 8192) -> None:
+        started = time.perf_counter()
+        try:
+            self._cursor.copy_expert(sql, file, size)
+        finally:
+            self._stats.record(
+                statement=sql,
+                params_count=0,
+                duration=time.perf_counter() - started,
+                rows=self._cursor.rowcount,
+            )
+
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(self._cursor)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
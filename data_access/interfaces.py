@@ -1,13 +1,49 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    Callable,
+    ContextManager,
+    Hashable,
+    Protocol,
+)
 
 if TYPE_CHECKING:
-    from psycopg2 import connection, cursor  # noqa: F401
+    from psycopg2 import cursor  # noqa: F401
+
+    from data_access.async_db_connector import AsyncCursor  # noqa: F401
 
 
 class DBGatewayProtocol(Protocol):
-    """Describes interface of object that creates cursor and connection objects for working with the database."""
+    """Describes interface of object that hands out cursor objects for working with the database."""
+
+    def transaction(self) -> ContextManager[cursor]:
+        """Returns context manager yielding a cursor; commits on exit and rolls back on error."""
+
+    def server_side_cursor(self, itersize: int) -> ContextManager[cursor]:
+        """Returns context manager yielding a named cursor that fetches `itersize` rows per round-trip."""
+
+
+class AsyncDBGatewayProtocol(Protocol):
+    """Describes interface of object that hands out asynchronous cursor objects for working with the database."""
+
+    def transaction(self) -> AsyncContextManager[AsyncCursor]:
+        """Returns async context manager yielding a cursor; commits on exit and rolls back on error."""
+
+
+class CacheProtocol(Protocol):
+    """Describes interface of read-through cache placed in front of DAO lookups by id."""
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Gets cached value or loads, caches and returns it."""
+
+    def invalidate(self, key: Hashable) -> None:
+        """Removes cached value."""
+
+    def clear(self) -> None:
+        """Removes all cached values."""
 
-    cursor: cursor
-    connection: connection
+    def stats(self) -> dict[str, int]:
+        """Gets hit, miss and eviction counters."""
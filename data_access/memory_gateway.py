@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import date, datetime
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from psycopg2 import IntegrityError
+
+from data_access.dto import ContractsDTO, ProjectsDTO
+from errors import IncorrectStatusError
+
+STATUSES = ("draft", "active", "completed")
+
+T = TypeVar("T")
+
+
+def to_date(value: Optional[date]) -> Optional[date]:
+    """Truncates datetime to date, as PostgreSQL does when it is stored into DATE column."""
+    return value.date() if isinstance(value, datetime) else value
+
+
+def in_date_range(value: Optional[date], start: Optional[date], end: Optional[date]) -> bool:
+    """Checks value against inclusive bounds compared by date; like NULL in SQL, missing value matches no bound."""
+    lower, upper, value = to_date(start), to_date(end), to_date(value)
+    if lower is None and upper is None:
+        return True
+    return value is not None and (lower is None or value >= lower) and (upper is None or value <= upper)
+
+
+def check_status(status_name: str) -> None:
+    if status_name not in STATUSES:
+        raise IncorrectStatusError(f"[ERROR]: Status '{status_name}' does not exist.")
+
+
+def select_page(
+    ids: list[int],
+    load: Callable[[int], T],
+    matches: Callable[[T], bool],
+    limit: int,
+    after_id: Optional[int] = None,
+    before_id: Optional[int] = None,
+) -> list[T]:
+    """In-memory counterpart of build_keyset_page_query: selects up to `limit` matching rows with id greater than
+    after_id or less than before_id from ascending `ids`, returned in ascending order."""
+
+    start = bisect_right(ids, after_id) if after_id is not None else 0
+    end = bisect_left(ids, before_id) if before_id is not None else len(ids)
+    positions = range(end - 1, start - 1, -1) if before_id is not None and after_id is None else range(start, end)
+    page: list[T] = []
+    for position in positions:
+        row = load(ids[position])
+        if matches(row):
+            page.append(row)
+            if len(page) >= limit:
+                break
+    if positions.step < 0:
+        page.reverse()
+    return page
+
+
+def _unique_violation(table: str, column: str, value: Any) -> IntegrityError:
+    return IntegrityError(
+        f'duplicate key value violates unique constraint "{table}_{column}_key"\n'
+        f"DETAIL:  Key ({column})=({value}) already exists.\n"
+    )
+
+
+def _foreign_key_violation(table: str, column: str, value: Any, referenced_table: str) -> IntegrityError:
+    return IntegrityError(
+        f'insert or update on table "{table}" violates foreign key constraint\n'
+        f'DETAIL:  Key ({column})=({value}) is not present in table "{referenced_table}".\n'
+    )
+
+
+def _not_null_violation(table: str, column: str) -> IntegrityError:
+    return IntegrityError(f'null value in column "{column}" of relation "{table}" violates not-null constraint\n')
+
+
+class InMemoryStore:
+    """Contracts and projects tables of the in-memory backend with the indexes its DAOs look rows up by.
+    Rows are only read and changed inside InMemoryGateway.transaction(); constraints of the PostgreSQL schema
+    (unique names, unique active contract, foreign keys) raise IntegrityError before anything is changed."""
+
+    def __init__(self) -> None:
+        self.contracts: dict[int, ContractsDTO] = {}
+        self.projects: dict[int, ProjectsDTO] = {}
+        self.contract_ids: list[int] = []
+        self.project_ids: list[int] = []
+        self.contract_ids_by_name: dict[str, int] = {}
+        self.project_ids_by_name: dict[str, int] = {}
+        self.contract_ids_by_status: dict[str, set[int]] = {status: set() for status in STATUSES}
+        self.project_ids_by_active_contract: dict[int, int] = {}
+
+    def _check_contract(self, data: ContractsDTO, contract_id: Optional[int] = None) -> None:
+        check_status(data.status)
+        if data.name is None:
+            raise _not_null_violation("contracts", "name")
+        if self.contract_ids_by_name.get(data.name, contract_id) != contract_id:
+            raise _unique_violation("contracts", "name", data.name)
+        if data.project_id is not None and data.project_id not in self.projects:
+            raise _foreign_key_violation("contracts", "project_id", data.project_id, "projects")
+
+    def _check_project(self, data: ProjectsDTO, project_id: Optional[int] = None) -> None:
+        if data.name is None:
+            raise _not_null_violation("projects", "name")
+        if self.project_ids_by_name.get(data.name, project_id) != project_id:
+            raise _unique_violation("projects", "name", data.name)
+        if data.contract_id is not None:
+            if data.contract_id not in self.contracts:
+                raise _foreign_key_violation("projects", "active_contract_id", data.contract_id, "contracts")
+            if self.project_ids_by_active_contract.get(data.contract_id, project_id) != project_id:
+                raise _unique_violation("projects", "active_contract_id", data.contract_id)
+
+    def insert_contract(self, data: ContractsDTO) -> int:
+        """Adds contract and returns its id."""
+        self._check_contract(data)
+        contract_id = self.contract_ids[-1] + 1 if self.contract_ids else 1
+        self.contracts[contract_id] = replace(
+            data,
+            id=contract_id,
+            signing_date=to_date(data.signing_date),
+            creation_date=to_date(data.creation_date),
+            version=1,
+        )
+        self.contract_ids.append(contract_id)
+        self.contract_ids_by_name[data.name] = contract_id
+        self.contract_ids_by_status[data.status].add(contract_id)
+        return contract_id
+
+    def insert_project(self, data: ProjectsDTO) -> int:
+        """Adds project and returns its id."""
+        self._check_project(data)
+        project_id = self.project_ids[-1] + 1 if self.project_ids else 1
+        self.projects[project_id] = replace(data, id=project_id, creation_date=to_date(data.creation_date), version=1)
+        self.project_ids.append(project_id)
+        self.project_ids_by_name[data.name] = project_id
+        if data.contract_id is not None:
+            self.project_ids_by_active_contract[data.contract_id] = project_id
+        return project_id
+
+    def update_contract(self, data: ContractsDTO) -> Optional[int]:
+        """Overwrites contract if it still has the version of `data`. Returns new version, None if the contract
+        does not exist or has another version."""
+        contract_id = data.id
+        if contract_id is None or contract_id not in self.contracts:
+            return None
+        stored = self.contracts[contract_id]
+        if stored.version != data.version:
+            return None
+        self._check_contract(data, contract_id=contract_id)
+        del self.contract_ids_by_name[stored.name]
+        self.contract_ids_by_status[stored.status].discard(contract_id)
+        stored.name = data.name
+        stored.status = data.status
+        stored.signing_date = to_date(data.signing_date)
+        stored.project_id = data.project_id
+        stored.version += 1
+        self.contract_ids_by_name[stored.name] = contract_id
+        self.contract_ids_by_status[stored.status].add(contract_id)
+        return stored.version
+
+    def update_project(self, data: ProjectsDTO) -> Optional[int]:
+        """Overwrites project if it still has the version of `data`. Returns new version, None if the project
+        does not exist or has another version."""
+        project_id = data.id
+        if project_id is None or project_id not in self.projects:
+            return None
+        stored = self.projects[project_id]
+        if stored.version != data.version:
+            return None
+        self._check_project(data, project_id=project_id)
+        del self.project_ids_by_name[stored.name]
+        if stored.contract_id is not None:
+            del self.project_ids_by_active_contract[stored.contract_id]
+        stored.name = data.name
+        stored.contract_id = data.contract_id
+        stored.version += 1
+        self.project_ids_by_name[stored.name] = project_id
+        if stored.contract_id is not None:
+            self.project_ids_by_active_contract[stored.contract_id] = project_id
+        return stored.version
+
+
+class InMemoryGateway:
+    """Keeps contracts and projects in process memory instead of PostgreSQL, so the logic layer can be tested
+    and load-tested without a database server. It is used by the in-memory DAOs created for it by
+    create_contracts_dao() and create_projects_dao(); transactions are serialized by one lock."""
+
+    def __init__(self) -> None:
+        self.store = InMemoryStore()
+        self._lock = threading.RLock()
+
+    @contextmanager
+    def transaction(self) -> Iterator[Any]:
+        """Yields the store while holding the lock, so no other transaction sees or makes changes meanwhile."""
+        with self._lock:
+            yield self.store
+
+    @contextmanager
+    def server_side_cursor(self, itersize: int) -> Iterator[Any]:
+        """Same as transaction(): rows are already in memory, there is nothing to fetch in chunks."""
+        with self.transaction() as store:
+            yield store
+
+    def close(self) -> None:
+        """Has nothing to release, exists for parity with PostgreSQLPoolGateway."""
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from data_access.interfaces import DBGatewayProtocol
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "database" / "migrations"
+
+NO_TRANSACTION_MARKER = "-- migrate: no-transaction"
+
+_STATEMENT_END = re.compile(r";|\\gexec\b")
+
+
+def split_statements(sql: str) -> list[tuple[str, bool]]:
+    """Splits SQL of a no-transaction migration into (statement, is_gexec) pairs. Statements end with ';' or,
+    as in psql, with '\\gexec': such a query returns statements that are executed in turn."""
+
+    statements = []
+    position = 0
+    for match in _STATEMENT_END.finditer(sql):
+        statement = sql[position : match.start()].strip()
+        if statement:
+            statements.append((statement, match.group() != ";"))
+        position = match.end()
+    if sql[position:].strip():
+        statements.append((sql[position:].strip(), False))
+    return statements
+
+
+class MigrationRunner:
+    """Applies versioned SQL migrations from the migrations directory and records applied versions.
+    Migration files are named '<version>_<description>.sql' and applied in version order,
+    each in its own transaction. Files starting with the line '-- migrate: no-transaction' (e.g. with
+    CREATE INDEX CONCURRENTLY) are applied in autocommit mode, one ';'-separated statement at a time; a query
+    ending with '\\gexec' instead of ';' builds statements that are executed next (see split_statements).
+    :param db_gateway: gateway to the database to migrate
+    :type db_gateway: DBGatewayProtocol
+    :param migrations_dir: directory with migration files
+    :type migrations_dir: Path
+    """
+
+    def __init__(self, db_gateway: DBGatewayProtocol, migrations_dir: Path = MIGRATIONS_DIR) -> None:
+        self._db_gateway = db_gateway
+        self._migrations_dir = migrations_dir
+
+    def get_migrations(self) -> list[tuple[str, Path]]:
+        """Gets (version, path) pairs of all migration files ordered by version."""
+
+        migrations = [(path.name.split("_", 1)[0], path) for path in self._migrations_dir.glob("*.sql")]
+        return sorted(migrations)
+
+    def _ensure_versions_table(self) -> None:
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute(
+                "CREATE TABLE IF NOT EXISTS schema_migrations ("
+                "version TEXT PRIMARY KEY, "
+                "applied_at TIMESTAMPTZ NOT NULL DEFAULT now());"
+            )
+
+    def get_applied_versions(self) -> set[str]:
+        """Gets versions of migrations already applied to the database."""
+
+        self._ensure_versions_table()
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute("SELECT version FROM schema_migrations;")
+            return {version for (version,) in cursor.fetchall()}
+
+    def get_pending(self) -> list[tuple[str, Path]]:
+        """Gets migrations that are not applied yet."""
+
+        applied_versions = self.get_applied_versions()
+        return [(version, path) for version, path in self.get_migrations() if version not in applied_versions]
+
+    def apply_pending(self) -> list[str]:
+        """Applies pending migrations and returns their versions.
+        An advisory lock serialises runners started at the same time."""
+
+        applied: list[str] = []
+        for version, path in self.get_pending():
+            sql = path.read_text(encoding="utf-8")
+            if sql.startswith(NO_TRANSACTION_MARKER):
+                is_applied = self._apply_without_transaction(version=version, sql=sql)
+            else:
+                is_applied = self._apply_in_transaction(version=version, sql=sql)
+            if is_applied:
+                applied.append(version)
+        return applied
+
+    def _apply_in_transaction(self, version: str, sql: str) -> bool:
+        with self._db_gateway.transaction() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(hashtext('schema_migrations'));")
+            cursor.execute("SELECT 1 FROM schema_migrations WHERE version = %s;", (version,))
+            if cursor.fetchone():
+                return False
+            cursor.execute(sql)
+            cursor.execute("INSERT INTO schema_migrations (version) VALUES (%s);", (version,))
+        return True
+
+    def _apply_without_transaction(self, version: str, sql: str) -> bool:
+        """Runs statements one by one, as PostgreSQL runs a multi-statement string in one transaction.
+        A failed statement leaves the earlier ones applied and the version unrecorded."""
+
+        with self._db_gateway.transaction() as cursor:
+            connection = cursor.connection
+            connection.autocommit = True
+            try:
+                cursor.execute("SELECT pg_advisory_lock(hashtext('schema_migrations'));")
+                try:
+                    cursor.execute("SELECT 1 FROM schema_migrations WHERE version = %s;", (version,))
+                    if cursor.fetchone():
+                        return False
+                    for statement, is_gexec in split_statements(sql):
+                        cursor.execute(statement)
+                        if is_gexec:
+                            for generated in [value for row in cursor.fetchall() for value in row]:
+                                cursor.execute(generated)
+                    cursor.execute("INSERT INTO schema_migrations (version) VALUES (%s);", (version,))
+                finally:
+                    cursor.execute("SELECT pg_advisory_unlock(hashtext('schema_migrations'));")
+            finally:
+                if not connection.closed:
+                    connection.autocommit = False
+        return True
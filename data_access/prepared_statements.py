@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Mapping, Optional, Sequence, Union
+
+from psycopg2.errors import InvalidSqlStatementName
+from psycopg2.extensions import connection, cursor
+
+MAX_PREPARED_STATEMENTS = 256
+
+_PLACEHOLDER = re.compile(r"%\((\w+)\)s|%s|%%")
+_PREPARABLE = re.compile(r"\s*(SELECT|INSERT|UPDATE|DELETE|WITH|VALUES)\b", re.IGNORECASE)
+
+
+def to_positional(
+    query: str,
+    params: Union[Sequence[Any], Mapping[str, Any]],
+) -> tuple[str, list[Any]]:
+    """Replaces psycopg2 placeholders (%s and %(name)s) with $1, $2... of PREPARE and unescapes %%.
+    Returns the converted statement and parameters in positional order."""
+
+    positions: dict[str, int] = {}
+    ordered: list[Any] = []
+
+    def replace(match: re.Match) -> str:
+        name = match.group(1)
+        if match.group(0) == "%%":
+            return "%"
+        if isinstance(params, Mapping):
+            if name not in positions:
+                ordered.append(params[name])
+                positions[name] = len(ordered)
+            return f"${positions[name]}"
+        ordered.append(params[len(ordered)])
+        return f"${len(ordered)}"
+
+    return _PLACEHOLDER.sub(replace, query), ordered
+
+
+class PreparingCursor(cursor):
+    """Cursor executing DML statements through server-side prepared statements of its connection.
+    Each distinct statement text is prepared once per connection on first use and executed by name afterwards,
+    so PostgreSQL skips parsing and planning. Statements sent as bytes (execute_values pages), statements of named
+    cursors (DECLARE cannot use EXECUTE) and all other statements (DDL, SAVEPOINT...) are executed as usual."""
+
+    connection: PreparingConnection
+
+    def execute(self, query: Union[str, bytes], vars: Optional[Any] = None) -> None:  # noqa: A002
+        if self.name is not None or not isinstance(query, str) or not _PREPARABLE.match(query):
+            super().execute(query, vars)
+            return
+        registry = self.connection.prepared_statements
+        statement_name = registry.get(query)
+        if statement_name is None:
+            if len(registry) >= MAX_PREPARED_STATEMENTS:
+                super().execute(query, vars)
+                return
+            statement_name = f"dao_{self.connection.prepared_counter}"
+            self.connection.prepared_counter += 1
+            prepared_sql, params = to_positional(query, vars) if vars is not None else (query, [])
+            super().execute(f"PREPARE {statement_name} AS {prepared_sql}")
+            registry[query] = statement_name
+        else:
+            params = to_positional(query, vars)[1] if vars is not None else []
+        arguments = f" ({', '.join(['%s'] * len(params))})" if params else ""
+        try:
+            super().execute(f"EXECUTE {statement_name}{arguments};", params)
+        except InvalidSqlStatementName:
+            # Statement was deallocated behind our back (e.g. DISCARD ALL): it is prepared again on next use.
+            registry.pop(query, None)
+            raise
+
+
+class PreparingConnection(connection):
+    """Connection keeping the registry of its prepared statements; a new connection starts with an empty one,
+    so statements are prepared again after reconnects."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.cursor_factory = PreparingCursor
+        self.prepared_statements: dict[str, str] = {}
+        self.prepared_counter = 1
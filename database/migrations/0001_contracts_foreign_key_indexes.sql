@@ -0,0 +1,3 @@
+-- migrate: no-transaction
+CREATE INDEX CONCURRENTLY IF NOT EXISTS contracts_status_id_idx ON contracts (status_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS contracts_project_id_idx ON contracts (project_id);
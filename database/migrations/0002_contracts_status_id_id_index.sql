@@ -0,0 +1,3 @@
+-- migrate: no-transaction
+CREATE INDEX CONCURRENTLY IF NOT EXISTS contracts_status_id_id_idx ON contracts (status_id, id);
+DROP INDEX CONCURRENTLY IF EXISTS contracts_status_id_idx;
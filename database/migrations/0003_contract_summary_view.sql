@@ -0,0 +1,11 @@
+CREATE MATERIALIZED VIEW IF NOT EXISTS contract_summary AS
+SELECT
+    statuses.name AS status,
+    contracts.project_id AS project_id,
+    count(*) AS contracts_count,
+    max(contracts.signing_date) AS last_signing_date
+FROM contracts
+JOIN statuses ON contracts.status_id = statuses.id
+GROUP BY statuses.name, contracts.project_id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS contract_summary_status_project_idx ON contract_summary (status, project_id);
@@ -0,0 +1,8 @@
+-- migrate: no-transaction
+-- Active contracts are a small share of the table: a partial index on their ids serves the active id list and
+-- keyset pages of active contracts at a fraction of the size of contracts_status_id_id_idx. The predicate must be
+-- a constant, so the statement is built from the id of the 'active' status.
+SELECT format(
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS contracts_active_id_idx ON contracts (id) WHERE status_id = %s',
+    id
+) FROM statuses WHERE name = 'active' \gexec
@@ -16,3 +16,11 @@ class IncorrectStatusError(Exception):
 
 class ContractAlreadyExistError(Exception):
     """Raises when project already has an active contract."""
+
+
+class PoolTimeoutError(Exception):
+    """Raises when there is no free database connection in the pool."""
+
+
+class ConcurrentUpdateError(Exception):
+    """Raises when a record has been changed by another transaction since it was read."""
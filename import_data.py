@@ -0,0 +1,116 @@
+"""Bulk import of contracts or projects from CSV or JSONL files.
+
+Usage: python import_data.py {contracts,projects} FILE [--format {csv,jsonl}]
+
+CSV files must have a header row. Contracts use the fields "name", "status" (draft by default)
+and "signing_date" (ISO format), projects use the field "name".
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+from datetime import datetime
+from typing import Iterator, Optional
+
+from business_logic import ContractsLogic, ProjectLogic
+from data_access.db_connector import PostgreSQLPoolGateway
+from data_access.dto import ContractsDTO, ImportResultDTO, ProjectsDTO
+from settings import (
+    POSTGRES_DB,
+    POSTGRES_HOST,
+    POSTGRES_PASSWORD,
+    POSTGRES_PORT,
+    POSTGRES_USER,
+)
+
+
+def read_records(path: str, file_format: str) -> Iterator[dict]:
+    """Yields records of CSV or JSONL file one by one."""
+
+    with open(path, newline="", encoding="utf-8") as file:
+        if file_format == "csv":
+            yield from csv.DictReader(file)
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def to_contracts(records: Iterator[dict], rejected: list[tuple[int, str, str]]) -> Iterator[ContractsDTO]:
+    """Yields contracts of the records. Records with invalid signing date are not yielded but added to `rejected`
+    with their record number."""
+
+    for line_number, record in enumerate(records, start=1):
+        try:
+            signing_date = parse_date(record.get("signing_date"))
+        except (TypeError, ValueError):
+            rejected.append((line_number, record.get("name") or "", "invalid signing date"))
+            continue
+        yield ContractsDTO(
+            name=record.get("name") or "",
+            status=record.get("status") or "draft",
+            signing_date=signing_date,
+        )
+
+
+def to_projects(records: Iterator[dict]) -> Iterator[ProjectsDTO]:
+    for record in records:
+        yield ProjectsDTO(name=record.get("name") or "")
+
+
+def merge_rejected(result: ImportResultDTO, skipped: list[tuple[int, str, str]]) -> ImportResultDTO:
+    """Adds records skipped before import to the result. The DAO numbers only the records it received,
+    so its numbers are shifted by the skipped records preceding them."""
+
+    rejected = list(skipped)
+    for line_number, name, reason in result.rejected:
+        for skipped_number, _, _ in skipped:
+            if skipped_number > line_number:
+                break
+            line_number += 1
+        rejected.append((line_number, name, reason))
+    return ImportResultDTO(imported=result.imported, rejected=sorted(rejected))
+
+
+def print_report(result: ImportResultDTO) -> None:
+    print(f"Imported records: {result.imported}. Rejected records: {len(result.rejected)}.")
+    for line_number, name, reason in result.rejected:
+        print(f"[REJECTED] record {line_number} ({name!r}): {reason}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk import of contracts or projects.")
+    parser.add_argument("entity", choices=["contracts", "projects"])
+    parser.add_argument("path", help="path to CSV or JSONL file")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="file format (detected by extension by default)")
+    args = parser.parse_args()
+    file_format = args.format or ("jsonl" if args.path.endswith((".jsonl", ".json")) else "csv")
+
+    db_gateway = PostgreSQLPoolGateway(
+        db_name=POSTGRES_DB,
+        db_user=POSTGRES_USER,
+        db_password=POSTGRES_PASSWORD,
+        db_host=POSTGRES_HOST,
+        db_port=POSTGRES_PORT,
+        max_size=1,
+    )
+    records = read_records(path=args.path, file_format=file_format)
+    if args.entity == "contracts":
+        skipped: list[tuple[int, str, str]] = []
+        result = ContractsLogic(db_gateway=db_gateway).import_records(records=to_contracts(records, rejected=skipped))
+        result = merge_rejected(result=result, skipped=skipped)
+    else:
+        result = ProjectLogic(db_gateway=db_gateway).import_records(records=to_projects(records))
+    db_gateway.close()
+    print_report(result)
+    return 1 if result.rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
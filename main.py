@@ -1,20 +1,40 @@
-from data_access.db_connector import PostgreSQLGateway
-from settings import (
-    POSTGRES_DB,
-    POSTGRES_HOST,
-    POSTGRES_PASSWORD,
-    POSTGRES_PORT,
-    POSTGRES_USER,
-)
-from ui_layer import main_menu_ui
+"""Console application. Settings are read and the database gateway is created by main(), so importing this module
+needs no POSTGRES_* variables and loads neither psycopg2 nor the menus."""
+import atexit
+
+import settings
+import ui_layer
+from data_access.backends import create_db_gateway
+from data_access.cache import LRUCache, configure_cache
+from data_access.instrumentation import QueryStats
+
+
+def main() -> None:
+    configure_cache(lambda: LRUCache(max_size=settings.ENTITY_CACHE_MAX_SIZE, ttl=settings.ENTITY_CACHE_TTL))
+    slow_query_ms = settings.DB_SLOW_QUERY_MS
+    query_stats = (
+        QueryStats(slow_query_threshold=slow_query_ms / 1000 if slow_query_ms is not None else None)
+        if settings.DB_QUERY_STATS or slow_query_ms is not None
+        else None
+    )
+    db_gateway = create_db_gateway(
+        backend=settings.DB_BACKEND,
+        db_name=settings.POSTGRES_DB,
+        db_user=settings.POSTGRES_USER,
+        db_password=settings.POSTGRES_PASSWORD,
+        db_host=settings.POSTGRES_HOST,
+        db_port=settings.POSTGRES_PORT,
+        min_size=settings.POSTGRES_POOL_MIN_SIZE,
+        max_size=settings.POSTGRES_POOL_MAX_SIZE,
+        query_stats=query_stats,
+        prepare_statements=settings.POSTGRES_PREPARE_STATEMENTS,
+        lazy_connect=settings.DB_LAZY_CONNECT,
+    )
+    if settings.DB_QUERY_STATS and query_stats is not None:
+        collected_stats = query_stats
+        atexit.register(lambda: print(collected_stats.format_table()))
+    ui_layer.main_menu_ui(db_connector=db_gateway)
 
-db_gateway = PostgreSQLGateway(
-    db_name=POSTGRES_DB,
-    db_user=POSTGRES_USER,
-    db_password=POSTGRES_PASSWORD,
-    db_host=POSTGRES_HOST,
-    db_port=POSTGRES_PORT,
-)
 
 if __name__ == "__main__":
-    main_menu_ui(db_connector=db_gateway)
+    main()
@@ -0,0 +1,129 @@
+"""Maintenance commands.
+
+Usage:
+    python manage.py migrate           applies pending database migrations
+    python manage.py migrate --list    shows applied and pending migrations
+    python manage.py refresh-summary   recalculates contract summary (add --every SECONDS to repeat)
+    python manage.py profile-imports   shows the slowest imports of a module (main by default), needs no database
+
+Add --query-stats before the command to print per-statement timings when it finishes.
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import time
+from typing import TYPE_CHECKING, Optional
+
+import settings
+
+if TYPE_CHECKING:
+    from data_access.db_connector import PostgreSQLPoolGateway
+
+# Modules of the project and its dependencies are imported by the commands using them,
+# so commands that need no database (and --help) start without loading psycopg2.
+
+
+def migrate(db_gateway: PostgreSQLPoolGateway, args: argparse.Namespace) -> int:
+    from data_access.migrations import MigrationRunner
+
+    runner = MigrationRunner(db_gateway=db_gateway)
+    if args.list:
+        applied_versions = runner.get_applied_versions()
+        for version, path in runner.get_migrations():
+            print(f"[{'X' if version in applied_versions else ' '}] {path.name}")
+        return 0
+    applied = runner.apply_pending()
+    if applied:
+        print(f"Applied migrations: {', '.join(applied)}.")
+    else:
+        print("There aren't any pending migrations.")
+    return 0
+
+
+def refresh_summary(db_gateway: PostgreSQLPoolGateway, args: argparse.Namespace) -> int:
+    from business_logic import ContractsLogic
+
+    logic = ContractsLogic(db_gateway=db_gateway)
+    while True:
+        logic.refresh_summary()
+        print("Contract summary has been refreshed.")
+        if not args.every:
+            return 0
+        time.sleep(args.every)
+
+
+def parse_import_times(report: str) -> list[tuple[str, int, int]]:
+    """Parses `python -X importtime` report into (module, self microseconds, cumulative microseconds) rows."""
+    rows = []
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_time, cumulative_time, module = line[len("import time:") :].split("|", 2)
+        if self_time.strip().isdigit():
+            rows.append((module.strip(), int(self_time), int(cumulative_time)))
+    return rows
+
+
+def profile_imports(db_gateway: Optional[PostgreSQLPoolGateway], args: argparse.Namespace) -> int:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {args.module}"],
+        capture_output=True,
+        text=True,
+    )
+    rows = parse_import_times(completed.stderr)
+    if completed.returncode != 0:
+        print(completed.stderr.splitlines()[-1] if completed.stderr else f"Importing {args.module} failed.")
+        return completed.returncode
+    print(f"{'cumulative, ms':>14} {'self, ms':>9}  module")
+    for module, self_time, cumulative_time in sorted(rows, key=lambda row: row[2], reverse=True)[: args.top]:
+        print(f"{cumulative_time / 1000:>14.1f} {self_time / 1000:>9.1f}  {module}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Projects and contracts maintenance commands.")
+    parser.add_argument("--query-stats", action="store_true", help="print executed statements statistics at the end")
+    parser.set_defaults(needs_database=True)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    migrate_parser = subparsers.add_parser("migrate", help="apply pending database migrations")
+    migrate_parser.add_argument("--list", action="store_true", help="show migrations and whether they are applied")
+    migrate_parser.set_defaults(handler=migrate)
+    refresh_parser = subparsers.add_parser("refresh-summary", help="recalculate contract summary view")
+    refresh_parser.add_argument("--every", type=float, help="repeat refresh every given number of seconds")
+    refresh_parser.set_defaults(handler=refresh_summary)
+    profile_parser = subparsers.add_parser("profile-imports", help="show the slowest imports of a module")
+    profile_parser.add_argument("module", nargs="?", default="main", help="module to import (main by default)")
+    profile_parser.add_argument("--top", type=int, default=20, help="number of modules to show")
+    profile_parser.set_defaults(handler=profile_imports, needs_database=False)
+    args = parser.parse_args()
+
+    if not args.needs_database:
+        return int(args.handler(None, args))
+
+    from data_access.db_connector import PostgreSQLPoolGateway
+    from data_access.instrumentation import QueryStats
+
+    query_stats = QueryStats() if args.query_stats else None
+    db_gateway = PostgreSQLPoolGateway(
+        db_name=settings.POSTGRES_DB,
+        db_user=settings.POSTGRES_USER,
+        db_password=settings.POSTGRES_PASSWORD,
+        db_host=settings.POSTGRES_HOST,
+        db_port=settings.POSTGRES_PORT,
+        max_size=1,
+        query_stats=query_stats,
+        lazy_connect=True,
+    )
+    try:
+        exit_code: int = args.handler(db_gateway, args)
+    finally:
+        db_gateway.close()
+        if query_stats is not None:
+            print(query_stats.format_table())
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""HTTP API server. Settings are read and the database gateway is created by main(), so importing this module
+needs no POSTGRES_* variables and opens no connections."""
+import settings
+from api_layer import ApiServer
+from data_access.backends import create_db_gateway
+from data_access.cache import LRUCache, configure_cache
+from data_access.instrumentation import QueryStats
+
+
+def main() -> None:
+    configure_cache(lambda: LRUCache(max_size=settings.ENTITY_CACHE_MAX_SIZE, ttl=settings.ENTITY_CACHE_TTL))
+    slow_query_ms = settings.DB_SLOW_QUERY_MS
+    query_stats = (
+        QueryStats(slow_query_threshold=slow_query_ms / 1000 if slow_query_ms is not None else None)
+        if settings.DB_QUERY_STATS or slow_query_ms is not None
+        else None
+    )
+    db_gateway = create_db_gateway(
+        backend=settings.DB_BACKEND,
+        db_name=settings.POSTGRES_DB,
+        db_user=settings.POSTGRES_USER,
+        db_password=settings.POSTGRES_PASSWORD,
+        db_host=settings.POSTGRES_HOST,
+        db_port=settings.POSTGRES_PORT,
+        min_size=settings.POSTGRES_POOL_MIN_SIZE,
+        max_size=settings.POSTGRES_POOL_MAX_SIZE,
+        query_stats=query_stats,
+        prepare_statements=settings.POSTGRES_PREPARE_STATEMENTS,
+        lazy_connect=settings.DB_LAZY_CONNECT,
+    )
+    server_address = (settings.API_HOST, settings.API_PORT)
+    with ApiServer(server_address=server_address, db_gateway=db_gateway, query_stats=query_stats) as server:
+        print(f"Serving on http://{settings.API_HOST}:{settings.API_PORT}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    db_gateway.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,59 @@
+"""Application settings. Each setting is read from the environment (and .env file) on first access,
+so importing this module neither reads files nor imports python-dotenv."""
 import os
+from typing import Any, Callable
 
-from dotenv import load_dotenv
+_TRUE_VALUES = ("1", "true", "yes")
 
-load_dotenv()
+_dotenv_loaded = False
 
-POSTGRES_DB = os.environ["POSTGRES_DB"]
-POSTGRES_USER = os.environ["POSTGRES_USER"]
-POSTGRES_PASSWORD = os.environ["POSTGRES_PASSWORD"]
-POSTGRES_HOST = os.environ["POSTGRES_HOST"]
-POSTGRES_PORT = os.environ["POSTGRES_PORT"]
+
+def _getenv(name: str, default: str = "") -> str:
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _dotenv_loaded = True
+    return os.environ.get(name, default)
+
+
+def _postgres_setting(name: str) -> str:
+    """Connection settings are required only by the 'postgresql' backend."""
+    value = _getenv(name)
+    if name not in os.environ and __getattr__("DB_BACKEND") == "postgresql":
+        raise KeyError(name)
+    return value
+
+
+_SETTINGS: dict[str, Callable[[], Any]] = {
+    "DB_BACKEND": lambda: _getenv("DB_BACKEND", "postgresql"),
+    "DB_LAZY_CONNECT": lambda: _getenv("DB_LAZY_CONNECT", "1").lower() in _TRUE_VALUES,
+    "POSTGRES_DB": lambda: _postgres_setting("POSTGRES_DB"),
+    "POSTGRES_USER": lambda: _postgres_setting("POSTGRES_USER"),
+    "POSTGRES_PASSWORD": lambda: _postgres_setting("POSTGRES_PASSWORD"),
+    "POSTGRES_HOST": lambda: _postgres_setting("POSTGRES_HOST"),
+    "POSTGRES_PORT": lambda: _postgres_setting("POSTGRES_PORT"),
+    "POSTGRES_POOL_MIN_SIZE": lambda: int(_getenv("POSTGRES_POOL_MIN_SIZE", "1")),
+    "POSTGRES_POOL_MAX_SIZE": lambda: int(_getenv("POSTGRES_POOL_MAX_SIZE", "10")),
+    "POSTGRES_PREPARE_STATEMENTS": lambda: _getenv("POSTGRES_PREPARE_STATEMENTS", "1").lower() in _TRUE_VALUES,
+    "API_HOST": lambda: _getenv("API_HOST", "127.0.0.1"),
+    "API_PORT": lambda: int(_getenv("API_PORT", "8000")),
+    "ENTITY_CACHE_MAX_SIZE": lambda: int(_getenv("ENTITY_CACHE_MAX_SIZE", "10000")),
+    "ENTITY_CACHE_TTL": lambda: float(_getenv("ENTITY_CACHE_TTL", "60")),
+    "DB_QUERY_STATS": lambda: _getenv("DB_QUERY_STATS").lower() in _TRUE_VALUES,
+    "DB_SLOW_QUERY_MS": lambda: float(_getenv("DB_SLOW_QUERY_MS")) if _getenv("DB_SLOW_QUERY_MS") else None,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Reads setting on first access and keeps it as module attribute, so later accesses are plain lookups."""
+    if name not in _SETTINGS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = _SETTINGS[name]()
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_SETTINGS))
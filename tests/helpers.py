@@ -0,0 +1,69 @@
+"""Gateways and seed data shared by the tests.
+
+Tests of DAO statements run against the in-memory backend and, when TEST_POSTGRES_DB is set, once more against
+that PostgreSQL database. It must have the schema of database/create_tables.sql, database/fill_tables.sql and
+all migrations (python manage.py migrate); its contracts and projects are deleted before every test.
+"""
+from __future__ import annotations
+
+import os
+import unittest
+from typing import Any, Iterable, Union
+
+from business_logic import ContractsLogic, ProjectLogic
+from data_access.async_db_connector import AsyncPostgreSQLPoolGateway
+from data_access.db_connector import PostgreSQLPoolGateway
+from data_access.memory_gateway import InMemoryGateway
+
+Gateway = Union[PostgreSQLPoolGateway, InMemoryGateway]
+
+
+def create_memory_gateway() -> InMemoryGateway:
+    return InMemoryGateway()
+
+
+def _connection_options() -> dict[str, Any]:
+    """Reads TEST_POSTGRES_* variables, skipping the test if TEST_POSTGRES_DB is not set."""
+
+    db_name = os.environ.get("TEST_POSTGRES_DB")
+    if not db_name:
+        raise unittest.SkipTest("TEST_POSTGRES_DB is not set.")
+    return {
+        "db_name": db_name,
+        "db_user": os.environ.get("TEST_POSTGRES_USER", "postgres"),
+        "db_password": os.environ.get("TEST_POSTGRES_PASSWORD", ""),
+        "db_host": os.environ.get("TEST_POSTGRES_HOST", "localhost"),
+        "db_port": os.environ.get("TEST_POSTGRES_PORT", "5432"),
+    }
+
+
+def create_postgresql_gateway() -> PostgreSQLPoolGateway:
+    """Connects to the test database and empties its tables."""
+
+    db_gateway = PostgreSQLPoolGateway(**_connection_options(), min_size=0, max_size=4, prepare_statements=True)
+    with db_gateway.transaction() as cursor:
+        cursor.execute("TRUNCATE projects, contracts RESTART IDENTITY;")
+    return db_gateway
+
+
+def create_async_postgresql_gateway(max_size: int = 10, acquire_timeout: float = 30.0) -> AsyncPostgreSQLPoolGateway:
+    """Creates asynchronous gateway to the test database; its tables are not emptied."""
+
+    return AsyncPostgreSQLPoolGateway(**_connection_options(), max_size=max_size, acquire_timeout=acquire_timeout)
+
+
+def seed(
+    db_gateway: Gateway,
+    contract_names: Iterable[str] = (),
+    active_contract_ids: Iterable[int] = (),
+    project_names: Iterable[str] = (),
+) -> tuple[ContractsLogic, ProjectLogic]:
+    """Creates contracts (ids start with 1), confirms `active_contract_ids` and creates projects.
+    Returns logic objects working with the gateway."""
+
+    contracts = ContractsLogic(db_gateway=db_gateway)
+    projects = ProjectLogic(db_gateway=db_gateway)
+    contracts.create_records(contract_names=list(contract_names))
+    contracts.confirm_many(contract_ids=active_contract_ids)
+    projects.create_records(project_names=list(project_names))
+    return contracts, projects
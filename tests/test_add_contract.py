@@ -0,0 +1,88 @@
+import threading
+import unittest
+
+from data_access.dao import create_projects_dao
+from errors import ContractAlreadyExistError, IncorrectIdError, ValidationError
+from tests.helpers import (
+    Gateway,
+    create_memory_gateway,
+    create_postgresql_gateway,
+    seed,
+)
+
+
+class AddActiveContractTest(unittest.TestCase):
+    """Contracts 1 and 2 are active, contract 3 is a draft; projects 1 and 2 have no contract."""
+
+    def create_gateway(self) -> Gateway:
+        return create_memory_gateway()
+
+    def setUp(self) -> None:
+        self.db_gateway = self.create_gateway()
+        self.addCleanup(self.db_gateway.close)
+        self.contracts, self.projects = seed(
+            self.db_gateway,
+            contract_names=["first", "second", "draft"],
+            active_contract_ids=[1, 2],
+            project_names=["first", "second"],
+        )
+        self.dao = create_projects_dao(db_gateway=self.db_gateway)
+
+    def test_flags(self) -> None:
+        self.assertEqual(self.dao.add_active_contract(project_id=1, contract_id=3), (False, True, True, False))
+        self.assertEqual(self.dao.add_active_contract(project_id=9, contract_id=1), (True, False, False, False))
+        self.assertEqual(self.dao.add_active_contract(project_id=1, contract_id=1), (True, True, True, True))
+        self.assertEqual(self.dao.add_active_contract(project_id=1, contract_id=2), (True, True, False, False))
+
+    def test_contract_and_project_are_linked(self) -> None:
+        self.projects.add_contract_to_project(project_id="2", contract_id="1")
+        self.assertEqual(self.projects.get_record_by_id(project_id="2").contract_id, 1)
+        self.assertEqual(self.contracts.get_record_by_id(contract_id="1").project_id, 2)
+
+    def test_inactive_contract(self) -> None:
+        for contract_id in ("3", "9"):
+            with self.assertRaisesRegex(ValidationError, "must be active"):
+                self.projects.add_contract_to_project(project_id="1", contract_id=contract_id)
+        self.assertIsNone(self.projects.get_record_by_id(project_id="1").contract_id)
+
+    def test_missing_project(self) -> None:
+        with self.assertRaises(IncorrectIdError):
+            self.projects.add_contract_to_project(project_id="9", contract_id="1")
+        self.assertIsNone(self.contracts.get_record_by_id(contract_id="1").project_id)
+
+    def test_project_with_active_contract(self) -> None:
+        self.projects.add_contract_to_project(project_id="1", contract_id="1")
+        with self.assertRaises(ContractAlreadyExistError):
+            self.projects.add_contract_to_project(project_id="1", contract_id="2")
+        self.assertIsNone(self.contracts.get_record_by_id(contract_id="2").project_id)
+
+    def test_entered_ids_are_validated(self) -> None:
+        for project_id, contract_id in (("x", "1"), ("1", "x"), ("1", "2147483648")):
+            with self.assertRaises(ValidationError):
+                self.projects.add_contract_to_project(project_id=project_id, contract_id=contract_id)
+
+    def test_concurrent_links_to_one_project(self) -> None:
+        barrier = threading.Barrier(2)
+        flags: dict[int, tuple[bool, bool, bool, bool]] = {}
+
+        def link(contract_id: int) -> None:
+            barrier.wait()
+            flags[contract_id] = self.dao.add_active_contract(project_id=1, contract_id=contract_id)
+
+        threads = [threading.Thread(target=link, args=(contract_id,)) for contract_id in (1, 2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(flag[3] for flag in flags.values()), [False, True])
+        linked_id = next(contract_id for contract_id, flag in flags.items() if flag[3])
+        self.assertEqual(self.projects.get_record_by_id(project_id="1").contract_id, linked_id)
+        linked = [contract.id for contract in self.contracts.get_all_data() if contract.project_id == 1]
+        self.assertEqual(linked, [linked_id])
+
+
+class PostgreSQLAddActiveContractTest(AddActiveContractTest):
+    """Runs the link statement (CTE locking project and contract rows FOR UPDATE) against PostgreSQL."""
+
+    def create_gateway(self) -> Gateway:
+        return create_postgresql_gateway()
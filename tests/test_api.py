@@ -0,0 +1,69 @@
+import http.client
+import json
+import threading
+import unittest
+from typing import Any, Optional
+
+from api_layer import ApiServer
+from api_layer.handlers import ApiRequestHandler
+from tests.helpers import create_memory_gateway, seed
+
+
+class QuietRequestHandler(ApiRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+
+class ApiErrorsTest(unittest.TestCase):
+    """Contract 1 is a draft."""
+
+    def setUp(self) -> None:
+        db_gateway = create_memory_gateway()
+        seed(db_gateway, contract_names=["first"])
+        self.server = ApiServer(("127.0.0.1", 0), db_gateway=db_gateway)
+        self.server.RequestHandlerClass = QuietRequestHandler
+        thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def request(
+        self, method: str, path: str, body: Optional[bytes] = None, headers: Optional[dict[str, str]] = None
+    ) -> tuple[int, Any]:
+        connection = http.client.HTTPConnection("127.0.0.1", self.server.server_port, timeout=5)
+        self.addCleanup(connection.close)
+        connection.request(method, path, body=body, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+
+    def test_invalid_json(self) -> None:
+        status, body = self.request("POST", "/contracts", body=b"{name")
+        self.assertEqual(status, 400)
+        self.assertIn("must be JSON", body["error"])
+
+    def test_body_that_is_not_utf8(self) -> None:
+        status, body = self.request("POST", "/contracts", body=b'{"name": "\xff"}')
+        self.assertEqual(status, 400)
+        self.assertIn("must be JSON", body["error"])
+
+    def test_invalid_content_length(self) -> None:
+        status, _ = self.request("POST", "/contracts", body=b"[]", headers={"Content-Length": "x"})
+        self.assertEqual(status, 400)
+
+    def test_unknown_status_filter(self) -> None:
+        for path in ("/contracts?status=unknown", "/contracts?status=unknown&count=true"):
+            status, body = self.request("GET", path)
+            self.assertEqual(status, 400)
+            self.assertIn("does not exist", body["error"])
+
+    def test_wrong_contract_status_is_a_conflict(self) -> None:
+        status, _ = self.request("POST", "/contracts/1/complete")
+        self.assertEqual(status, 409)
+
+    def test_unexpected_error(self) -> None:
+        def fail(contract_id: str) -> None:
+            raise RuntimeError("database is gone")
+
+        self.server.contracts_logic.get_record_by_id = fail  # type: ignore[method-assign,assignment]
+        status, body = self.request("GET", "/contracts/1")
+        self.assertEqual((status, body), (500, {"error": "Internal Server Error"}))
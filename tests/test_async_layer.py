@@ -0,0 +1,170 @@
+import asyncio
+import socket
+import time
+import unittest
+
+from psycopg2 import OperationalError
+from psycopg2.extensions import POLL_OK, POLL_READ, POLL_WRITE
+
+from business_logic import AsyncContractsLogic, AsyncProjectLogic
+from data_access.async_db_connector import _wait
+from data_access.dao import AsyncContractsDAO
+from errors import (
+    ConcurrentUpdateError,
+    ContractAlreadyExistError,
+    IncorrectIdError,
+    IncorrectStatusError,
+    PoolTimeoutError,
+    ValidationError,
+)
+from tests.helpers import (
+    create_async_postgresql_gateway,
+    create_postgresql_gateway,
+    seed,
+)
+
+
+class FakeConnection:
+    """Stands in for asynchronous psycopg2 connection: poll() returns the given states one by one."""
+
+    def __init__(self, states: list[int], fd: int) -> None:
+        self.states = states
+        self._fd = fd
+
+    def poll(self) -> int:
+        return self.states.pop(0)
+
+    def fileno(self) -> int:
+        return self._fd
+
+
+class WaitTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.reader, self.writer = socket.socketpair()
+        self.addCleanup(self.reader.close)
+        self.addCleanup(self.writer.close)
+
+    async def test_waits_until_socket_is_ready(self) -> None:
+        conn = FakeConnection([POLL_WRITE, POLL_READ, POLL_OK], fd=self.reader.fileno())
+        waiting = asyncio.ensure_future(_wait(conn))
+        await asyncio.sleep(0.01)
+        # The writable socket wakes the first wait up, the second one waits for data to read.
+        self.assertFalse(waiting.done())
+        self.writer.send(b"x")
+        await asyncio.wait_for(waiting, timeout=1)
+        self.assertEqual(conn.states, [])
+
+    async def test_unexpected_state(self) -> None:
+        with self.assertRaises(OperationalError):
+            await _wait(FakeConnection([-1], fd=self.reader.fileno()))
+
+
+class AsyncLogicTest(unittest.IsolatedAsyncioTestCase):
+    """Runs against the database named by TEST_POSTGRES_DB. Contracts 1 and 2 are active, contract 3 is a draft;
+    projects 1 and 2 have no contract."""
+
+    async def asyncSetUp(self) -> None:
+        db_gateway = create_postgresql_gateway()
+        seed(
+            db_gateway,
+            contract_names=["first", "second", "draft"],
+            active_contract_ids=[1, 2],
+            project_names=["first", "second"],
+        )
+        db_gateway.close()
+        self.db_gateway = create_async_postgresql_gateway()
+        self.addAsyncCleanup(self.db_gateway.close)
+        self.contracts = AsyncContractsLogic(db_gateway=self.db_gateway)
+        self.projects = AsyncProjectLogic(db_gateway=self.db_gateway)
+
+    async def test_pages(self) -> None:
+        await self.contracts.create_record(contract_name="fourth")
+        self.assertEqual([contract.id for contract in await self.contracts.get_page(limit=2)], [1, 2])
+        self.assertEqual([contract.id for contract in await self.contracts.get_page(after_id=2)], [3, 4])
+        self.assertEqual([contract.id for contract in await self.contracts.get_page(before_id=3, limit=1)], [2])
+        self.assertEqual([contract.id for contract in await self.contracts.get_page(status="draft")], [3, 4])
+        self.assertEqual([project.id for project in await self.projects.get_page(after_id=1)], [2])
+
+    async def test_existence_checks(self) -> None:
+        dao = AsyncContractsDAO(db_gateway=self.db_gateway)
+        self.assertEqual([await dao.exists(contract_id) for contract_id in (1, 3, 9)], [True, True, False])
+        self.assertEqual([await dao.is_active(contract_id) for contract_id in (1, 3, 9)], [True, False, False])
+        self.assertEqual(await self.projects.get_active_contracts_ids(), [(1,), (2,)])
+
+    async def test_update_data(self) -> None:
+        await self.contracts.update_data(contract_id="3", required_status="draft", new_status="active")
+        contract = await self.contracts.get_record_by_id(contract_id="3")
+        self.assertEqual((contract.status, contract.version), ("active", 2))
+        self.assertIsNotNone(contract.signing_date)
+        with self.assertRaises(IncorrectStatusError):
+            await self.contracts.update_data(contract_id="3", required_status="draft", new_status="active")
+        with self.assertRaises(IncorrectIdError):
+            await self.contracts.get_record_by_id(contract_id="9")
+
+    async def test_outdated_version_is_rejected(self) -> None:
+        dao = AsyncContractsDAO(db_gateway=self.db_gateway)
+        first_copy = await dao.get_contract_info_by_id(contract_id=3)
+        second_copy = await dao.get_contract_info_by_id(contract_id=3)
+        assert first_copy is not None and second_copy is not None
+        first_copy.name = "first change"
+        await dao.update_record(data=first_copy)
+        second_copy.name = "second change"
+        with self.assertRaises(ConcurrentUpdateError):
+            await dao.update_record(data=second_copy)
+        self.assertEqual((await self.contracts.get_record_by_id(contract_id="3")).name, "first change")
+
+    async def test_add_contract_to_project(self) -> None:
+        await self.projects.add_contract_to_project(project_id="1", contract_id="1")
+        self.assertEqual((await self.projects.get_record_by_id(project_id="1")).contract_id, 1)
+        self.assertEqual((await self.contracts.get_record_by_id(contract_id="1")).project_id, 1)
+        with self.assertRaisesRegex(ValidationError, "must be active"):
+            await self.projects.add_contract_to_project(project_id="2", contract_id="3")
+        with self.assertRaises(IncorrectIdError):
+            await self.projects.add_contract_to_project(project_id="9", contract_id="2")
+        with self.assertRaises(ContractAlreadyExistError):
+            await self.projects.add_contract_to_project(project_id="1", contract_id="2")
+        await self.projects.remove_active_contract_from_project(contract_id="1")
+        self.assertIsNone((await self.projects.get_record_by_id(project_id="1")).contract_id)
+
+    async def test_concurrent_links_to_one_project(self) -> None:
+        results = await asyncio.gather(
+            self.projects.add_contract_to_project(project_id="1", contract_id="1"),
+            self.projects.add_contract_to_project(project_id="1", contract_id="2"),
+            return_exceptions=True,
+        )
+        self.assertEqual(sum(result is None for result in results), 1)
+        self.assertEqual(sum(isinstance(result, ContractAlreadyExistError) for result in results), 1)
+
+    async def test_rollback_on_error(self) -> None:
+        with self.assertRaises(RuntimeError):
+            async with self.db_gateway.transaction() as cursor:
+                await cursor.execute("UPDATE contracts SET name = 'renamed' WHERE id = 1;")
+                raise RuntimeError
+        self.assertEqual((await self.contracts.get_record_by_id(contract_id="1")).name, "first")
+
+
+class AsyncPoolTest(unittest.IsolatedAsyncioTestCase):
+    """Runs against the database named by TEST_POSTGRES_DB."""
+
+    async def test_queries_run_concurrently(self) -> None:
+        db_gateway = create_async_postgresql_gateway(max_size=5)
+        self.addAsyncCleanup(db_gateway.close)
+
+        async def sleep() -> None:
+            async with db_gateway.transaction() as cursor:
+                await cursor.execute("SELECT pg_sleep(0.2);")
+
+        started = time.monotonic()
+        await asyncio.gather(*(sleep() for _ in range(5)))
+        self.assertLess(time.monotonic() - started, 0.8)
+
+    async def test_timeout_when_pool_is_exhausted(self) -> None:
+        db_gateway = create_async_postgresql_gateway(max_size=1, acquire_timeout=0.1)
+        self.addAsyncCleanup(db_gateway.close)
+        async with db_gateway.transaction():
+            with self.assertRaises(PoolTimeoutError):
+                async with db_gateway.transaction():
+                    pass
+        async with db_gateway.transaction() as cursor:
+            await cursor.execute("SELECT 1;")
+            self.assertEqual(cursor.fetchone(), (1,))
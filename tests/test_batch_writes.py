@@ -0,0 +1,88 @@
+import unittest
+from types import SimpleNamespace
+from typing import Any, Sequence, Union
+
+from psycopg2 import IntegrityError
+
+from business_logic import ProjectLogic
+from data_access.dao.base import BaseDAO
+from data_access.memory_gateway import InMemoryGateway
+
+
+class FakeCursor:
+    """Stands in for psycopg2 cursor under execute_values: a statement fails if it contains a rejected row,
+    otherwise it returns the first value of every row."""
+
+    def __init__(self, rejected: set[Any]) -> None:
+        self.connection = SimpleNamespace(encoding="UTF8")
+        self.savepoint_statements: list[str] = []
+        self._rejected = rejected
+        self._pending: list[Sequence[Any]] = []
+        self._result: list[tuple] = []
+
+    def mogrify(self, template: bytes, args: Sequence[Any]) -> bytes:
+        self._pending.append(args)
+        return b"(row)"
+
+    def execute(self, query: Union[str, bytes], params: Any = None) -> None:
+        if isinstance(query, str):
+            self.savepoint_statements.append(query)
+            return
+        rows, self._pending = self._pending, []
+        for row in rows:
+            if row[0] in self._rejected:
+                raise IntegrityError(f"row {row[0]} rejected")
+        self._result = [(row[0],) for row in rows]
+
+    def fetchall(self) -> list[tuple]:
+        return self._result
+
+
+class ExecuteValuesInPagesTest(unittest.TestCase):
+    def test_pages_without_errors_are_written_at_once(self) -> None:
+        cursor = FakeCursor(rejected=set())
+        returned, failed = BaseDAO._execute_values_in_pages(
+            cursor=cursor, sql="INSERT INTO t (id) VALUES %s", rows=[(1,), (2,), (3,)], page_size=2
+        )
+        self.assertEqual(returned, [(1,), (2,), (3,)])
+        self.assertEqual(failed, [])
+        self.assertEqual(
+            cursor.savepoint_statements,
+            ["SAVEPOINT batch_page;", "RELEASE SAVEPOINT batch_page;"] * 2,
+        )
+
+    def test_failing_page_is_retried_row_by_row(self) -> None:
+        cursor = FakeCursor(rejected={3})
+        returned, failed = BaseDAO._execute_values_in_pages(
+            cursor=cursor,
+            sql="INSERT INTO t (id) VALUES %s",
+            rows=[(1,), (2,), (3,), (4,), (5,)],
+            page_size=2,
+        )
+        self.assertEqual(returned, [(1,), (2,), (4,), (5,)])
+        self.assertEqual(failed, [(2, "row 3 rejected")])
+        self.assertEqual(
+            cursor.savepoint_statements,
+            [
+                "SAVEPOINT batch_page;",
+                "RELEASE SAVEPOINT batch_page;",
+                "SAVEPOINT batch_page;",
+                "ROLLBACK TO SAVEPOINT batch_page;",
+                "SAVEPOINT batch_row;",
+                "ROLLBACK TO SAVEPOINT batch_row;",
+                "SAVEPOINT batch_row;",
+                "RELEASE SAVEPOINT batch_row;",
+                "SAVEPOINT batch_page;",
+                "RELEASE SAVEPOINT batch_page;",
+            ],
+        )
+
+
+class CreateRecordsTest(unittest.TestCase):
+    def test_duplicate_names_are_reported_by_index(self) -> None:
+        logic = ProjectLogic(db_gateway=InMemoryGateway())
+        logic.create_records(project_names=["existing"])
+        result = logic.create_records(project_names=["first", "existing", "second"], page_size=2)
+        self.assertEqual(result.written, 2)
+        self.assertEqual([index for index, _ in result.failed], [1])
+        self.assertEqual([project.name for project in logic.get_all_data()], ["existing", "first", "second"])
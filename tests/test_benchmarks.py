@@ -0,0 +1,33 @@
+import unittest
+
+from benchmarks.run import Benchmark, measure
+from data_access.memory_gateway import InMemoryGateway
+
+
+class MeasureTest(unittest.TestCase):
+    def test_operation_is_called_with_every_arguments_tuple(self) -> None:
+        calls: list[tuple[int, int]] = []
+        result = measure("append", lambda first, second: calls.append((first, second)), [(1, 2), (3, 4)])
+        self.assertEqual(calls, [(1, 2), (3, 4)])
+        self.assertEqual(result["calls"], 2)
+        self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+
+
+class BenchmarkTest(unittest.TestCase):
+    def test_scenarios_run_against_memory_backend(self) -> None:
+        benchmark = Benchmark(db_gateway=InMemoryGateway(), contracts=20, operations=5)
+        benchmark.seed()
+        results = benchmark.run()
+        self.assertEqual(
+            list(results),
+            [
+                "get_all_contracts_info",
+                "create_record",
+                "update_data",
+                "add_contract_to_project",
+                "remove_active_contract_from_project",
+            ],
+        )
+        self.assertEqual(results["get_all_contracts_info"]["calls"], 3)
+        for name in ("create_record", "update_data", "add_contract_to_project", "remove_active_contract_from_project"):
+            self.assertEqual(results[name]["calls"], 5, name)
@@ -0,0 +1,65 @@
+import unittest
+from typing import Iterator
+
+from business_logic import ContractsLogic
+from data_access.dao.base import CopyStream
+from data_access.dto import ContractsDTO, ImportResultDTO
+from data_access.memory_gateway import InMemoryGateway
+
+
+class CopyStreamTest(unittest.TestCase):
+    def test_rows_are_rendered_as_csv(self) -> None:
+        stream = CopyStream([(1, "plain", None), (2, 'with "quotes", comma', "2024-01-31")])
+        self.assertEqual(stream.read(), '1,plain,\n2,"with ""quotes"", comma",2024-01-31\n')
+
+    def test_read_returns_at_most_size_characters(self) -> None:
+        rows = [(number, f"name {number}") for number in range(100)]
+        expected = "".join(f"{number},name {number}\n" for number in range(100))
+        stream = CopyStream(rows)
+        chunks: list[str] = []
+        while chunk := stream.read(7):
+            self.assertLessEqual(len(chunk), 7)
+            chunks.append(chunk)
+        self.assertEqual("".join(chunks), expected)
+
+    def test_rows_are_consumed_lazily(self) -> None:
+        consumed: list[int] = []
+
+        def rows() -> Iterator[tuple[int]]:
+            for number in range(1000):
+                consumed.append(number)
+                yield (number,)
+
+        stream = CopyStream(rows())
+        self.assertEqual(stream.read(4), "0\n1\n")
+        self.assertEqual(consumed, [0, 1])
+
+    def test_empty_rows(self) -> None:
+        self.assertEqual(CopyStream([]).read(8192), "")
+
+
+class ImportRecordsTest(unittest.TestCase):
+    def test_invalid_records_are_reported_and_others_imported(self) -> None:
+        logic = ContractsLogic(db_gateway=InMemoryGateway())
+        logic.create_records(contract_names=["existing"])
+        result = logic.import_records(
+            records=[
+                ContractsDTO(name="first"),
+                ContractsDTO(name=""),
+                ContractsDTO(name="existing"),
+                ContractsDTO(name="second", status="unknown"),
+                ContractsDTO(name="third", status="active"),
+            ]
+        )
+        self.assertEqual(
+            result,
+            ImportResultDTO(
+                imported=2,
+                rejected=[
+                    (2, "", "empty name"),
+                    (3, "existing", "name already exists"),
+                    (4, "second", "unknown status"),
+                ],
+            ),
+        )
+        self.assertEqual([contract.status for contract in logic.get_all_data()], ["draft", "draft", "active"])
@@ -0,0 +1,80 @@
+import unittest
+
+from batch import transition_outcomes
+from data_access.dto import TransitionResultDTO
+from errors import ValidationError
+from tests.helpers import (
+    Gateway,
+    create_memory_gateway,
+    create_postgresql_gateway,
+    seed,
+)
+from validators import MAX_ID, validate_ids_list
+
+
+class BulkTransitionTest(unittest.TestCase):
+    """Contracts 1 and 2 are drafts, contract 3 is active and linked to project 1."""
+
+    def create_gateway(self) -> Gateway:
+        return create_memory_gateway()
+
+    def setUp(self) -> None:
+        db_gateway = self.create_gateway()
+        self.addCleanup(db_gateway.close)
+        self.contracts, self.projects = seed(
+            db_gateway, contract_names=["first", "second", "third"], active_contract_ids=[3], project_names=["project"]
+        )
+        self.projects.add_contract_to_project(project_id="1", contract_id="3")
+
+    def test_confirm_outcomes(self) -> None:
+        self.assertEqual(
+            self.contracts.confirm_many(contract_ids=[9, 1, 3, 1]),
+            [
+                TransitionResultDTO(contract_id=9, outcome="not_found"),
+                TransitionResultDTO(contract_id=1, outcome="updated"),
+                TransitionResultDTO(contract_id=3, outcome="wrong_status"),
+            ],
+        )
+        confirmed = self.contracts.get_record_by_id(contract_id="1")
+        self.assertEqual(confirmed.status, "active")
+        self.assertIsNotNone(confirmed.signing_date)
+        self.assertEqual(self.contracts.get_record_by_id(contract_id="2").status, "draft")
+
+    def test_complete_detaches_projects(self) -> None:
+        self.contracts.confirm_many(contract_ids=[2])
+        self.assertEqual(
+            self.contracts.complete_many(contract_ids=[3, 2, 1]),
+            [
+                TransitionResultDTO(contract_id=3, outcome="updated", detached_project_id=1),
+                TransitionResultDTO(contract_id=2, outcome="updated"),
+                TransitionResultDTO(contract_id=1, outcome="wrong_status"),
+            ],
+        )
+        self.assertEqual(self.contracts.get_record_by_id(contract_id="3").status, "completed")
+        self.assertIsNone(self.projects.get_record_by_id(project_id="1").contract_id)
+
+    def test_batch_outcomes(self) -> None:
+        outcomes = transition_outcomes(["1", "x", "3", "2147483648"], self.contracts.confirm_many, "draft")
+        self.assertEqual([outcome["ok"] for outcome in outcomes], [True, False, False, False])
+        self.assertEqual([outcome["id"] for outcome in outcomes], [1, "x", 3, 2147483648])
+        self.assertIn("must be digit", outcomes[1]["error"])
+        self.assertIn("status 'draft'", outcomes[2]["error"])
+        self.assertIn(str(MAX_ID), outcomes[3]["error"])
+
+
+class PostgreSQLBulkTransitionTest(BulkTransitionTest):
+    """Runs the set-based transition statement (unnest ... WITH ORDINALITY) against PostgreSQL."""
+
+    def create_gateway(self) -> Gateway:
+        return create_postgresql_gateway()
+
+
+class ValidateIdsListTest(unittest.TestCase):
+    def test_valid(self) -> None:
+        validate_ids_list([1, MAX_ID])
+        validate_ids_list([])
+
+    def test_invalid(self) -> None:
+        for entered_ids in ([0], [-1], [MAX_ID + 1], [True], ["1"], [1.0], "1", None):
+            with self.subTest(entered_ids=entered_ids), self.assertRaises(ValidationError):
+                validate_ids_list(entered_ids)
@@ -0,0 +1,64 @@
+import unittest
+
+from data_access.cache import LRUCache
+
+
+class LRUCacheTest(unittest.TestCase):
+    def test_loaded_value_is_cached(self) -> None:
+        cache = LRUCache(max_size=10, ttl=None)
+        loads: list[str] = []
+
+        def loader() -> str:
+            loads.append("value")
+            return "value"
+
+        self.assertEqual(cache.get_or_load("key", loader), "value")
+        self.assertEqual(cache.get_or_load("key", loader), "value")
+        self.assertEqual(len(loads), 1)
+        self.assertEqual(cache.stats(), {"size": 1, "hits": 1, "misses": 1, "evictions": 0})
+
+    def test_missing_value_is_not_cached(self) -> None:
+        cache = LRUCache(max_size=10, ttl=None)
+        cache.get_or_load("key", lambda: None)
+        self.assertEqual(cache.get_or_load("key", lambda: "value"), "value")
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = LRUCache(max_size=2, ttl=None)
+        cache.get_or_load("a", lambda: 1)
+        cache.get_or_load("b", lambda: 2)
+        cache.get_or_load("a", lambda: 0)
+        cache.get_or_load("c", lambda: 3)
+        self.assertEqual(cache.get_or_load("a", lambda: 0), 1)
+        self.assertEqual(cache.get_or_load("b", lambda: 0), 0)
+        self.assertEqual(cache.stats()["evictions"], 2)
+
+    def test_expired_entry_is_loaded_again(self) -> None:
+        cache = LRUCache(max_size=10, ttl=-1.0)
+        cache.get_or_load("key", lambda: "old")
+        self.assertEqual(cache.get_or_load("key", lambda: "new"), "new")
+
+    def test_value_loaded_during_invalidation_is_not_cached(self) -> None:
+        cache = LRUCache(max_size=10, ttl=None)
+
+        def stale_loader() -> str:
+            # The row is changed and its entry invalidated while the old value is being loaded.
+            cache.invalidate("key")
+            return "stale"
+
+        self.assertEqual(cache.get_or_load("key", stale_loader), "stale")
+        self.assertEqual(cache.get_or_load("key", lambda: "fresh"), "fresh")
+
+    def test_value_loaded_during_clear_is_not_cached(self) -> None:
+        cache = LRUCache(max_size=10, ttl=None)
+
+        def stale_loader() -> str:
+            cache.clear()
+            return "stale"
+
+        cache.get_or_load("key", stale_loader)
+        self.assertEqual(cache.get_or_load("key", lambda: "fresh"), "fresh")
+
+    def test_zero_size_disables_caching(self) -> None:
+        cache = LRUCache(max_size=0, ttl=None)
+        cache.get_or_load("key", lambda: "old")
+        self.assertEqual(cache.get_or_load("key", lambda: "new"), "new")
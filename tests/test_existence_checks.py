@@ -0,0 +1,58 @@
+import unittest
+
+from data_access.dao import create_contracts_dao
+from errors import ValidationError
+from tests.helpers import (
+    Gateway,
+    create_memory_gateway,
+    create_postgresql_gateway,
+    seed,
+)
+from validators import validate_active_contract_id
+
+
+class ContractChecksTest(unittest.TestCase):
+    """Contract 1 is active, contract 2 is a draft."""
+
+    def create_gateway(self) -> Gateway:
+        return create_memory_gateway()
+
+    def setUp(self) -> None:
+        db_gateway = self.create_gateway()
+        self.addCleanup(db_gateway.close)
+        seed(db_gateway, contract_names=["active", "draft"], active_contract_ids=[1])
+        self.dao = create_contracts_dao(db_gateway=db_gateway)
+
+    def test_exists(self) -> None:
+        self.assertEqual([self.dao.exists(contract_id) for contract_id in (1, 2, 3)], [True, True, False])
+
+    def test_is_active(self) -> None:
+        self.assertEqual([self.dao.is_active(contract_id) for contract_id in (1, 2, 3)], [True, False, False])
+
+
+class PostgreSQLContractChecksTest(ContractChecksTest):
+    def create_gateway(self) -> Gateway:
+        return create_postgresql_gateway()
+
+
+class ValidateActiveContractIdTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.checked_ids: list[int] = []
+
+    def is_active(self, contract_id: int) -> bool:
+        self.checked_ids.append(contract_id)
+        return contract_id == 1
+
+    def test_active_contract(self) -> None:
+        validate_active_contract_id(entered_id="1", is_active=self.is_active)
+        self.assertEqual(self.checked_ids, [1])
+
+    def test_inactive_contract(self) -> None:
+        with self.assertRaisesRegex(ValidationError, "must be active"):
+            validate_active_contract_id(entered_id="2", is_active=self.is_active)
+
+    def test_id_format_is_checked_before_the_lookup(self) -> None:
+        for entered_id in ("x", "-1", "2147483648"):
+            with self.assertRaises(ValidationError):
+                validate_active_contract_id(entered_id=entered_id, is_active=self.is_active)
+        self.assertEqual(self.checked_ids, [])
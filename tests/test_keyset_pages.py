@@ -0,0 +1,60 @@
+import unittest
+
+from business_logic import ContractsLogic
+from data_access.dao.base import build_keyset_page_query
+from data_access.memory_gateway import InMemoryGateway
+
+
+class BuildKeysetPageQueryTest(unittest.TestCase):
+    def test_next_page(self) -> None:
+        query, params, is_reversed = build_keyset_page_query(
+            select_sql="SELECT id FROM contracts", id_column="id", limit=10, after_id=5
+        )
+        self.assertEqual(query, "SELECT id FROM contracts WHERE id > %s ORDER BY id ASC LIMIT %s;")
+        self.assertEqual(params, [5, 10])
+        self.assertFalse(is_reversed)
+
+    def test_previous_page_is_fetched_in_descending_order(self) -> None:
+        query, params, is_reversed = build_keyset_page_query(
+            select_sql="SELECT id FROM contracts", id_column="id", limit=10, before_id=5
+        )
+        self.assertEqual(query, "SELECT id FROM contracts WHERE id < %s ORDER BY id DESC LIMIT %s;")
+        self.assertEqual(params, [5, 10])
+        self.assertTrue(is_reversed)
+
+    def test_conditions_precede_bounds(self) -> None:
+        query, params, _ = build_keyset_page_query(
+            select_sql="SELECT id FROM contracts",
+            id_column="id",
+            limit=10,
+            after_id=1,
+            before_id=9,
+            conditions=[("status_id = %s", 2)],
+        )
+        self.assertEqual(
+            query, "SELECT id FROM contracts WHERE status_id = %s AND id > %s AND id < %s ORDER BY id ASC LIMIT %s;"
+        )
+        self.assertEqual(params, [2, 1, 9, 10])
+
+
+class ContractPagesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.logic = ContractsLogic(db_gateway=InMemoryGateway())
+        self.logic.create_records(contract_names=[f"contract {number}" for number in range(1, 8)])
+
+    def test_pages_follow_each_other(self) -> None:
+        first_page = self.logic.get_page(limit=3)
+        second_page = self.logic.get_page(after_id=first_page[-1].id, limit=3)
+        last_page = self.logic.get_page(after_id=second_page[-1].id, limit=3)
+        self.assertEqual([contract.id for contract in first_page], [1, 2, 3])
+        self.assertEqual([contract.id for contract in second_page], [4, 5, 6])
+        self.assertEqual([contract.id for contract in last_page], [7])
+
+    def test_previous_page_is_in_ascending_order(self) -> None:
+        page = self.logic.get_page(before_id=6, limit=3)
+        self.assertEqual([contract.id for contract in page], [3, 4, 5])
+
+    def test_status_filter(self) -> None:
+        self.logic.confirm_many(contract_ids=[2, 5, 7])
+        page = self.logic.get_page(after_id=2, limit=10, status="active")
+        self.assertEqual([contract.id for contract in page], [5, 7])
@@ -0,0 +1,60 @@
+import unittest
+from datetime import date, datetime, timezone
+
+from psycopg2 import IntegrityError
+
+from data_access.dto import ContractsDTO, ProjectsDTO
+from data_access.memory_gateway import InMemoryStore, in_date_range, select_page
+
+
+class InMemoryStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.store = InMemoryStore()
+        self.contract_id = self.store.insert_contract(ContractsDTO(name="contract"))
+        self.project_id = self.store.insert_project(ProjectsDTO(name="project"))
+
+    def test_dates_are_stored_as_dates(self) -> None:
+        contract_id = self.store.insert_contract(
+            ContractsDTO(name="signed", signing_date=datetime(2024, 5, 1, 23, 30, tzinfo=timezone.utc))
+        )
+        self.assertEqual(self.store.contracts[contract_id].signing_date, date(2024, 5, 1))
+        self.assertIs(type(self.store.contracts[contract_id].creation_date), date)
+
+    def test_names_are_unique(self) -> None:
+        with self.assertRaisesRegex(IntegrityError, "contracts_name_key"):
+            self.store.insert_contract(ContractsDTO(name="contract"))
+        with self.assertRaisesRegex(IntegrityError, "projects_name_key"):
+            self.store.insert_project(ProjectsDTO(name="project"))
+
+    def test_foreign_keys_are_checked(self) -> None:
+        with self.assertRaisesRegex(IntegrityError, "foreign key"):
+            self.store.insert_contract(ContractsDTO(name="other", project_id=99))
+        with self.assertRaisesRegex(IntegrityError, "foreign key"):
+            self.store.insert_project(ProjectsDTO(name="other", contract_id=99))
+
+    def test_contract_is_active_in_one_project_only(self) -> None:
+        self.store.insert_project(ProjectsDTO(name="first", contract_id=self.contract_id))
+        with self.assertRaisesRegex(IntegrityError, "projects_active_contract_id_key"):
+            self.store.insert_project(ProjectsDTO(name="second", contract_id=self.contract_id))
+
+    def test_update_of_outdated_version_is_rejected(self) -> None:
+        contract = self.store.contracts[self.contract_id]
+        self.assertEqual(self.store.update_contract(ContractsDTO(name="renamed", id=self.contract_id, version=1)), 2)
+        self.assertIsNone(self.store.update_contract(ContractsDTO(name="again", id=self.contract_id, version=1)))
+        self.assertEqual((contract.name, contract.version), ("renamed", 2))
+
+
+class HelpersTest(unittest.TestCase):
+    def test_in_date_range_compares_dates(self) -> None:
+        day = date(2024, 5, 1)
+        self.assertTrue(in_date_range(day, datetime(2024, 5, 1, 12), datetime(2024, 5, 1, 13)))
+        self.assertFalse(in_date_range(day, date(2024, 5, 2), None))
+        self.assertFalse(in_date_range(None, day, None))
+        self.assertTrue(in_date_range(None, None, None))
+
+    def test_select_page(self) -> None:
+        ids = [1, 2, 4, 5, 7, 8]
+        even = select_page(ids, load=lambda row_id: row_id, matches=lambda row_id: row_id % 2 == 0, limit=2)
+        self.assertEqual(even, [2, 4])
+        self.assertEqual(select_page(ids, load=int, matches=bool, limit=2, after_id=4), [5, 7])
+        self.assertEqual(select_page(ids, load=int, matches=bool, limit=2, before_id=7), [4, 5])
@@ -0,0 +1,24 @@
+import unittest
+
+from data_access.migrations import MIGRATIONS_DIR, split_statements
+
+
+class SplitStatementsTest(unittest.TestCase):
+    def test_statements_end_with_semicolon(self) -> None:
+        self.assertEqual(
+            split_statements("-- migrate: no-transaction\nCREATE INDEX a ON t (x);\n\nDROP INDEX b;\n"),
+            [("-- migrate: no-transaction\nCREATE INDEX a ON t (x)", False), ("DROP INDEX b", False)],
+        )
+
+    def test_gexec_query(self) -> None:
+        self.assertEqual(
+            split_statements("SELECT format('CREATE INDEX i ON t (x) WHERE y = %s', 1) \\gexec\nDROP INDEX b"),
+            [("SELECT format('CREATE INDEX i ON t (x) WHERE y = %s', 1)", True), ("DROP INDEX b", False)],
+        )
+
+    def test_active_contracts_index_is_built_from_status_name(self) -> None:
+        sql = (MIGRATIONS_DIR / "0006_contracts_active_id_index.sql").read_text(encoding="utf-8")
+        [(statement, is_gexec)] = split_statements(sql)
+        self.assertTrue(is_gexec)
+        self.assertIn("WHERE name = 'active'", statement)
+        self.assertIn("CREATE INDEX CONCURRENTLY", statement)
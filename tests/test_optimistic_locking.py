@@ -0,0 +1,77 @@
+import unittest
+
+from data_access.dao import create_contracts_dao, create_projects_dao
+from errors import ConcurrentUpdateError
+from tests.helpers import (
+    Gateway,
+    create_memory_gateway,
+    create_postgresql_gateway,
+    seed,
+)
+
+
+class OptimisticLockingTest(unittest.TestCase):
+    """Contracts 1 and 2 and project 1 are at version 1."""
+
+    def create_gateway(self) -> Gateway:
+        return create_memory_gateway()
+
+    def setUp(self) -> None:
+        db_gateway = self.create_gateway()
+        self.addCleanup(db_gateway.close)
+        seed(db_gateway, contract_names=["first", "second"], project_names=["project"])
+        self.contracts_dao = create_contracts_dao(db_gateway=db_gateway)
+        self.projects_dao = create_projects_dao(db_gateway=db_gateway)
+
+    def test_update_increments_version(self) -> None:
+        contract = self.contracts_dao.get_contract_info_by_id(contract_id=1)
+        assert contract is not None
+        contract.name = "renamed"
+        self.contracts_dao.update_record(data=contract)
+        self.assertEqual(contract.version, 2)
+        stored = self.contracts_dao.get_contract_info_by_id(contract_id=1)
+        assert stored is not None
+        self.assertEqual((stored.name, stored.version), ("renamed", 2))
+
+    def test_later_update_of_the_same_version_fails(self) -> None:
+        first_copy = self.contracts_dao.get_contract_info_by_id(contract_id=1)
+        second_copy = self.contracts_dao.get_contract_info_by_id(contract_id=1)
+        assert first_copy is not None and second_copy is not None
+        first_copy.name = "first change"
+        self.contracts_dao.update_record(data=first_copy)
+        second_copy.name = "second change"
+        with self.assertRaises(ConcurrentUpdateError):
+            self.contracts_dao.update_record(data=second_copy)
+        stored = self.contracts_dao.get_contract_info_by_id(contract_id=1)
+        assert stored is not None
+        self.assertEqual(stored.name, "first change")
+
+    def test_project_conflict(self) -> None:
+        first_copy = self.projects_dao.get_info_by_id(entered_id=1)
+        second_copy = self.projects_dao.get_info_by_id(entered_id=1)
+        assert first_copy is not None and second_copy is not None
+        first_copy.name = "first change"
+        self.projects_dao.update_record(data=first_copy)
+        with self.assertRaises(ConcurrentUpdateError):
+            self.projects_dao.update_record(data=second_copy)
+
+    def test_batch_update_reports_changed_rows(self) -> None:
+        records = sorted(self.contracts_dao.get_all_contracts_info(), key=lambda contract: contract.id or 0)
+        changed = self.contracts_dao.get_contract_info_by_id(contract_id=2)
+        assert changed is not None
+        self.contracts_dao.update_record(data=changed)
+        for record in records:
+            record.name = f"{record.name} renamed"
+        result = self.contracts_dao.update_records(records=records)
+        self.assertEqual(result.written, 1)
+        self.assertEqual([index for index, _ in result.failed], [1])
+        self.assertEqual(records[0].version, 2)
+        stored = {contract.id: contract.name for contract in self.contracts_dao.get_all_contracts_info()}
+        self.assertEqual(stored, {1: "first renamed", 2: "second"})
+
+
+class PostgreSQLOptimisticLockingTest(OptimisticLockingTest):
+    """Runs the version-checked UPDATE ... RETURNING statements against PostgreSQL."""
+
+    def create_gateway(self) -> Gateway:
+        return create_postgresql_gateway()
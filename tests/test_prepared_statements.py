@@ -0,0 +1,33 @@
+import unittest
+
+from data_access.dao.projects import ADD_ACTIVE_CONTRACT_SQL
+from data_access.prepared_statements import to_positional
+
+
+class ToPositionalTest(unittest.TestCase):
+    def test_positional_placeholders(self) -> None:
+        query, params = to_positional("SELECT id FROM contracts WHERE id > %s AND status_id = %s LIMIT %s;", (5, 2, 10))
+        self.assertEqual(query, "SELECT id FROM contracts WHERE id > $1 AND status_id = $2 LIMIT $3;")
+        self.assertEqual(params, [5, 2, 10])
+
+    def test_repeated_named_placeholder_gets_one_number(self) -> None:
+        query, params = to_positional(
+            "UPDATE contracts SET project_id = %(project_id)s "
+            "WHERE id = %(contract_id)s AND project_id <> %(project_id)s",
+            {"contract_id": 3, "project_id": 7, "unused": 0},
+        )
+        self.assertEqual(query, "UPDATE contracts SET project_id = $1 WHERE id = $2 AND project_id <> $1")
+        self.assertEqual(params, [7, 3])
+
+    def test_escaped_percent_is_unescaped(self) -> None:
+        query, params = to_positional("SELECT id FROM contracts WHERE name ILIKE %s OR %s <%% name;", ["%a%", "a"])
+        self.assertEqual(query, "SELECT id FROM contracts WHERE name ILIKE $1 OR $2 <% name;")
+        self.assertEqual(params, ["%a%", "a"])
+
+    def test_link_statement(self) -> None:
+        query, params = to_positional(
+            ADD_ACTIVE_CONTRACT_SQL, {"project_id": 1, "contract_id": 2, "active_status_id": 3}
+        )
+        self.assertNotIn("%", query)
+        self.assertEqual(params, [1, 2, 3])
+        self.assertEqual(query.count("$2"), 2)
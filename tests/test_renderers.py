@@ -0,0 +1,89 @@
+import io
+import unittest
+from datetime import date
+
+from ui_layer.renderers import (
+    BaseRenderer,
+    CsvRenderer,
+    JsonLinesRenderer,
+    TableRenderer,
+    create_renderer,
+)
+
+
+class RecordingStream(io.StringIO):
+    """Text stream remembering every written piece."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes: list[str] = []
+
+    def write(self, text: str) -> int:
+        self.writes.append(text)
+        return super().write(text)
+
+
+class TableRendererTest(unittest.TestCase):
+    def test_table(self) -> None:
+        stream = io.StringIO()
+        count = TableRenderer(columns=["id", "name"], stream=stream).render([(1, "first"), (22, None)])
+        self.assertEqual(count, 2)
+        self.assertEqual(
+            stream.getvalue(),
+            "+----+-------+\n"
+            "| id | name  |\n"
+            "|----+-------|\n"
+            "|  1 | first |\n"
+            "| 22 |       |\n"
+            "+----+-------+\n",
+        )
+
+    def test_values_longer_than_sample_are_cut_with_ellipsis(self) -> None:
+        stream = io.StringIO()
+        TableRenderer(columns=["name"], stream=stream, sample_size=1).render([("short",), ("much longer",)])
+        self.assertIn("| much… |\n", stream.getvalue())
+
+    def test_nothing_is_written_without_rows(self) -> None:
+        stream = io.StringIO()
+        self.assertEqual(TableRenderer(columns=["id"], stream=stream).render([]), 0)
+        self.assertEqual(stream.getvalue(), "")
+
+    def test_rows_are_written_in_chunks(self) -> None:
+        stream = RecordingStream()
+        TableRenderer(columns=["id"], stream=stream, chunk_size=2, sample_size=1).render(
+            (number,) for number in range(5)
+        )
+        rows_writes = stream.writes[1:-1]
+        self.assertEqual([chunk.count("\n") for chunk in rows_writes], [2, 2, 1])
+
+
+class JsonLinesRendererTest(unittest.TestCase):
+    def test_rows_are_json_objects(self) -> None:
+        stream = io.StringIO()
+        JsonLinesRenderer(columns=["id", "signed"], stream=stream).render([(1, date(2024, 5, 1)), (2, None)])
+        self.assertEqual(stream.getvalue(), '{"id": 1, "signed": "2024-05-01"}\n{"id": 2, "signed": null}\n')
+
+
+class CsvRendererTest(unittest.TestCase):
+    def test_header_and_rows(self) -> None:
+        stream = io.StringIO()
+        CsvRenderer(columns=["id", "name", "signed"], stream=stream).render([(1, "a, b", date(2024, 5, 1))])
+        self.assertEqual(stream.getvalue(), 'id,name,signed\r\n1,"a, b",2024-05-01\r\n')
+
+
+class CreateRendererTest(unittest.TestCase):
+    def test_known_formats(self) -> None:
+        for output_format, renderer_type in (
+            ("table", TableRenderer),
+            ("jsonl", JsonLinesRenderer),
+            ("csv", CsvRenderer),
+        ):
+            self.assertIsInstance(create_renderer(output_format, columns=["id"]), renderer_type)
+
+    def test_unknown_format(self) -> None:
+        with self.assertRaises(ValueError):
+            create_renderer("xml", columns=["id"])
+
+    def test_base_renderer_is_abstract(self) -> None:
+        with self.assertRaises(TypeError):
+            BaseRenderer(columns=["id"])  # type: ignore[abstract]
@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+
+class StartupTest(unittest.TestCase):
+    def import_module(self, module: str) -> set[str]:
+        """Imports module in a new interpreter without POSTGRES_* variables; returns names of the loaded modules."""
+
+        env = {name: value for name, value in os.environ.items() if not name.startswith("POSTGRES_")}
+        completed = subprocess.run(
+            [sys.executable, "-c", f"import sys, {module}; print('\\n'.join(sys.modules))"],
+            cwd=PROJECT_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        return set(completed.stdout.split())
+
+    def test_main_loads_neither_settings_nor_database_driver(self) -> None:
+        loaded = self.import_module("main")
+        self.assertNotIn("dotenv", loaded)
+        self.assertNotIn("psycopg2", loaded)
+        self.assertNotIn("ui_layer.main_ui", loaded)
+
+    def test_server_reads_no_settings(self) -> None:
+        self.assertNotIn("dotenv", self.import_module("server"))
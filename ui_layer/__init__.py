@@ -1,3 +1,20 @@
-from .main_ui import main_menu_ui
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .main_ui import main_menu_ui
 
 __all__ = ["main_menu_ui"]
+
+# Menus import psycopg2 and the logic layer, so they are loaded when first used, not with the package.
+_LAZY_ATTRIBUTES = {"main_menu_ui": ".main_ui"}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Optional
+from itertools import chain
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
 
-import tabulate
 from psycopg2.errors import IntegrityError
 
 from business_logic import ContractsLogic, ProjectLogic
-from errors import IncorrectIdError, IncorrectStatusError, ValidationError
-
-from .services import BaseMenu, InnerMenu
+from errors import (
+    ConcurrentUpdateError,
+    IncorrectIdError,
+    IncorrectStatusError,
+    ValidationError,
+)
+
+from .renderers import TableRenderer
+from .services import (
+    BROWSE_PAGE_SIZE,
+    DISPLAY_PAGE_SIZE,
+    BaseMenu,
+    InnerMenu,
+    PagedView,
+)
 
 if TYPE_CHECKING:
     from data_access.dto import ContractsDTO
@@ -20,34 +32,81 @@ class Contract:
         self._db_connector = db_connector
         self._logic = ContractsLogic(db_gateway=self._db_connector)
 
+    @staticmethod
+    def _print_table(rows: Iterable[ContractsDTO]) -> None:
+        """Prints contracts as table while they are being fetched."""
+        headers: list[str] = [
+            "ID",
+            "Name",
+            "Creation Date",
+            "Signing Date",
+            "Status",
+            "Related project (ID)",
+        ]
+        displayed_data = (
+            (row.id, row.name, row.creation_date, row.signing_date, row.status, row.project_id) for row in rows
+        )
+        TableRenderer(columns=headers).render(displayed_data)
+
     def display_all_data(self) -> None:
         """Displays all contract information in the database."""
-        data = self._logic.get_all_data()
-        if data == []:
+        data = iter(self._logic.iter_all_data(itersize=DISPLAY_PAGE_SIZE))
+        first_row = next(data, None)
+        if first_row is None:
             print("There aren't any contracts in the database.")
         else:
-            headers: list[str] = [
-                "ID",
-                "Name",
-                "Creation Date",
-                "Signing Date",
-                "Status",
-                "Related project (ID)",
-            ]
-            displayed_data = []
-            for row in data:
-                row_data = [
-                    row.id,
-                    row.name,
-                    row.creation_date,
-                    row.signing_date,
-                    row.status,
-                    row.project_id,
-                ]
-                displayed_data.append(row_data)
-            result = tabulate.tabulate(tabular_data=displayed_data, headers=headers, tablefmt="psql")
             print("\nLIST OF ALL CONTRACTS\n")
-            print(result)
+            self._print_table(chain([first_row], data))
+
+    def browse_contracts(self) -> None:
+        """Displays contracts page by page, optionally filtered by status."""
+        print("\nBROWSE CONTRACTS\n")
+        status = input("Enter status to filter by (draft, active, completed) or leave empty to show all: ").strip()
+
+        def load_page(after_id: Optional[int], before_id: Optional[int]) -> list[ContractsDTO]:
+            return self._logic.get_page(
+                after_id=after_id,
+                before_id=before_id,
+                limit=BROWSE_PAGE_SIZE,
+                status=status or None,
+            )
+
+        paged_view = PagedView(
+            load_page=load_page,
+            render=self._print_table,
+            empty_text="There aren't any contracts in the database.",
+        )
+        try:
+            paged_view()
+        except IncorrectStatusError as err:
+            print(err)
+
+    def search_contracts(self) -> None:
+        """Displays contracts whose name matches entered text."""
+        print("\nSEARCH CONTRACTS BY NAME\n")
+        text = input("Enter contract name or its part: ")
+        try:
+            found = self._logic.search(text=text, limit=BROWSE_PAGE_SIZE)
+        except ValidationError as err:
+            print(err)
+        else:
+            if not found:
+                print("There aren't any contracts matching entered name.")
+            else:
+                self._print_table(found)
+
+    def display_summary(self) -> None:
+        """Displays contract counts per status and project."""
+        summary = self._logic.get_summary()
+        if not summary:
+            print("There aren't any contracts in the database.")
+        else:
+            headers: list[str] = ["Status", "Related project (ID)", "Contracts", "Last signing date"]
+            displayed_data = (
+                (row.status, row.project_id, row.contracts_count, row.last_signing_date) for row in summary
+            )
+            print("\nCONTRACTS SUMMARY\n")
+            TableRenderer(columns=headers).render(displayed_data)
 
     def create_new_contract(self) -> None:
         """Creates new contract in the database."""
@@ -86,6 +145,8 @@ class Contract:
             print(err)
         except ValidationError as err:
             print(err)
+        except ConcurrentUpdateError as err:
+            print(err)
         except IntegrityError as err:
             print(f"\n[DB ERROR]. DETAIL:{err.diag}")
         else:
@@ -95,10 +156,15 @@ class Contract:
                 project_logic = ProjectLogic(db_gateway=self._db_connector)
                 try:
                     project_logic.remove_active_contract_from_project(contract_id=contract_id_value)
-                except ValidationError:
-                    raise
                 except IncorrectIdError:
-                    raise
+                    # Contract has not been added to any project.
+                    pass
+                except IncorrectStatusError as err:
+                    print(err)
+                    return
+                except ConcurrentUpdateError as err:
+                    print(err)
+                    return
                 print(f"Contract with ID {contract_id_value} has been successfully completed.")
 
     def confirm_contract(self, contract_id: Optional[str] = None) -> None:
@@ -153,27 +219,8 @@ class Contract:
         except ValidationError as err:
             print(err)
         else:
-            headers: list[str] = [
-                "ID",
-                "Name",
-                "Creation Date",
-                "Signing Date",
-                "Status",
-                "Related project (ID)",
-            ]
-            displayed_data = [
-                [
-                    result_data.id,
-                    result_data.name,
-                    result_data.creation_date,
-                    result_data.signing_date,
-                    result_data.status,
-                    result_data.project_id,
-                ]
-            ]
-            result = tabulate.tabulate(tabular_data=displayed_data, headers=headers, tablefmt="psql")
             print(f"\nCONTRACT {result_data.id} INFO\n")
-            print(result)
+            self._print_table([result_data])
             specific_contract_menu = self._create_specific_contract_inner_menu(data=result_data)
             specific_contract_menu(entered_id=str(result_data.id))
 
@@ -181,6 +228,9 @@ class Contract:
         title = "CONTRACTS MENU"
         contracts_menu_objects_dict: dict[str, Callable] = {
             "List of all contracts": self.display_all_data,
+            "Browse contracts page by page": self.browse_contracts,
+            "Search by name": self.search_contracts,
+            "Contracts summary": self.display_summary,
             "Add new contract": self.create_new_contract,
             "Get contract info by id": self.get_contract_by_id,
             "Confirm the contract": self.confirm_contract,
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Optional
+from itertools import chain
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
 
-import tabulate
 from psycopg2.errors import IntegrityError
 
 from business_logic import ContractsLogic, ProjectLogic
 from data_access.dto import ProjectsDTO
-from errors import ContractAlreadyExistError, IncorrectIdError, ValidationError
+from errors import (
+    ConcurrentUpdateError,
+    ContractAlreadyExistError,
+    IncorrectIdError,
+    IncorrectStatusError,
+    ValidationError,
+)
 
-from .services import BaseMenu, InnerMenu
+from .renderers import TableRenderer
+from .services import (
+    BROWSE_PAGE_SIZE,
+    DISPLAY_PAGE_SIZE,
+    BaseMenu,
+    InnerMenu,
+    PagedView,
+)
 
 if TYPE_CHECKING:
     from data_access.interfaces import DBGatewayProtocol
@@ -21,30 +34,59 @@ class Project:
         self._logic = ProjectLogic(db_gateway=self._db_connector)
         self._contract_logic = ContractsLogic(db_gateway=self._db_connector)
 
+    @staticmethod
+    def _print_table(rows: Iterable[ProjectsDTO]) -> None:
+        """Prints projects as table while they are being fetched."""
+        headers: list[str] = [
+            "ID",
+            "Name",
+            "Creation Date",
+            "Active contract (ID)",
+        ]
+        displayed_data = ((row.id, row.name, row.creation_date, row.contract_id) for row in rows)
+        TableRenderer(columns=headers).render(displayed_data)
+
     def display_all_data(self) -> None:
         """Displays all projects information in the database."""
-        data = self._logic.get_all_data()
-        if data == []:
+        data = iter(self._logic.iter_all_data(itersize=DISPLAY_PAGE_SIZE))
+        first_row = next(data, None)
+        if first_row is None:
             print("There aren't any contracts in the database.")
         else:
-            headers: list[str] = [
-                "ID",
-                "Name",
-                "Creation Date",
-                "Active contract (ID)",
-            ]
-            displayed_data = []
-            for row in data:
-                row_data = [row.id, row.name, row.creation_date, row.contract_id]
-                displayed_data.append(row_data)
-            result = tabulate.tabulate(tabular_data=displayed_data, headers=headers, tablefmt="psql")
             print("\nLIST OF ALL PROJECTS\n")
-            print(result)
+            self._print_table(chain([first_row], data))
+
+    def browse_projects(self) -> None:
+        """Displays projects page by page."""
+        print("\nBROWSE PROJECTS\n")
+
+        def load_page(after_id: Optional[int], before_id: Optional[int]) -> list[ProjectsDTO]:
+            return self._logic.get_page(after_id=after_id, before_id=before_id, limit=BROWSE_PAGE_SIZE)
+
+        paged_view = PagedView(
+            load_page=load_page,
+            render=self._print_table,
+            empty_text="There aren't any projects in the database.",
+        )
+        paged_view()
+
+    def search_projects(self) -> None:
+        """Displays projects whose name matches entered text."""
+        print("\nSEARCH PROJECTS BY NAME\n")
+        text = input("Enter project name or its part: ")
+        try:
+            found = self._logic.search(text=text, limit=BROWSE_PAGE_SIZE)
+        except ValidationError as err:
+            print(err)
+        else:
+            if not found:
+                print("There aren't any projects matching entered name.")
+            else:
+                self._print_table(found)
 
     def create_new_project(self) -> None:
         """Creates new project in the database."""
-        active_contracts = self._logic.get_active_contracts_ids()
-        if active_contracts == []:
+        if not self._logic.has_active_contracts():
             print(
                 "There aren't any active contracts in the database!\n"
                 "Please create and/or confirm at least one contract!"
@@ -86,17 +128,27 @@ class Project:
 
     def complete_project_active_contract(self, project_id: str) -> None:
         """Completes active contract."""
-        data = self._logic.get_record_by_id(project_id=project_id)
-        active_contract = data.contract_id
-        if not active_contract:
-            raise IncorrectIdError(f"There aren't any projects with transmitted id {project_id}")
-        else:
+        try:
+            data = self._logic.get_record_by_id(project_id=project_id)
+            if not data.contract_id:
+                raise IncorrectIdError(f"Project {project_id} has no active contract.")
             self._contract_logic.update_data(
                 contract_id=str(data.contract_id),
                 required_status="active",
                 new_status="completed",
             )
             self._logic.remove_active_contract_from_project(contract_id=str(data.contract_id))
+        except IncorrectIdError as err:
+            print(err)
+        except IncorrectStatusError as err:
+            print(err)
+        except ValidationError as err:
+            print(err)
+        except ConcurrentUpdateError as err:
+            print(err)
+        except IntegrityError as err:
+            print(f"\n[DB ERROR]. DETAIL:{err.diag}")
+        else:
             print(f"Contract with ID {data.contract_id} has been successfully completed.")
 
     def _create_specific_project_inner_menu(self, data: ProjectsDTO) -> InnerMenu:
@@ -125,23 +177,8 @@ class Project:
         except ValidationError as err:
             print(err)
         else:
-            headers: list[str] = [
-                "ID",
-                "Name",
-                "Creation Date",
-                "Active contract (ID)",
-            ]
-            displayed_data = [
-                [
-                    result_data.id,
-                    result_data.name,
-                    result_data.creation_date,
-                    result_data.contract_id,
-                ]
-            ]
-            result = tabulate.tabulate(tabular_data=displayed_data, headers=headers, tablefmt="psql")
             print(f"\nCONTRACT {result_data.id} INFO\n")
-            print(result)
+            self._print_table([result_data])
             specific_project_menu = self._create_specific_project_inner_menu(data=result_data)
             specific_project_menu(entered_id=str(result_data.id))
 
@@ -149,6 +186,8 @@ class Project:
         title = "PROJECTS MENU"
         project_menu_objects_dict: dict[str, Callable] = {
             "List of all projects": self.display_all_data,
+            "Browse projects page by page": self.browse_projects,
+            "Search by name": self.search_projects,
             "Create new project": self.create_new_project,
             "Add contract to project": self.add_contract_to_project,
             "Get project by id": self.get_project_by_id,
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import sys
+from abc import ABC, abstractmethod
+from datetime import date
+from itertools import chain, islice
+from typing import Any, Iterable, Optional, Sequence, TextIO
+
+from .services import iter_pages
+
+RENDER_CHUNK_SIZE = 100
+WIDTH_SAMPLE_SIZE = 100
+
+
+def _to_text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class BaseRenderer(ABC):
+    """Writes rows to the stream as they arrive, `chunk_size` rows per write, so output starts with the first rows
+    and only one chunk is kept in memory. Nothing is written if there are no rows.
+    :param columns: column names
+    :type columns: Sequence[str]
+    :param stream: stream to write to, standard output by default
+    :type stream: Optional[TextIO]
+    :param chunk_size: number of rows written at once
+    :type chunk_size: int
+    """
+
+    sample_size = 1
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        stream: Optional[TextIO] = None,
+        chunk_size: int = RENDER_CHUNK_SIZE,
+    ) -> None:
+        self._columns = list(columns)
+        self._stream = stream
+        self._chunk_size = chunk_size
+
+    def _begin(self, sample: list[Sequence[Any]]) -> str:
+        """Returns text written before the rows; `sample` is the first rows."""
+        return ""
+
+    @abstractmethod
+    def _format_row(self, row: Sequence[Any]) -> str:
+        """Returns text of one row."""
+
+    def _end(self) -> str:
+        """Returns text written after the rows."""
+        return ""
+
+    def render(self, rows: Iterable[Sequence[Any]]) -> int:
+        """Writes rows and returns their number."""
+        stream = self._stream or sys.stdout
+        iterator = iter(rows)
+        sample = list(islice(iterator, self.sample_size))
+        if not sample:
+            return 0
+        stream.write(self._begin(sample))
+        count = 0
+        for chunk in iter_pages(chain(sample, iterator), page_size=self._chunk_size):
+            stream.write("".join(self._format_row(row) for row in chunk))
+            stream.flush()
+            count += len(chunk)
+        stream.write(self._end())
+        stream.flush()
+        return count
+
+
+class TableRenderer(BaseRenderer):
+    """Writes rows as a psql-style table. Column widths and alignment (numbers to the right) are calculated from the
+    header and the first `sample_size` rows; longer values of later rows are cut to the column width and end with
+    "…", so a cut value is never mistaken for a complete one."""
+
+    sample_size = WIDTH_SAMPLE_SIZE
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        stream: Optional[TextIO] = None,
+        chunk_size: int = RENDER_CHUNK_SIZE,
+        sample_size: int = WIDTH_SAMPLE_SIZE,
+    ) -> None:
+        super().__init__(columns=columns, stream=stream, chunk_size=chunk_size)
+        self.sample_size = sample_size
+        self._widths: list[int] = []
+        self._right_aligned: list[bool] = []
+
+    def _line(self, cells: Sequence[str]) -> str:
+        aligned = [
+            cell.rjust(width) if right else cell.ljust(width)
+            for cell, width, right in zip(cells, self._widths, self._right_aligned)
+        ]
+        return "| " + " | ".join(aligned) + " |\n"
+
+    def _border(self, edge: str, joint: str) -> str:
+        return edge + joint.join("-" * (width + 2) for width in self._widths) + edge + "\n"
+
+    def _begin(self, sample: list[Sequence[Any]]) -> str:
+        self._widths = [
+            max([len(column)] + [len(_to_text(row[index])) for row in sample])
+            for index, column in enumerate(self._columns)
+        ]
+        self._right_aligned = [
+            any(row[index] is not None for row in sample)
+            and all(_is_number(row[index]) for row in sample if row[index] is not None)
+            for index in range(len(self._columns))
+        ]
+        return self._border("+", "+") + self._line(self._columns) + self._border("|", "+")
+
+    def _format_row(self, row: Sequence[Any]) -> str:
+        cells = [_to_text(value) for value in row]
+        return self._line(
+            [cell if len(cell) <= width else cell[: width - 1] + "…" for cell, width in zip(cells, self._widths)]
+        )
+
+    def _end(self) -> str:
+        return self._border("+", "+")
+
+
+class JsonLinesRenderer(BaseRenderer):
+    """Writes every row as a JSON object keyed by column names, one per line."""
+
+    def _format_row(self, row: Sequence[Any]) -> str:
+        return json.dumps(dict(zip(self._columns, row)), default=_json_default, ensure_ascii=False) + "\n"
+
+
+class CsvRenderer(BaseRenderer):
+    """Writes rows as CSV with a header row; dates are written in ISO format."""
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        stream: Optional[TextIO] = None,
+        chunk_size: int = RENDER_CHUNK_SIZE,
+    ) -> None:
+        super().__init__(columns=columns, stream=stream, chunk_size=chunk_size)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def _to_csv(self, values: Sequence[Any]) -> str:
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._writer.writerow([value.isoformat() if isinstance(value, date) else value for value in values])
+        return self._buffer.getvalue()
+
+    def _begin(self, sample: list[Sequence[Any]]) -> str:
+        return self._to_csv(self._columns)
+
+    def _format_row(self, row: Sequence[Any]) -> str:
+        return self._to_csv(row)
+
+
+RENDERERS: dict[str, type[BaseRenderer]] = {
+    "table": TableRenderer,
+    "jsonl": JsonLinesRenderer,
+    "csv": CsvRenderer,
+}
+
+
+def create_renderer(output_format: str, columns: Sequence[str], stream: Optional[TextIO] = None) -> BaseRenderer:
+    """Creates renderer of the entered format: 'table', 'jsonl' or 'csv'."""
+
+    if output_format not in RENDERERS:
+        raise ValueError(f"Unknown output format '{output_format}', expected one of: {', '.join(RENDERERS)}.")
+    return RENDERERS[output_format](columns=columns, stream=stream)
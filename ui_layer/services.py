@@ -1,8 +1,22 @@
-from typing import Any, Callable
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, TypeVar
 
 from errors import IncorrectUserInputError
 from validators import validate_user_choice
 
+T = TypeVar("T")
+
+DISPLAY_PAGE_SIZE = 500
+BROWSE_PAGE_SIZE = 20
+
+
+def iter_pages(rows: Iterable[T], page_size: int = DISPLAY_PAGE_SIZE) -> Iterator[list[T]]:
+    """Splits rows into lists of page_size elements without reading the whole iterable."""
+
+    iterator = iter(rows)
+    while page := list(islice(iterator, page_size)):
+        yield page
+
 
 class BaseMenu:
     """Contains methods and logic for creating and displaying a console menu."""
@@ -92,3 +106,49 @@ class InnerMenu(BaseMenu):
             menu += f"*   {len(self._menu_objects) + 1} - Return to the previous menu\n"
         menu += "-" * first_string_length
         return menu
+
+
+class PagedView:
+    """Displays records page by page with next/previous navigation.
+    :param load_page: callable returning records after `after_id` or before `before_id`
+    :type load_page: Callable
+    :param render: callable printing a page of records
+    :type render: Callable
+    :param empty_text: text displayed when there are no records
+    :type empty_text: str
+    """
+
+    def __init__(
+        self,
+        load_page: Callable[..., list],
+        render: Callable[[list], None],
+        empty_text: str = "There aren't any records in the database.",
+    ) -> None:
+        self._load_page = load_page
+        self._render = render
+        self._empty_text = empty_text
+
+    def __call__(self) -> None:
+        page = self._load_page(after_id=None, before_id=None)
+        if not page:
+            print(self._empty_text)
+            return
+        while True:
+            self._render(page)
+            user_choice = input("n - next page, p - previous page, r - return to the previous menu: ").strip().lower()
+            if user_choice == "n":
+                next_page = self._load_page(after_id=page[-1].id, before_id=None)
+                if next_page:
+                    page = next_page
+                else:
+                    print("This is the last page.")
+            elif user_choice == "p":
+                previous_page = self._load_page(after_id=None, before_id=page[0].id)
+                if previous_page:
+                    page = previous_page
+                else:
+                    print("This is the first page.")
+            elif user_choice == "r":
+                break
+            else:
+                print("Choice must be one of 'n', 'p' or 'r'.")
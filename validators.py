@@ -1,5 +1,10 @@
+from typing import Any, Callable
+
 from errors import IncorrectUserInputError, ValidationError
 
+# Ids are INT columns, larger numbers are rejected before they reach the database.
+MAX_ID = 2147483647
+
 
 def validate_user_choice(user_choice: str) -> None:
     if not user_choice.isdigit():
@@ -7,12 +12,26 @@ def validate_user_choice(user_choice: str) -> None:
 
 
 def validate_entered_id(entered_id: str) -> None:
-    if not entered_id.isdigit():
+    if not entered_id.isdecimal():
         raise ValidationError("[ERROR]: Entered id must be digit!")
+    if int(entered_id) > MAX_ID:
+        raise ValidationError(f"[ERROR]: Entered id must not be greater than {MAX_ID}!")
 
 
-def validate_active_contract_id(entered_id: str, contracts_ids_list: list) -> None:
+def validate_active_contract_id(entered_id: str, is_active: Callable[[int], bool]) -> None:
     validate_entered_id(entered_id=entered_id)
-    tuple_id = (int(entered_id),)
-    if tuple_id not in contracts_ids_list:
+    if not is_active(int(entered_id)):
         raise ValidationError("[ERROR]: Selected contract must be active.")
+
+
+def validate_search_text(entered_text: str) -> None:
+    if not entered_text.strip():
+        raise ValidationError("[ERROR]: Search text must not be empty!")
+
+
+def validate_ids_list(entered_ids: Any) -> None:
+    if not isinstance(entered_ids, list) or not all(
+        isinstance(entered_id, int) and not isinstance(entered_id, bool) and 0 < entered_id <= MAX_ID
+        for entered_id in entered_ids
+    ):
+        raise ValidationError(f"[ERROR]: Ids must be a list of positive integers not greater than {MAX_ID}!")